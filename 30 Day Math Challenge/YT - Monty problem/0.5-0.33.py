@@ -1,5 +1,8 @@
 from manim import *
 
+from montyhall import simulate
+from convergence import ConvergenceChart
+
 class FractionArrow(Scene):
     def construct(self):
 
@@ -18,6 +21,18 @@ class FractionArrow(Scene):
 
         self.wait(2)
 
+        # A million games: staying wins a third of them, switching two thirds
+        chart = ConvergenceChart(simulate(1_000_000, seed=0)).scale(0.8).to_edge(DOWN)
+        self.play(VGroup(text_1_2, arrow, text_1_3).animate.shift(UP * 2))
+        self.play(
+            text_1_2.animate.set_color(BLUE),
+            text_1_3.animate.set_color(YELLOW),
+            FadeIn(chart.background)
+        )
+        self.play(Create(chart.curves), run_time=4)
+
+        self.wait(2)
+
 if __name__ == "__main__":
     from manim import config
     config.media_width = "100%"
@@ -1,5 +1,8 @@
 from manim import *
 
+from montyhall import simulate
+from convergence import ConvergenceChart
+
 class FiftyFifty(Scene):
     def construct(self):
         fifty_fifty_text = Text("50-50", font_size=144)
@@ -18,6 +21,13 @@ class FiftyFifty(Scene):
         )
         self.wait(2)
 
+        # A million games pull the two strategies away from 50-50
+        chart = ConvergenceChart(simulate(1_000_000, seed=0), reference=0.5).scale(0.8).to_edge(DOWN)
+        self.play(fifty_fifty_text.animate.scale(0.3).to_corner(UL))
+        self.play(FadeIn(chart.background))
+        self.play(Create(chart.curves), run_time=4)
+        self.wait(2)
+
 if __name__ == "__main__":
     from manim import config
     config.media_width = "100%"
@@ -1,5 +1,8 @@
 from manim import *
 
+from montyhall import simulate
+from convergence import ConvergenceChart
+
 class MathNotLuck(Scene):
     def construct(self):
         
@@ -16,6 +19,11 @@ class MathNotLuck(Scene):
             run_time=2
         )
         
+        # Ten million games: the luck averages out, the 1/3 and 2/3 remain
+        chart = ConvergenceChart(simulate(10_000_000, seed=0)).scale(0.8).to_edge(DOWN)
+        self.play(FadeIn(chart.background))
+        self.play(Create(chart.curves), run_time=4)
+        
         self.wait(2)
 
 if __name__ == "__main__":
@@ -0,0 +1,53 @@
+from manim import *
+import numpy as np
+
+from montyhall import exact_rates
+
+
+class ConvergenceChart(VGroup):
+    """Running win rates of a montyhall.simulate result against the number of games.
+
+    Games are on a log axis (10^0 to 10^k), so every order of magnitude gets
+    the same width; dashed lines mark the exact rates the curves settle on.
+    `reference` adds one more dashed line, e.g. the 0.5 of a naive guess.
+    Show `background` (axes, labels and dashed lines) first, then `Create`
+    the `curves` to draw them left to right as more games are played.
+    """
+
+    def __init__(self, result, x_length=10, y_length=3, stay_color=BLUE, switch_color=YELLOW, reference=None, **kwargs):
+        super().__init__(**kwargs)
+        decades = max(1, int(np.ceil(np.log10(result.trials[-1]))))
+        self.axes = Axes(
+            x_range=[0, decades, 1],
+            y_range=[0, 1, 0.25],
+            x_length=x_length,
+            y_length=y_length,
+            tips=False,
+            y_axis_config={"numbers_to_include": [0, 0.5, 1], "font_size": 24},
+        )
+        x_labels = VGroup(*[
+            MathTex(f"10^{{{k}}}", font_size=24).next_to(self.axes.c2p(k, 0), DOWN)
+            for k in range(0, decades + 1, max(1, decades // 4))
+        ])
+        x_title = Text("games played", font_size=24).next_to(x_labels, DOWN, buff=0.15)
+
+        x = np.log10(result.trials)
+        self.stay_curve = self.rate_curve(x, result.stay, stay_color)
+        self.switch_curve = self.rate_curve(x, result.switch, switch_color)
+
+        self.targets = VGroup(*[
+            DashedLine(self.axes.c2p(0, rate), self.axes.c2p(decades, rate), color=color, stroke_opacity=0.6)
+            for rate, color in zip(exact_rates(result.n_doors, result.opened, result.host), (stay_color, switch_color))
+        ])
+        if reference is not None:
+            self.targets.add(DashedLine(self.axes.c2p(0, reference), self.axes.c2p(decades, reference), color=GREY))
+
+        self.background = VGroup(self.axes, x_labels, x_title, self.targets)
+        self.curves = VGroup(self.stay_curve, self.switch_curve)
+        self.add(self.background, self.curves)
+
+    def rate_curve(self, x, rate, color):
+        finite = np.isfinite(rate)
+        curve = VMobject(stroke_color=color, stroke_width=3)
+        curve.set_points_as_corners(self.axes.c2p(x[finite], rate[finite]).T)
+        return curve
@@ -0,0 +1,132 @@
+"""Vectorized Monte Carlo Monty Hall: millions of games as boolean arrays.
+
+A game has `n_doors` doors, one car. The player picks a door, the host opens
+`opened` of the others, and a switching player moves to one of the doors
+still closed, chosen at random. Host strategies:
+
+    standard   knows where the car is and only opens goat doors
+    ignorant   opens doors at random; games where he reveals the car are
+               thrown out (only games he could have offered count)
+    evil       only offers the switch when the first pick is the car,
+               otherwise the player keeps their door
+
+Every door choice is uniform and the host's choices are random among the
+doors allowed to him, so all that matters about a game is a few equalities:
+is the first pick the car, did the host's random subset hit the car, is the
+switching player's random door the car. Each is one integer draw per game,
+made for a whole chunk of games at once.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+HOSTS = ("standard", "ignorant", "evil")
+
+# Running win rates for both players at the checkpoints `trials` (games
+# played so far); `games` counts the games that counted, which is fewer
+# than `trials` only for the ignorant host
+MontyResult = namedtuple("MontyResult", ["trials", "games", "stay", "switch", "n_doors", "opened", "host"])
+
+CHUNK_SIZE = 1 << 22
+
+
+def door_dtype(n):
+    return np.uint8 if n <= 1 << 8 else np.uint16 if n <= 1 << 16 else np.uint32
+
+
+def check_game(n_doors, opened, host):
+    opened = n_doors - 2 if opened is None else opened
+    if host not in HOSTS:
+        raise ValueError(f"unknown host {host!r}, expected one of {HOSTS}")
+    if n_doors < 3 or not 1 <= opened <= n_doors - 2:
+        raise ValueError("need at least 3 doors and 1 to n_doors - 2 doors opened")
+    return opened
+
+
+def play(rng, size, n_doors=3, opened=None, host="standard"):
+    """Play `size` games. Returns (counted, stay_wins, switch_wins) boolean arrays.
+
+    `counted` is None when every game counts.
+    """
+    opened = check_game(n_doors, opened, host)
+    dtype = door_dtype(n_doors)
+    car = rng.integers(n_doors, size=size, dtype=dtype)
+    pick = rng.integers(n_doors, size=size, dtype=dtype)
+    stay = car == pick
+
+    # Doors the switching player can move to, and whether the car is among them
+    remaining = n_doors - 1 - opened
+    car_remains = ~stay
+    counted = None
+    if host == "ignorant":
+        # A random subset of `opened` of the other n - 1 doors holds the car
+        # with probability opened / (n - 1) when the car is behind one of them
+        revealed = rng.integers(n_doors - 1, size=size, dtype=dtype) < opened
+        revealed &= car_remains
+        counted = ~revealed
+        car_remains &= counted
+    elif host == "evil":
+        # No offer unless the pick is the car, so the switcher keeps a goat
+        return None, stay, np.zeros(size, dtype=bool)
+
+    if remaining == 1:
+        return counted, stay, car_remains
+    choice = rng.integers(remaining, size=size, dtype=dtype) == 0
+    return counted, stay, car_remains & choice
+
+
+def checkpoints(n_trials, n_points=200, spacing="log"):
+    """Sorted unique trial counts in [1, n_trials], ending at n_trials."""
+    if spacing == "log":
+        points = np.geomspace(1, n_trials, n_points)
+    else:
+        points = np.linspace(1, n_trials, n_points)
+    points = np.unique(np.round(points).astype(np.int64))
+    points[-1] = n_trials
+    return points
+
+
+def simulate(n_trials, n_doors=3, opened=None, host="standard", n_points=200, spacing="log", seed=None, chunk_size=CHUNK_SIZE):
+    """Play `n_trials` games in chunks and record running win rates for stay and switch.
+
+    Memory is a few bytes per game in one chunk, whatever `n_trials` is.
+    Wins are only tallied between checkpoints (np.add.reduceat), never
+    cumulatively summed per game. With the ignorant host, rates before the
+    first counted game are nan.
+    """
+    opened = check_game(n_doors, opened, host)
+    rng = np.random.default_rng(seed)
+    marks = checkpoints(n_trials, n_points, spacing)
+    tallies = np.zeros((3, len(marks)), dtype=np.int64)
+
+    done = 0
+    while done < n_trials:
+        size = min(chunk_size, n_trials - done)
+        counted, stay, switch = play(rng, size, n_doors, opened, host)
+        outcomes = [np.ones(size, dtype=bool) if counted is None else counted, stay, switch]
+
+        # Checkpoints falling in this chunk cut it into segments; segment j is
+        # tallied at checkpoint lo + j, and a tail after the last one at the next
+        lo, hi = np.searchsorted(marks, [done, done + size], side="right")
+        ends = marks[lo:hi] - done
+        bounds = np.concatenate([[0], ends[ends < size]])
+        for tally, outcome in zip(tallies, outcomes):
+            counts = np.add.reduceat(outcome.view(np.uint8), bounds, dtype=np.int64)
+            tally[lo:lo + len(counts)] += counts
+        done += size
+
+    games, stay_wins, switch_wins = np.cumsum(tallies, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return MontyResult(marks, games, stay_wins / games, switch_wins / games, n_doors, opened, host)
+
+
+def exact_rates(n_doors=3, opened=None, host="standard"):
+    """The win probabilities (stay, switch) the simulation converges to."""
+    opened = check_game(n_doors, opened, host)
+    remaining = n_doors - 1 - opened
+    if host == "evil":
+        return 1 / n_doors, 0.0
+    if host == "ignorant":
+        # Given the car was not revealed, all unopened doors are equally likely
+        return 1 / (1 + remaining), 1 / (1 + remaining)
+    return 1 / n_doors, (n_doors - 1) / n_doors / remaining
@@ -0,0 +1,81 @@
+import numpy as np
+from collections import namedtuple
+
+STRATEGIES = ["epsilon_greedy", "ucb", "thompson"]
+
+BanditResult = namedtuple(
+    "BanditResult",
+    [
+        "mean_reward",      # (n_steps,) reward per step, averaged over runs
+        "mean_regret",      # (n_steps,) cumulative expected regret, averaged over runs
+        "optimal_rate",     # (n_steps,) fraction of runs pulling the best arm
+        "mean_estimates",   # (n_steps, n_arms) estimated arm values, averaged over runs
+        "arm_counts",       # (n_runs, n_arms) pulls of each arm by the end
+        "example",          # BanditTrace of run 0, for step-by-step animation
+    ],
+)
+
+BanditTrace = namedtuple("BanditTrace", ["actions", "rewards", "estimates"])
+
+
+def simulate_bandits(probs, n_steps, n_runs=2000, strategy="epsilon_greedy", epsilon=0.1, c=np.sqrt(2),
+                     seed=None):
+    """Run `n_runs` independent agents on the same Bernoulli bandit.
+
+    `probs` are the arms' true reward probabilities. Every step all runs
+    choose and pull an arm at once, so a step costs a few (n_runs, n_arms)
+    array operations whatever the number of runs. Strategies:
+      * "epsilon_greedy": a random arm with probability `epsilon`, otherwise
+        the best sample-average estimate,
+      * "ucb": UCB1, the estimate plus `c * sqrt(ln t / n)`, untried arms first,
+      * "thompson": a draw from each arm's Beta(1 + wins, 1 + losses) posterior.
+    Ties between equal scores are broken at random.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"unknown strategy {strategy!r}, expected one of {STRATEGIES}")
+    rng = np.random.default_rng(seed)
+    probs = np.asarray(probs, dtype=float)
+    n_arms = len(probs)
+    best = probs.max()
+
+    estimates = np.zeros((n_runs, n_arms))
+    counts = np.zeros((n_runs, n_arms))
+    wins = np.zeros((n_runs, n_arms))
+    runs = np.arange(n_runs)
+
+    mean_reward = np.empty(n_steps)
+    step_regret = np.empty(n_steps)
+    optimal_rate = np.empty(n_steps)
+    mean_estimates = np.empty((n_steps, n_arms))
+    example = BanditTrace(
+        np.empty(n_steps, dtype=np.int64), np.empty(n_steps, dtype=np.int64), np.empty((n_steps, n_arms))
+    )
+
+    for t in range(n_steps):
+        if strategy == "epsilon_greedy":
+            scores = estimates.copy()
+        elif strategy == "ucb":
+            bonus = c * np.sqrt(np.log(t + 1) / np.maximum(counts, 1))
+            scores = np.where(counts > 0, estimates + bonus, np.inf)
+        else:
+            scores = rng.beta(1 + wins, 1 + counts - wins)
+
+        actions = np.argmax(scores + rng.random((n_runs, n_arms)) * 1e-9, axis=1)
+        if strategy == "epsilon_greedy":
+            explore = rng.random(n_runs) < epsilon
+            actions = np.where(explore, rng.integers(0, n_arms, n_runs), actions)
+
+        rewards = (rng.random(n_runs) < probs[actions]).astype(float)
+        counts[runs, actions] += 1
+        wins[runs, actions] += rewards
+        estimates[runs, actions] += (rewards - estimates[runs, actions]) / counts[runs, actions]
+
+        mean_reward[t] = rewards.mean()
+        step_regret[t] = best - probs[actions].mean()
+        optimal_rate[t] = (probs[actions] == best).mean()
+        mean_estimates[t] = estimates.mean(axis=0)
+        example.actions[t] = actions[0]
+        example.rewards[t] = rewards[0]
+        example.estimates[t] = estimates[0]
+
+    return BanditResult(mean_reward, np.cumsum(step_regret), optimal_rate, mean_estimates, counts, example)
@@ -1,5 +1,10 @@
 from manim import *
 import numpy as np
+from pathlib import Path
+from gridenv import GridWorldEnv
+from trajlog import cached_rollout
+from replay import replay
+from valueiter import policy_evaluation, display_values
 
 class OpeningHook(Scene):
     def construct(self):
@@ -101,17 +106,22 @@ class GridWorldIntro(Scene):
             )
             grid_lines.add(line)
         
+        # Environment behind the grid: goal in the top right, penalty on the bottom row
+        goal_cell, penalty_cell = (0, 3), (3, 2)
+        env = GridWorldEnv(grid_size, rewards={goal_cell: 10, penalty_cell: -5}, terminals=[goal_cell])
+        state = env.start_state
+        
         # Agent (blue dot)
         agent = Dot(color=BLUE, radius=0.15)
-        agent.move_to([-grid_size*cell_size/2 + cell_size/2, -grid_size*cell_size/2 + cell_size/2, 0])
+        agent.move_to(env.to_points(state, cell_size))
         
         # Reward squares
         goal_square = Square(side_length=cell_size*0.8, color=GREEN, fill_opacity=0.7)
-        goal_square.move_to([grid_size*cell_size/2 - cell_size/2, grid_size*cell_size/2 - cell_size/2, 0])
+        goal_square.move_to(env.to_points(env.state(*goal_cell), cell_size))
         goal_text = Text("+10", color=WHITE, font_size=20).move_to(goal_square.get_center())
         
         penalty_square = Square(side_length=cell_size*0.8, color=RED, fill_opacity=0.7)
-        penalty_square.move_to([cell_size/2, -grid_size*cell_size/2 + cell_size/2, 0])
+        penalty_square.move_to(env.to_points(env.state(*penalty_cell), cell_size))
         penalty_text = Text("-5", color=WHITE, font_size=20).move_to(penalty_square.get_center())
         
         # Build scene
@@ -128,22 +138,21 @@ class GridWorldIntro(Scene):
         directions = [UP, DOWN, LEFT, RIGHT]
         colors = [YELLOW, YELLOW, YELLOW, YELLOW]
         
-        for direction, color in zip(directions, colors):
-            if self.is_valid_move(agent.get_center(), direction, cell_size, grid_size):
-                arrow = Arrow(
-                    start=agent.get_center(),
-                    end=agent.get_center() + direction * cell_size * 0.6,
-                    color=color,
-                    stroke_width=3,
-                    max_tip_length_to_length_ratio=0.3
-                )
-                arrows.add(arrow)
+        for action in env.valid_actions(state):
+            arrow = Arrow(
+                start=agent.get_center(),
+                end=agent.get_center() + directions[action] * cell_size * 0.6,
+                color=colors[action],
+                stroke_width=3,
+                max_tip_length_to_length_ratio=0.3
+            )
+            arrows.add(arrow)
         
         self.play(Create(arrows), run_time=2)
         self.wait(2)
         
-        # Show agent movement
-        path = [RIGHT, UP, UP, RIGHT]
+        # Show agent movement: right, up, up, right
+        path = [3, 0, 0, 3]
         total_reward = 0
         
         reward_tracker = DecimalNumber(0, color=WHITE, num_decimal_places=0)
@@ -153,17 +162,17 @@ class GridWorldIntro(Scene):
         
         self.play(Write(reward_display))
         
-        for move in path:
+        for step, action in enumerate(path):
             self.play(FadeOut(arrows), run_time=0.5)
-            new_pos = agent.get_center() + move * cell_size
+            state, reward, done = env.step(state, action)
+            new_pos = env.to_points(state, cell_size)
+            total_reward += reward
             
-            # Check if hitting reward/penalty
-            if np.allclose(new_pos, goal_square.get_center(), atol=0.1):
-                total_reward += 10
-                reward_popup = Text("+10", color=GREEN, font_size=32)
-            elif np.allclose(new_pos, penalty_square.get_center(), atol=0.1):
-                total_reward -= 5
-                reward_popup = Text("-5", color=RED, font_size=32)
+            # Reward/penalty from the cell we landed on
+            if reward > 0:
+                reward_popup = Text(f"{reward:+g}", color=GREEN, font_size=32)
+            elif reward < 0:
+                reward_popup = Text(f"{reward:+g}", color=RED, font_size=32)
             else:
                 reward_popup = Text("0", color=GRAY, font_size=24)
             
@@ -179,28 +188,20 @@ class GridWorldIntro(Scene):
             
             # Show new possible moves
             arrows = VGroup()
-            for direction, color in zip(directions, colors):
-                if self.is_valid_move(agent.get_center(), direction, cell_size, grid_size):
-                    arrow = Arrow(
-                        start=agent.get_center(),
-                        end=agent.get_center() + direction * cell_size * 0.6,
-                        color=color,
-                        stroke_width=3,
-                        max_tip_length_to_length_ratio=0.3
-                    )
-                    arrows.add(arrow)
+            for next_action in env.valid_actions(state):
+                arrow = Arrow(
+                    start=agent.get_center(),
+                    end=agent.get_center() + directions[next_action] * cell_size * 0.6,
+                    color=colors[next_action],
+                    stroke_width=3,
+                    max_tip_length_to_length_ratio=0.3
+                )
+                arrows.add(arrow)
             
-            if len(path) > 1:  # Don't show arrows on last move
+            if step < len(path) - 1:  # Don't show arrows on last move
                 self.play(Create(arrows), run_time=0.5)
-                path = path[1:]
         
         self.wait(3)
-    
-    def is_valid_move(self, pos, direction, cell_size, grid_size):
-        new_pos = pos + direction * cell_size
-        boundary = grid_size * cell_size / 2
-        return (-boundary + cell_size/2 <= new_pos[0] <= boundary - cell_size/2 and
-                -boundary + cell_size/2 <= new_pos[1] <= boundary - cell_size/2)
 
 class StatesAndActions(Scene):
     def construct(self):
@@ -396,6 +397,15 @@ class TrajectorySequence(Scene):
     def construct(self):
         self.camera.background_color = "#0f0f23"
         
+        # A million recorded steps of random exploration, on the GridWorld layout
+        env = GridWorldEnv(4, rewards={(3, 3): 1}, obstacles=[(1, 2)], terminals=[(3, 3)], start=(0, 0))
+        log = cached_rollout(env, Path(config.media_dir) / "trajectories", "gridworld_random", 10_000, n_envs=100, seed=0)
+        
+        # Cut the shortest episode out of it
+        bounds = log.episode_bounds()
+        episode = log.episode(np.argmin(bounds[:, 1] - bounds[:, 0]))
+        arrows = [r"\uparrow", r"\downarrow", r"\leftarrow", r"\rightarrow"]
+        
         # Timeline visualization
         timeline = Line(LEFT*5, RIGHT*5, color=WHITE, stroke_width=3)
         timeline.move_to(DOWN*1)
@@ -419,18 +429,22 @@ class TrajectorySequence(Scene):
             # State
             state = Circle(radius=0.25, color=BLUE, fill_opacity=0.5)
             state_label = MathTex(f"s_{i}", color=WHITE, font_size=16)
-            state_group = VGroup(state, state_label).move_to(x_pos + UP*1.5)
+            row, col = env.cell(episode.states[i])
+            cell_label = Text(f"({row},{col})", color=GRAY, font_size=12).next_to(state, UP, buff=0.1)
+            state_group = VGroup(state, state_label, cell_label).move_to(x_pos + UP*1.5)
             
             # Action (if not last)
             if i < 4:
                 action = Square(side_length=0.4, color=GREEN, fill_opacity=0.5)
                 action_label = MathTex(f"a_{i}", color=WHITE, font_size=16)
-                action_group = VGroup(action, action_label).move_to(x_pos + RIGHT*1 + UP*0.5)
+                action_value = MathTex(arrows[episode.actions[i]], color=GREEN, font_size=20).next_to(action, DOWN, buff=0.1)
+                action_group = VGroup(action, action_label, action_value).move_to(x_pos + RIGHT*1 + UP*0.5)
                 
                 # Reward
                 reward = Circle(radius=0.2, color=YELLOW, fill_opacity=0.5)
                 reward_label = MathTex(f"r_{i+1}", color=WHITE, font_size=14)
-                reward_group = VGroup(reward, reward_label).move_to(x_pos + RIGHT*2 + UP*1.5)
+                reward_value = Text(f"{episode.rewards[i]:g}", color=YELLOW, font_size=12).next_to(reward, UP, buff=0.1)
+                reward_group = VGroup(reward, reward_label, reward_value).move_to(x_pos + RIGHT*2 + UP*1.5)
                 
                 # Arrows
                 state_action_arrow = Arrow(
@@ -488,6 +502,21 @@ class TrajectorySequence(Scene):
         
         self.play(Write(math_sequence), run_time=3)
         self.wait(3)
+        
+        # Replay the whole episode on the grid
+        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        
+        grid = VGroup(*[
+            Square(side_length=1, color=WHITE, stroke_width=2).move_to(point)
+            for point in env.to_points(np.arange(env.n_states))
+        ])
+        goal = Square(side_length=1, color=GREEN, fill_opacity=0.7).move_to(env.to_points(env.state(3, 3)))
+        obstacle = Square(side_length=1, color=RED, fill_opacity=0.7).move_to(env.to_points(env.state(1, 2)))
+        agent = Circle(radius=0.3, color=ORANGE, fill_opacity=0.9).move_to(env.to_points(episode.states[0]))
+        
+        self.play(Create(grid), FadeIn(goal), FadeIn(obstacle), FadeIn(agent))
+        self.play(replay(agent, env, episode, step_time=0.4))
+        self.wait(2)
 
 class PolicyVisualization(Scene):
     def construct(self):
@@ -693,25 +722,17 @@ class ValueFunctionReveal(Scene):
         states = VGroup()
         state_positions = []
         
-        for i in range(grid_size):
-            for j in range(grid_size):
-                x = (i - grid_size//2 + 0.5) * cell_size
-                y = (j - grid_size//2 + 0.5) * cell_size
-                
-                state_circle = Circle(radius=0.3, color=BLUE, fill_opacity=0.3)
-                state_circle.move_to([x, y, 0])
-                states.add(state_circle)
-                state_positions.append([x, y, 0])
+        env = GridWorldEnv(grid_size, rewards={(0, grid_size - 1): 10}, terminals=[(0, grid_size - 1)])
+        for position in env.to_points(np.arange(env.n_states), cell_size):
+            state_circle = Circle(radius=0.3, color=BLUE, fill_opacity=0.3)
+            state_circle.move_to(position)
+            states.add(state_circle)
+            state_positions.append(position)
         
         self.play(Create(states), run_time=2)
         
-        # Define value function values (example)
-        values = [
-            [1.0, 2.5, 4.0, 5.5],
-            [0.5, 1.8, 3.2, 4.8],
-            [0.2, 1.2, 2.5, 4.0],
-            [0.0, 0.8, 1.5, 2.8]
-        ]
+        # Value of the uniformly random policy, goal in the top-right corner
+        values = display_values(env, policy_evaluation(env, gamma=0.9).values)
         
         # Value function equation
         value_eq = MathTex(
@@ -724,13 +745,9 @@ class ValueFunctionReveal(Scene):
         
         # Show value function as heat map
         value_objects = VGroup()
-        max_value = max(max(row) for row in values)
+        max_value = values.max()
         
-        for i, state in enumerate(states):
-            row = i // grid_size
-            col = i % grid_size
-            value = values[row][col]
-            
+        for state, value in zip(states, values):
             # Color intensity based on value
             intensity = value / max_value
             color = interpolate_color(BLUE, RED, intensity)
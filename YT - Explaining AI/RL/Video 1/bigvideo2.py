@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from gridenv import GridWorldEnv
+from valueiter import value_iteration
 
 class ChildToMathematicalAgent(Scene):
     def construct(self):
@@ -108,18 +110,19 @@ class RandomMovementWithQuestions(Scene):
             )
             grid_lines.add(line)
         
-        # Agent
+        # Agent, starting in the bottom left cell
+        env = GridWorldEnv(grid_size)
         agent = Dot(color=BLUE, radius=0.15)
-        start_pos = [-grid_size*cell_size/2 + cell_size/2, -grid_size*cell_size/2 + cell_size/2, 0]
-        agent.move_to(start_pos)
+        agent.move_to(env.to_points(env.start_state, cell_size))
         
         self.add(grid_lines, agent)
         
-        # Random movements with question marks
+        # Random movements with question marks, from a uniformly random rollout
         directions = [UP, DOWN, LEFT, RIGHT]
         question_marks = VGroup()
+        trajectory = env.rollout(8)  # 8 random moves
         
-        for i in range(8):  # 8 random moves
+        for state, action in zip(trajectory.states[:, 0], trajectory.actions[:, 0]):
             # Show question mark before each move
             question = Text("?", color=YELLOW, font_size=48)
             question.move_to(agent.get_center() + UP*0.8)
@@ -127,13 +130,11 @@ class RandomMovementWithQuestions(Scene):
             self.play(FadeIn(question), run_time=0.5)
             
             # Random direction
-            direction = np.random.choice(directions)
-            new_pos = agent.get_center() + direction * cell_size
+            direction = directions[action]
+            new_pos = env.to_points(env.next_state[state, action], cell_size)
             
             # Check boundaries
-            if (-grid_size*cell_size/2 + cell_size/2 <= new_pos[0] <= grid_size*cell_size/2 - cell_size/2 and
-                -grid_size*cell_size/2 + cell_size/2 <= new_pos[1] <= grid_size*cell_size/2 - cell_size/2):
-                
+            if not env.blocked[state, action]:
                 self.play(
                     agent.animate.move_to(new_pos),
                     question.animate.set_opacity(0.3),
@@ -422,20 +423,19 @@ class ValuePropagation(Scene):
         grid_size = 5
         cell_size = 1.2
         
+        center = (grid_size // 2, grid_size // 2)
+        env = GridWorldEnv(grid_size, rewards={center: 10}, terminals=[center])
+        
         states = VGroup()
-        for i in range(grid_size):
-            for j in range(grid_size):
-                x = (i - grid_size//2) * cell_size
-                y = (j - grid_size//2) * cell_size
-                
-                state = Circle(radius=0.2, color=BLUE, fill_opacity=0.3)
-                state.move_to([x, y, 0])
-                states.add(state)
+        for position in env.to_points(np.arange(env.n_states), cell_size):
+            state = Circle(radius=0.2, color=BLUE, fill_opacity=0.3)
+            state.move_to(position)
+            states.add(state)
         
         self.play(Create(states), run_time=2)
         
         # Create reward source
-        reward_state = states[12]  # Center state
+        reward_state = states[env.state(*center)]
         reward_state.set_color(GOLD).set_fill(opacity=0.9)
         reward_text = Text("+10", color=WHITE, font_size=16).move_to(reward_state.get_center())
         
@@ -445,26 +445,20 @@ class ValuePropagation(Scene):
             run_time=1
         )
         
-        # Animate value propagation in waves
-        for wave in range(3):
-            wave_states = []
-            
-            # Select states at increasing distances from center
-            center_i, center_j = 2, 2
-            for i in range(grid_size):
-                for j in range(grid_size):
-                    distance = abs(i - center_i) + abs(j - center_j)
-                    if distance == wave + 1:
-                        wave_states.append(states[i * grid_size + j])
+        # Animate value propagation: one wave per value-iteration sweep
+        history = value_iteration(env, gamma=0.8, record_history=True).history
+        for sweep in range(1, len(history)):
+            changed = np.flatnonzero(history[sweep] != history[sweep - 1])
+            if len(changed) == 0:
+                continue
             
-            # Animate this wave
             wave_animations = []
-            for state in wave_states:
-                intensity = 1.0 / (wave + 2)
+            for index in changed:
+                intensity = 0.5 * history[sweep][index] / 10
                 color = interpolate_color(BLUE, GOLD, intensity)
                 new_circle = Circle(radius=0.22, color=color, fill_opacity=0.7)
-                new_circle.move_to(state.get_center())
-                wave_animations.append(Transform(state, new_circle))
+                new_circle.move_to(states[index].get_center())
+                wave_animations.append(Transform(states[index], new_circle))
             
             self.play(*wave_animations, run_time=1.5)
             self.wait(0.5)
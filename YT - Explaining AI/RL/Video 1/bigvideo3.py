@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from gridenv import GridWorldEnv
+from valueiter import value_iteration, display_values
 
 class ConceptualZoomOut(Scene):
     def construct(self):
@@ -332,30 +334,19 @@ class StateValueHeatmap(Scene):
         grid_size = 6
         cell_size = 0.8
         
-        # Define a value function (distance from goal)
-        goal_pos = (4, 4)  # Goal at top-right
-        values = []
-        
-        for i in range(grid_size):
-            row = []
-            for j in range(grid_size):
-                # Manhattan distance from goal, inverted
-                distance = abs(i - goal_pos[0]) + abs(j - goal_pos[1])
-                value = max(0, 10 - distance)
-                row.append(value)
-            values.append(row)
+        # Solve for the value function with value iteration, goal at top-right
+        goal_cell = (1, 4)
+        env = GridWorldEnv(grid_size, rewards={goal_cell: 10}, terminals=[goal_cell])
+        solution = value_iteration(env, gamma=0.9, record_history=True)
+        sweeps = [display_values(env, values) for values in solution.history]
+        positions = env.to_points(np.arange(env.n_states), cell_size)
         
         # Normalize values for color mapping
-        max_val = max(max(row) for row in values)
+        max_val = sweeps[-1].max()
         
-        # Create heatmap
-        heatmap = VGroup()
-        for i in range(grid_size):
-            for j in range(grid_size):
-                x = (i - grid_size/2 + 0.5) * cell_size
-                y = (j - grid_size/2 + 0.5) * cell_size
-                
-                value = values[i][j]
+        def make_heatmap(values):
+            heatmap = VGroup()
+            for position, value in zip(positions, values):
                 intensity = value / max_val if max_val > 0 else 0
                 
                 # Color from blue (low) to red (high)
@@ -368,23 +359,32 @@ class StateValueHeatmap(Scene):
                     stroke_width=1,
                     stroke_color=WHITE
                 )
-                cell.move_to([x, y, 0])
+                cell.move_to(position)
                 
                 # Value text
-                value_text = Text(f"{value:.0f}", color=WHITE, font_size=14)
+                value_text = Text(f"{value:.1f}", color=WHITE, font_size=14)
                 value_text.move_to(cell.get_center())
                 
                 heatmap.add(cell, value_text)
+            return heatmap
         
-        # Animate heatmap building
-        self.play(FadeIn(heatmap), run_time=3)
+        # Animate heatmap building, then every sweep that changed a value
+        heatmap = make_heatmap(sweeps[0])
+        sweep_label = Text("Sweep 0", color=WHITE, font_size=20).move_to(UP*3)
+        self.play(FadeIn(heatmap), FadeIn(sweep_label), run_time=3)
+        
+        for sweep in range(1, len(sweeps)):
+            if np.array_equal(sweeps[sweep], sweeps[sweep - 1]):
+                continue
+            self.play(
+                Transform(heatmap, make_heatmap(sweeps[sweep])),
+                Transform(sweep_label, Text(f"Sweep {sweep}", color=WHITE, font_size=20).move_to(UP*3)),
+                run_time=0.6
+            )
         
         # Add goal marker
         goal_marker = Star(color=GOLD, fill_opacity=1).scale(0.3)
-        goal_x = (goal_pos[0] - grid_size/2 + 0.5) * cell_size
-        goal_y = (goal_pos[1] - grid_size/2 + 0.5) * cell_size
-        goal_marker.move_to([goal_x, goal_y, 0])
-        
+        goal_marker.move_to(env.to_points(env.state(*goal_cell), cell_size))
         self.play(FadeIn(goal_marker), run_time=1)
         
         # Add explanation
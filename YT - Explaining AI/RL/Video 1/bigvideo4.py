@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from flowfield import FlowField
+from particles import ParticleCloud
 
 class FloatingMathSymbols(Scene):
     def construct(self):
@@ -285,51 +287,21 @@ class ParticleSystem(Scene):
         self.camera.background_color = "#0f0f23"
         
         # Create a particle system representing agents exploring
-        particles = VGroup()
-        n_particles = 30
-        
-        for i in range(n_particles):
-            particle = Dot(
-                color=[BLUE, GREEN, YELLOW, RED, PURPLE][i % 5],
-                radius=0.08,
-                fill_opacity=0.7
-            )
-            # Random starting position
-            x = np.random.uniform(-6, 6)
-            y = np.random.uniform(-3, 3)
-            particle.move_to([x, y, 0])
-            particles.add(particle)
+        particles = ParticleCloud(
+            n_particles=30,
+            colors=[BLUE, GREEN, YELLOW, RED, PURPLE],
+            radius=0.08,
+            fill_opacity=0.7,
+            x_range=(-6, 6),
+            y_range=(-3, 3)
+        )
         
         self.add(particles)
         
-        # Simulate particle movement (random walk with attraction to center)
-        for frame in range(300):  # 30 seconds at 10fps
-            new_positions = []
-            
-            for particle in particles:
-                current_pos = particle.get_center()
-                
-                # Random movement
-                random_move = np.random.normal(0, 0.1, 2)
-                
-                # Slight attraction to center
-                center_attraction = -0.05 * current_pos[:2]
-                
-                # Combine movements
-                new_pos = current_pos[:2] + random_move + center_attraction
-                
-                # Boundary conditions
-                new_pos[0] = np.clip(new_pos[0], -6, 6)
-                new_pos[1] = np.clip(new_pos[1], -3, 3)
-                
-                new_positions.append([new_pos[0], new_pos[1], 0])
-            
-            # Animate to new positions
-            animations = []
-            for particle, new_pos in zip(particles, new_positions):
-                animations.append(particle.animate.move_to(new_pos))
-            
-            self.play(*animations, run_time=0.1)
+        # Simulate particle movement (random walk with attraction to center),
+        # one step every 0.1s, all particles at once in a single updater
+        particles.start_random_walk()
+        self.wait(30)
 
 class GradientFlow(Scene):
     def construct(self):
@@ -339,57 +311,29 @@ class GradientFlow(Scene):
         x_range = np.arange(-5, 6, 0.8)
         y_range = np.arange(-3, 4, 0.8)
         
-        arrows = VGroup()
-        
-        for x in x_range:
-            for y in y_range:
-                # Create a potential function (like a value function)
-                # Gradient points toward higher values
-                grad_x = -0.1 * x + 0.05 * np.sin(y)
-                grad_y = -0.1 * y + 0.05 * np.cos(x)
-                
-                # Normalize
-                magnitude = np.sqrt(grad_x**2 + grad_y**2)
-                if magnitude > 0:
-                    grad_x /= magnitude
-                    grad_y /= magnitude
-                
-                arrow = Arrow(
-                    start=[x, y, 0],
-                    end=[x + 0.3*grad_x, y + 0.3*grad_y, 0],
-                    color=interpolate_color(BLUE, RED, magnitude),
-                    stroke_width=2,
-                    max_tip_length_to_length_ratio=0.3
-                )
-                arrows.add(arrow)
+        # Create a potential function (like a value function)
+        # Gradient points toward higher values, evaluated over the whole grid at once
+        def gradient(x, y, t):
+            grad_x = -0.1 * x + 0.05 * np.sin(y + t)
+            grad_y = -0.1 * y + 0.05 * np.cos(x + t)
+            return grad_x, grad_y
+        
+        time = ValueTracker(0)
+        arrows = FlowField(
+            gradient,
+            x_range,
+            y_range,
+            time_tracker=time,
+            arrow_length=0.3,
+            stroke_width=2,
+            low_color=BLUE,
+            high_color=RED
+        )
         
         self.add(arrows)
         
         # Animate the gradient field changing over time
-        for phase in range(20):
-            new_arrows = VGroup()
-            
-            for i, (x, y) in enumerate([(x, y) for x in x_range for y in y_range]):
-                # Time-varying gradient
-                t = phase * 0.5
-                grad_x = -0.1 * x + 0.05 * np.sin(y + t)
-                grad_y = -0.1 * y + 0.05 * np.cos(x + t)
-                
-                magnitude = np.sqrt(grad_x**2 + grad_y**2)
-                if magnitude > 0:
-                    grad_x /= magnitude
-                    grad_y /= magnitude
-                
-                new_arrow = Arrow(
-                    start=[x, y, 0],
-                    end=[x + 0.3*grad_x, y + 0.3*grad_y, 0],
-                    color=interpolate_color(BLUE, RED, magnitude),
-                    stroke_width=2,
-                    max_tip_length_to_length_ratio=0.3
-                )
-                new_arrows.add(new_arrow)
-            
-            self.play(Transform(arrows, new_arrows), run_time=1)
+        self.play(time.animate.set_value(10), run_time=20, rate_func=linear)
 
 class PulsatingNetwork(Scene):
     def construct(self):
@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from bandit import STRATEGIES, simulate_bandits
 
 class ExplorationExploitation(Scene):
     def construct(self):
@@ -58,21 +59,25 @@ class ExplorationExploitation(Scene):
         
         self.play(Write(strategy_text))
         
-        # Simulate some pulls
-        pulls = [1, 0, 2, 1, 1, 3, 1]  # Which machines to pull
-        estimates = [0.0, 0.0, 0.0, 0.0]
-        counts = [0, 0, 0, 0]
+        # Simulate every strategy over many independent runs
+        n_steps, n_runs = 500, 2000
+        results = {
+            strategy: simulate_bandits(rewards, n_steps, n_runs, strategy=strategy, seed=7)
+            for strategy in STRATEGIES
+        }
         
-        for pull_idx, machine_idx in enumerate(pulls):
+        # Step through the first pulls of one epsilon-greedy run
+        example = results["epsilon_greedy"].example
+        estimates = example.estimates
+        
+        for pull_idx in range(7):
+            machine_idx = example.actions[pull_idx]
+            reward = example.rewards[pull_idx]
+            
             # Highlight chosen machine
             highlight = SurroundingRectangle(machines[machine_idx], color=YELLOW, stroke_width=4)
             self.play(Create(highlight))
             
-            # Simulate reward (random based on true probability)
-            reward = 1 if np.random.random() < rewards[machine_idx] else 0
-            counts[machine_idx] += 1
-            estimates[machine_idx] = ((estimates[machine_idx] * (counts[machine_idx] - 1)) + reward) / counts[machine_idx]
-            
             # Show reward
             reward_text = Text(f"Reward: {reward}", font_size=18, 
                              color=GREEN if reward else RED)
@@ -80,7 +85,7 @@ class ExplorationExploitation(Scene):
             self.play(Write(reward_text))
             
             # Update estimate
-            new_est_text = Text(f"Est: {estimates[machine_idx]:.2f}", 
+            new_est_text = Text(f"Est: {estimates[pull_idx][machine_idx]:.2f}", 
                               font_size=12, color=YELLOW)
             new_est_text.move_to(machines[machine_idx][3].get_center())
             
@@ -99,4 +104,39 @@ class ExplorationExploitation(Scene):
         for machine in machines:
             self.play(machine[2].animate.set_opacity(1))
         
+        self.wait(2)
+        
+        # Averaged over all runs: cumulative regret of each strategy
+        self.play(FadeOut(VGroup(bandit_title, machines, strategy_text, reveal_text)))
+        
+        y_max = 10 * np.ceil(max(result.mean_regret[-1] for result in results.values()) / 10)
+        axes = Axes(
+            x_range=[0, n_steps, 100],
+            y_range=[0, y_max, y_max / 4],
+            x_length=8,
+            y_length=4,
+            axis_config={"color": WHITE},
+            x_axis_config={"numbers_to_include": np.arange(0, n_steps + 1, 100)},
+            y_axis_config={"numbers_to_include": np.linspace(0, y_max, 5)},
+        ).shift(DOWN * 0.5)
+        axes_labels = axes.get_axis_labels(x_label="Pull", y_label="Regret")
+        runs_text = Text(f"Average of {n_runs} runs", font_size=16, color=WHITE)
+        runs_text.next_to(axes, UP)
+        
+        self.play(Create(axes), Write(axes_labels), Write(runs_text))
+        
+        legend = VGroup()
+        names = {"epsilon_greedy": "ε-greedy (ε=0.1)", "ucb": "UCB1", "thompson": "Thompson sampling"}
+        colors = {"epsilon_greedy": ORANGE, "ucb": BLUE, "thompson": GREEN}
+        steps = np.arange(1, n_steps + 1)
+        for strategy, result in results.items():
+            curve = VMobject()
+            curve.set_points_as_corners(axes.c2p(steps, result.mean_regret).T)
+            curve.set_stroke(colors[strategy], width=3)
+            legend.add(Text(names[strategy], font_size=16, color=colors[strategy]))
+            self.play(Create(curve), run_time=2)
+        
+        legend.arrange(DOWN, aligned_edge=LEFT).next_to(axes, RIGHT).shift(UP)
+        self.play(Write(legend))
+        
         self.wait(3)
\ No newline at end of file
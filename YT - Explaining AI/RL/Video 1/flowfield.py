@@ -0,0 +1,84 @@
+from manim import *
+import numpy as np
+
+
+def line_to_cubic(start, end):
+    """Straight segments as cubic Bezier control points, shape (N, 4, 3)."""
+    return start[:, np.newaxis, :] + (end - start)[:, np.newaxis, :] * np.linspace(0, 1, 4)[:, np.newaxis]
+
+
+class FlowField(VGroup):
+    """A grid of arrows for a time-varying 2D field, rewritten in place every frame.
+
+    `func(x, y, t)` gets the whole grid as arrays and returns the (u, v)
+    components as arrays. Arrows are normalized to `arrow_length` and colored
+    from `low_color` to `high_color` by the field's magnitude. Instead of one
+    Arrow per grid point, arrows are grouped into `color_bins` VMobjects, one
+    subpath per shaft and per tip, so a denser grid only means larger arrays.
+    """
+
+    def __init__(
+        self,
+        func,
+        x_values,
+        y_values,
+        time_tracker=None,
+        arrow_length=0.3,
+        tip_ratio=0.3,
+        stroke_width=2,
+        low_color=BLUE,
+        high_color=RED,
+        color_bins=16,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.func = func
+        self.time_tracker = time_tracker if time_tracker is not None else ValueTracker(0)
+        self.arrow_length = arrow_length
+        self.tip_length = tip_ratio * arrow_length
+
+        x, y = np.meshgrid(x_values, y_values, indexing="ij")
+        self.starts = np.column_stack([x.ravel(), y.ravel(), np.zeros(x.size)])
+
+        for alpha in np.linspace(0, 1, color_bins):
+            color = interpolate_color(low_color, high_color, alpha)
+            self.add(VMobject(stroke_color=color, stroke_width=stroke_width, fill_color=color, fill_opacity=1))
+
+        self.update_arrows()
+        self.add_updater(lambda mob: mob.update_arrows())
+
+    def evaluate(self, t):
+        """Field directions (N, 3) and magnitudes (N,) over the whole grid at time t."""
+        u, v = self.func(self.starts[:, 0], self.starts[:, 1], t)
+        u = np.broadcast_to(u, len(self.starts)).astype(float)
+        v = np.broadcast_to(v, len(self.starts)).astype(float)
+
+        magnitude = np.hypot(u, v)
+        scale = np.divide(1.0, magnitude, out=np.zeros_like(magnitude), where=magnitude > 0)
+        directions = np.column_stack([u * scale, v * scale, np.zeros_like(u)])
+        return directions, magnitude
+
+    def arrow_points(self, directions):
+        """Shaft plus triangular tip for every arrow, shape (N, 16, 3)."""
+        ends = self.starts + self.arrow_length * directions
+        tip_base = ends - self.tip_length * directions
+        normals = np.column_stack([-directions[:, 1], directions[:, 0], np.zeros(len(directions))])
+        half_width = 0.5 * self.tip_length * normals
+
+        left, right = tip_base + half_width, tip_base - half_width
+        return np.concatenate([
+            line_to_cubic(self.starts, tip_base),
+            line_to_cubic(left, ends),
+            line_to_cubic(ends, right),
+            line_to_cubic(right, left),
+        ], axis=1)
+
+    def update_arrows(self):
+        directions, magnitude = self.evaluate(self.time_tracker.get_value())
+        points = self.arrow_points(directions)
+
+        n_bins = len(self.submobjects)
+        bins = np.clip(np.round(magnitude * (n_bins - 1)).astype(int), 0, n_bins - 1)
+        for i, layer in enumerate(self.submobjects):
+            layer.points = points[bins == i].reshape(-1, 3)
+        return self
@@ -0,0 +1,134 @@
+import numpy as np
+from collections import namedtuple
+
+# Action order shared by every scene: up, down, left, right,
+# the same order as the scenes' `directions = [UP, DOWN, LEFT, RIGHT]`
+ACTION_NAMES = ["up", "down", "left", "right"]
+ACTION_DELTAS = np.array([[-1, 0], [1, 0], [0, -1], [0, 1]])  # (row, col) change
+
+Trajectory = namedtuple("Trajectory", ["states", "actions", "rewards", "dones"])
+
+
+class GridWorldEnv:
+    """A grid world with integer states and a precomputed transition table.
+
+    State `s = row * n_cols + col`, with row 0 at the top. Moving off the grid
+    or into an obstacle leaves the agent where it is. The reward for a step is
+    `step_reward` plus the reward of the cell entered. Terminal cells absorb:
+    every action keeps the agent there with zero reward. With `slip > 0` the
+    chosen action is replaced by a uniformly random one with that probability.
+
+    All stepping is table lookups on arrays, so `step` advances any number of
+    environments at once.
+    """
+
+    def __init__(self, n_rows, n_cols=None, rewards=None, obstacles=(), terminals=(),
+                 start=None, step_reward=0.0, slip=0.0):
+        self.n_rows = n_rows
+        self.n_cols = n_cols if n_cols is not None else n_rows
+        self.n_states = self.n_rows * self.n_cols
+        self.n_actions = len(ACTION_DELTAS)
+        self.slip = slip
+
+        self.cell_rewards = np.zeros(self.n_states)
+        for cell, reward in (rewards or {}).items():
+            self.cell_rewards[self.state(*cell)] = reward
+        self.obstacle = np.zeros(self.n_states, dtype=bool)
+        for cell in obstacles:
+            self.obstacle[self.state(*cell)] = True
+        self.terminal = np.zeros(self.n_states, dtype=bool)
+        for cell in terminals:
+            self.terminal[self.state(*cell)] = True
+        self.start_state = self.state(*start) if start is not None else self.state(self.n_rows - 1, 0)
+
+        # Deterministic tables, shape (n_states, n_actions)
+        rows, cols = np.divmod(np.arange(self.n_states), self.n_cols)
+        target_rows = rows[:, np.newaxis] + ACTION_DELTAS[:, 0]
+        target_cols = cols[:, np.newaxis] + ACTION_DELTAS[:, 1]
+        inside = (
+            (target_rows >= 0) & (target_rows < self.n_rows)
+            & (target_cols >= 0) & (target_cols < self.n_cols)
+        )
+        targets = np.where(inside, target_rows * self.n_cols + target_cols, 0)
+        self.blocked = ~inside | self.obstacle[targets]
+        self.next_state = np.where(self.blocked, np.arange(self.n_states)[:, np.newaxis], targets)
+        self.reward = step_reward + self.cell_rewards[self.next_state]
+
+        self.next_state[self.terminal] = np.flatnonzero(self.terminal)[:, np.newaxis]
+        self.reward[self.terminal] = 0.0
+        self.blocked[self.terminal] = False
+
+    def state(self, row, col):
+        return row * self.n_cols + col
+
+    def cell(self, states):
+        """(row, col) of one state or arrays of them."""
+        return np.divmod(states, self.n_cols)
+
+    def valid_actions(self, state):
+        return np.flatnonzero(~self.blocked[state])
+
+    def reset(self, n_envs=1, start=None):
+        start = self.start_state if start is None else start
+        return np.full(n_envs, start, dtype=np.int64)
+
+    def step(self, states, actions, rng=None):
+        """Advance a batch of environments. Returns next states, rewards and done flags."""
+        if self.slip:
+            rng = rng if rng is not None else np.random.default_rng()
+            slipped = rng.random(np.shape(states)) < self.slip
+            actions = np.where(slipped, rng.integers(0, self.n_actions, np.shape(states)), actions)
+        next_states = self.next_state[states, actions]
+        return next_states, self.reward[states, actions], self.terminal[next_states]
+
+    def sample_actions(self, states, policy=None, rng=None):
+        """Draw one action per state from a (n_states, n_actions) policy, uniform if None."""
+        rng = rng if rng is not None else np.random.default_rng()
+        if policy is None:
+            return rng.integers(0, self.n_actions, np.shape(states))
+        cumulative = np.cumsum(policy[states], axis=-1)
+        draws = rng.random(np.shape(states))[..., np.newaxis] * cumulative[..., -1:]
+        return np.minimum((draws >= cumulative).sum(axis=-1), self.n_actions - 1)
+
+    def rollout(self, n_steps, n_envs=1, policy=None, start=None, rng=None, reset_on_done=True):
+        """Simulate `n_envs` environments for `n_steps` steps.
+
+        Returns a Trajectory of (n_steps, n_envs) arrays: the state each step
+        started in, the action taken, the reward and whether it ended an
+        episode. Finished environments restart from `start` when
+        `reset_on_done` is set, and otherwise stay in their terminal state.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        states = self.reset(n_envs, start)
+        trajectory = Trajectory(
+            np.empty((n_steps, n_envs), dtype=np.int64),
+            np.empty((n_steps, n_envs), dtype=np.int64),
+            np.empty((n_steps, n_envs)),
+            np.empty((n_steps, n_envs), dtype=bool),
+        )
+        for t in range(n_steps):
+            actions = self.sample_actions(states, policy, rng)
+            next_states, rewards, dones = self.step(states, actions, rng)
+            trajectory.states[t] = states
+            trajectory.actions[t] = actions
+            trajectory.rewards[t] = rewards
+            trajectory.dones[t] = dones
+            states = np.where(dones, self.reset(n_envs, start), next_states) if reset_on_done else next_states
+        return trajectory
+
+    def transition_matrices(self):
+        """Dense P[a, s, s'] including slip, for small grids and checks."""
+        P = np.zeros((self.n_actions, self.n_states, self.n_states))
+        states = np.arange(self.n_states)
+        for action in range(self.n_actions):
+            P[action, states, self.next_state[:, action]] += 1 - self.slip
+            for other in range(self.n_actions):
+                P[action, states, self.next_state[:, other]] += self.slip / self.n_actions
+        return P
+
+    def to_points(self, states, cell_size=1.0, center=(0, 0, 0)):
+        """Scene coordinates of cell centers, shape (..., 3)."""
+        rows, cols = self.cell(np.asarray(states))
+        x = (cols - (self.n_cols - 1) / 2) * cell_size
+        y = ((self.n_rows - 1) / 2 - rows) * cell_size
+        return np.stack([x, y, np.zeros_like(x, dtype=float)], axis=-1) + np.asarray(center, dtype=float)
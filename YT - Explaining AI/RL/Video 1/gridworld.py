@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from gridenv import GridWorldEnv
 
 class GridWorld(Scene):
     def construct(self):
@@ -46,26 +47,27 @@ class GridWorld(Scene):
         title.to_edge(UP)
         self.play(Write(title))
         
-        # Random moves
-        positions = [
-            np.array([-1.5, 1.5, 0]),   # Start
-            np.array([-0.5, 1.5, 0]),  # Right
-            np.array([-0.5, 0.5, 0]),  # Down (blocked)
-            np.array([-0.5, 1.5, 0]),  # Back up
-            np.array([-1.5, 1.5, 0]),  # Left
-            np.array([-1.5, 0.5, 0]),  # Down
-            np.array([-0.5, 0.5, 0]),  # Right (blocked)
-            np.array([-1.5, 0.5, 0]),  # Back
-        ]
+        # Random moves: a real rollout of a uniformly random policy
+        env = GridWorldEnv(
+            grid_size,
+            rewards={(3, 3): 1},
+            obstacles=[(1, 2)],
+            terminals=[(3, 3)],
+            start=(0, 0)
+        )
+        trajectory = env.rollout(7, rng=np.random.default_rng(9), reset_on_done=False)
+        directions = [UP, DOWN, LEFT, RIGHT]
         
-        for i, pos in enumerate(positions[1:], 1):
-            if np.array_equal(pos, np.array([-0.5, 0.5, 0])):  # Blocked position
+        for state, action in zip(trajectory.states[:, 0], trajectory.actions[:, 0]):
+            pos = env.to_points(state, cell_size)
+            if env.blocked[state, action]:  # Obstacle or wall in the way
                 # Show collision
-                self.play(agent.animate.move_to(pos), run_time=0.3)
+                bump = pos + directions[action] * cell_size * 0.5
+                self.play(agent.animate.move_to(bump), run_time=0.3)
                 self.play(agent.animate.set_fill(RED), run_time=0.2)
-                self.play(agent.animate.set_fill(ORANGE), 
-                         agent.animate.move_to(positions[i-1]), run_time=0.3)
+                self.play(agent.animate.set_fill(ORANGE).move_to(pos), run_time=0.3)
             else:
-                self.play(agent.animate.move_to(pos), run_time=0.5)
+                new_pos = env.to_points(env.next_state[state, action], cell_size)
+                self.play(agent.animate.move_to(new_pos), run_time=0.5)
         
         self.wait(2)
\ No newline at end of file
@@ -0,0 +1,163 @@
+from manim import *
+import numpy as np
+import csv
+from itertools import islice
+
+
+def lttb(x, y, n_out):
+    """Largest-triangle-three-buckets: indices of `n_out` points that keep the shape of y(x).
+
+    The first and last points are always kept. The points in between are
+    split into `n_out - 2` equal buckets and from each bucket the point that
+    forms the largest triangle with the previously kept point and the mean of
+    the next bucket is kept, so peaks and dips survive the downsampling.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    sums_x = np.concatenate([[0.0], np.cumsum(x)])
+    sums_y = np.concatenate([[0.0], np.cumsum(y)])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_lo, next_hi = edges[i + 1], edges[i + 2]
+            mean_x = (sums_x[next_hi] - sums_x[next_lo]) / (next_hi - next_lo)
+            mean_y = (sums_y[next_hi] - sums_y[next_lo]) / (next_hi - next_lo)
+        else:
+            mean_x, mean_y = x[-1], y[-1]
+
+        px, py = x[previous], y[previous]
+        areas = np.abs((px - mean_x) * (y[lo:hi] - py) - (px - x[lo:hi]) * (mean_y - py))
+        previous = lo + int(np.argmax(areas))
+        selected[i + 1] = previous
+    return selected
+
+
+class RollingMean:
+    """Mean of the last `window` samples, fed in chunks.
+
+    Only the last `window - 1` samples are kept between chunks, so each new
+    sample costs O(1) however long the stream is. Until `window` samples have
+    been seen the mean is over all of them.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.tail = np.zeros(0)
+
+    def extend(self, values):
+        """Rolling means at every sample of `values`."""
+        joined = np.concatenate([self.tail, np.asarray(values, dtype=float)])
+        sums = np.concatenate([[0.0], np.cumsum(joined)])
+        ends = np.arange(len(self.tail) + 1, len(joined) + 1)
+        starts = np.maximum(ends - self.window, 0)
+        self.tail = joined[len(joined) - min(len(joined), self.window - 1):]
+        return (sums[ends] - sums[starts]) / (ends - starts)
+
+
+def read_csv_column(path, column="reward", chunk_size=65536):
+    """Stream one numeric column of a CSV log as float arrays of up to `chunk_size` rows."""
+    with open(path, newline="") as f:
+        rows = csv.DictReader(f)
+        while True:
+            chunk = np.fromiter((float(row[column]) for row in islice(rows, chunk_size)), dtype=float)
+            if len(chunk) == 0:
+                return
+            yield chunk
+
+
+class LearningCurve(VGroup):
+    """A reward curve and its rolling mean that grow as samples are streamed in.
+
+    Samples are appended with `extend`, from an array, a list or any iterable
+    of numbers (a generator or `read_csv_column`). Sample `i` is plotted at
+    x = `x_start + i * x_step` on `axes`. However many samples there are,
+    each curve is drawn from at most `max_points` points chosen with LTTB,
+    so a run of millions of episodes costs the same to draw as a short one.
+    """
+
+    def __init__(
+        self,
+        axes,
+        window=100,
+        max_points=500,
+        x_start=0.0,
+        x_step=1.0,
+        raw_color=GREEN,
+        mean_color=RED,
+        raw_width=3,
+        mean_width=4,
+        chunk_size=65536,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.axes = axes
+        self.max_points = max_points
+        self.x_start = x_start
+        self.x_step = x_step
+        self.chunk_size = chunk_size
+        self.rolling = RollingMean(window)
+
+        # Growable storage: capacity doubles, so appends are amortized O(1)
+        self.count = 0
+        self.rewards = np.zeros(1024)
+        self.means = np.zeros(1024)
+
+        self.raw_curve = VMobject(stroke_color=raw_color, stroke_width=raw_width)
+        self.mean_curve = VMobject(stroke_color=mean_color, stroke_width=mean_width)
+        self.add(self.raw_curve, self.mean_curve)
+
+    def extend(self, values):
+        if isinstance(values, (np.ndarray, list, tuple)):
+            self.append_chunk(np.asarray(values, dtype=float).ravel())
+            return self
+        iterator = iter(values)
+        while True:
+            chunk = np.fromiter(islice(iterator, self.chunk_size), dtype=float)
+            if len(chunk) == 0:
+                return self
+            self.append_chunk(chunk)
+
+    def append_chunk(self, chunk):
+        needed = self.count + len(chunk)
+        if needed > len(self.rewards):
+            capacity = max(needed, 2 * len(self.rewards))
+            self.rewards = np.resize(self.rewards, capacity)
+            self.means = np.resize(self.means, capacity)
+        self.rewards[self.count:needed] = chunk
+        self.means[self.count:needed] = self.rolling.extend(chunk)
+        self.count = needed
+
+    def curve_points(self, values, count=None):
+        count = self.count if count is None else int(np.clip(count, 0, self.count))
+        if count < 2:
+            return np.zeros((0, 3))
+        x = self.x_start + self.x_step * np.arange(count)
+        keep = lttb(x, values[:count], self.max_points)
+        return self.axes.c2p(x[keep], values[:count][keep]).T
+
+    def draw_raw(self, count=None):
+        """Redraw the raw curve through the first `count` samples (all by default)."""
+        points = self.curve_points(self.rewards, count)
+        if len(points):
+            self.raw_curve.set_points_as_corners(points)
+        else:
+            self.raw_curve.clear_points()
+        return self
+
+    def draw_mean(self, count=None):
+        points = self.curve_points(self.means, count)
+        if len(points):
+            self.mean_curve.set_points_as_corners(points)
+        else:
+            self.mean_curve.clear_points()
+        return self
+
+    def redraw(self, count=None):
+        return self.draw_raw(count).draw_mean(count)
@@ -0,0 +1,85 @@
+from manim import *
+import numpy as np
+
+
+class ParticleCloud(VGroup):
+    """Many dots whose positions live in one (N, 3) array.
+
+    Each color is a single VMobject that holds every dot of that color as its
+    own subpath, so the number of mobjects depends on the number of colors,
+    not on the number of particles. The random walk (noise plus a pull towards
+    the origin, clipped to a box) is stepped for all particles at once every
+    `step_time` seconds and eased between steps by one updater.
+    """
+
+    def __init__(
+        self,
+        n_particles=30,
+        colors=(BLUE, GREEN, YELLOW, RED, PURPLE),
+        radius=0.08,
+        fill_opacity=0.7,
+        x_range=(-6, 6),
+        y_range=(-3, 3),
+        noise=0.1,
+        attraction=0.05,
+        step_time=0.1,
+        seed=None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.rng = np.random.default_rng(seed)
+        self.noise = noise
+        self.attraction = attraction
+        self.step_time = step_time
+        self.lower = np.array([x_range[0], y_range[0]], dtype=float)
+        self.upper = np.array([x_range[1], y_range[1]], dtype=float)
+
+        # Random starting positions
+        self.positions = np.zeros((n_particles, 3))
+        self.positions[:, :2] = self.rng.uniform(self.lower, self.upper, (n_particles, 2))
+        self.start_positions = self.positions.copy()
+        self.target_positions = self.positions.copy()
+        self.elapsed = 0.0
+
+        # Outline of one dot, centered on the origin, shared by every particle
+        self.template = Dot(radius=radius).get_points().copy()
+
+        color_index = np.arange(n_particles) % len(colors)
+        self.layers = [np.flatnonzero(color_index == i) for i in range(len(colors))]
+        for color in colors:
+            self.add(VMobject(fill_color=color, fill_opacity=fill_opacity, stroke_width=0))
+
+        self.step()
+        self.update_points()
+
+    def step(self):
+        """Advance every particle by one random-walk step."""
+        current = self.target_positions[:, :2]
+        random_move = self.rng.normal(0, self.noise, current.shape)
+        center_attraction = -self.attraction * current
+        new_positions = np.clip(current + random_move + center_attraction, self.lower, self.upper)
+
+        self.start_positions = self.target_positions
+        self.target_positions = self.target_positions.copy()
+        self.target_positions[:, :2] = new_positions
+
+    def advance(self, dt):
+        self.elapsed += dt
+        while self.elapsed >= self.step_time:
+            self.elapsed -= self.step_time
+            self.step()
+
+        alpha = smooth(self.elapsed / self.step_time)
+        self.positions[:] = interpolate(self.start_positions, self.target_positions, alpha)
+        self.update_points()
+        return self
+
+    def update_points(self):
+        for layer, index in zip(self.submobjects, self.layers):
+            dots = self.positions[index, np.newaxis, :] + self.template[np.newaxis, :, :]
+            layer.points = dots.reshape(-1, 3)
+        return self
+
+    def start_random_walk(self):
+        self.add_updater(lambda mob, dt: mob.advance(dt))
+        return self
@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from gridenv import GridWorldEnv
+from reinforce import train_reinforce
 
 class PolicyGradient(Scene):
     def construct(self):
@@ -58,32 +60,41 @@ class PolicyGradient(Scene):
         equation.next_to(update_title, DOWN)
         self.play(Write(equation))
         
-        # Simulate policy improvement
-        # Let's say action "→" gets positive reward, so we increase its probability
-        new_probabilities = [0.05, 0.15, 0.2, 0.6]  # Shift probability to →
+        # Train the policy with REINFORCE on a corridor: +1 for reaching the right end
+        env = GridWorldEnv(1, 4, rewards={(0, 3): 1}, terminals=[(0, 3)], start=(0, 0))
+        batch_size = 256
+        result = train_reinforce(
+            env, 20, batch_size=batch_size, learning_rate=0.5, gamma=0.9,
+            initial_logits=np.log(probabilities), n_snapshots=6, seed=3
+        )
+        start_probabilities = result.snapshots[:, env.start_state]
         
         improvement_text = Text("After positive reward for →", font_size=16, color=GREEN)
         improvement_text.next_to(equation, DOWN)
         self.play(Write(improvement_text))
         
-        # Animate the probability change
-        for i, (old_prob, new_prob) in enumerate(zip(probabilities, new_probabilities)):
-            # Update bar height
-            new_bar = Rectangle(width=0.8, height=new_prob * 3, color=BLUE, fill_opacity=0.7)
-            new_bar.move_to(bars[i][0].get_center() + UP * (new_prob * 1.5))
-            
-            # Update probability text
-            new_prob_text = Text(f"{new_prob:.1f}", font_size=16, color=WHITE)
-            new_prob_text.next_to(new_bar, UP)
+        # Animate the probability change, one batch of updates at a time
+        for update, new_probabilities in zip(result.snapshot_updates[1:], start_probabilities[1:]):
+            animations = []
+            for i, new_prob in enumerate(new_probabilities):
+                # Update bar height
+                new_bar = Rectangle(width=0.8, height=new_prob * 3, color=BLUE, fill_opacity=0.7)
+                new_bar.move_to(bars[i][0].get_center() + UP * (new_prob * 1.5))
+                
+                # Update probability text
+                new_prob_text = Text(f"{new_prob:.2f}", font_size=16, color=WHITE)
+                new_prob_text.next_to(new_bar, UP)
+                
+                animations += [Transform(bars[i][1], new_bar), Transform(prob_texts[i], new_prob_text)]
             
-            self.play(
-                Transform(bars[i][1], new_bar),
-                Transform(prob_texts[i], new_prob_text),
-                run_time=1
-            )
+            episodes_text = Text(f"{update * batch_size} episodes", font_size=16, color=GREEN)
+            episodes_text.next_to(equation, DOWN)
+            animations.append(Transform(improvement_text, episodes_text))
+            self.play(*animations, run_time=1)
         
         # Highlight the increased probability
-        highlight = SurroundingRectangle(bars[3], color=GREEN, stroke_width=4)
+        best = np.argmax(start_probabilities[-1])
+        highlight = SurroundingRectangle(bars[best], color=GREEN, stroke_width=4)
         self.play(Create(highlight))
         
         explanation = Text("Higher probability for rewarded action", 
@@ -0,0 +1,101 @@
+import numpy as np
+from collections import namedtuple
+
+QLearningResult = namedtuple(
+    "QLearningResult",
+    ["q", "snapshots", "snapshot_episodes", "episode_returns", "episode_lengths"],
+)
+
+
+def row_max_argmax(rows):
+    """Max and argmax down the first axis of a short (n_actions, n) array.
+
+    An explicit loop over the few rows is several times faster than numpy's
+    axis-0 reductions for this shape.
+    """
+    best = rows[0].copy()
+    best_index = np.zeros(rows.shape[1], dtype=np.int64)
+    for i in range(1, len(rows)):
+        better = rows[i] > best
+        best_index[better] = i
+        np.maximum(best, rows[i], out=best)
+    return best, best_index
+
+
+def train_q_learning(env, n_episodes, alpha=0.1, gamma=0.9, epsilon=0.1, epsilon_final=None,
+                     n_envs=256, max_steps=200, n_snapshots=100, initial_q=None, seed=None):
+    """Tabular epsilon-greedy Q-learning on a GridWorldEnv.
+
+    `n_envs` episodes run side by side. Every step, all of their transitions
+    are applied as one batched update: TD errors that hit the same (state,
+    action) are averaged, so the step size stays `alpha` however many lanes
+    agree. Episodes longer than `max_steps` are cut off and bootstrapped.
+    `epsilon` decays linearly to `epsilon_final` over training, if given.
+
+    Returns the final Q-table plus `n_snapshots` float32 copies taken at evenly
+    spaced episode counts (the first is the initial table), and the return and
+    length of every episode.
+    """
+    rng = np.random.default_rng(seed)
+    n_states, n_actions = env.n_states, env.n_actions
+    epsilon_final = epsilon if epsilon_final is None else epsilon_final
+
+    # Stored action-major, (n_actions, n_states), so each action is one contiguous row
+    if initial_q is None:
+        q = np.zeros((n_actions, n_states))
+    else:
+        q = np.array(np.broadcast_to(initial_q, (n_states, n_actions)).T, dtype=float)
+    q[:, env.terminal] = 0.0
+
+    snapshot_episodes = np.unique(np.linspace(0, n_episodes, n_snapshots).astype(np.int64))
+    snapshots = np.empty((len(snapshot_episodes), n_states, n_actions), dtype=np.float32)
+    snapshots[0] = q.T
+    next_snapshot = 1
+    episode_returns = np.zeros(n_episodes, dtype=np.float32)
+    episode_lengths = np.zeros(n_episodes, dtype=np.int32)
+
+    n_envs = min(n_envs, n_episodes)
+    states = env.reset(n_envs)
+    returns = np.zeros(n_envs)
+    lengths = np.zeros(n_envs, dtype=np.int64)
+    lanes = np.arange(n_envs)
+    episodes_done = 0
+    flat_size = n_states * n_actions
+
+    while episodes_done < n_episodes:
+        # Epsilon-greedy actions; tiny noise breaks ties between equal Q-values
+        eps = epsilon + (epsilon_final - epsilon) * episodes_done / n_episodes
+        _, greedy = row_max_argmax(q[:, states] + rng.random((n_actions, n_envs)) * 1e-9)
+        explore = rng.random(n_envs) < eps
+        actions = np.where(explore, rng.integers(0, n_actions, n_envs), greedy)
+
+        next_states, rewards, dones = env.step(states, actions, rng)
+        next_values, _ = row_max_argmax(q[:, next_states])
+        targets = rewards + gamma * np.where(dones, 0.0, next_values)
+        errors = targets - q[actions, states]
+
+        index = actions * n_states + states
+        counts = np.bincount(index, minlength=flat_size)
+        sums = np.bincount(index, weights=errors, minlength=flat_size)
+        q += (alpha * sums / np.maximum(counts, 1)).reshape(n_actions, n_states)
+
+        returns += rewards
+        lengths += 1
+        finished = dones | (lengths >= max_steps)
+        if finished.any():
+            ended = lanes[finished][: n_episodes - episodes_done]
+            slots = episodes_done + np.arange(len(ended))
+            episode_returns[slots] = returns[ended]
+            episode_lengths[slots] = lengths[ended]
+            episodes_done += len(ended)
+
+            while next_snapshot < len(snapshot_episodes) and snapshot_episodes[next_snapshot] <= episodes_done:
+                snapshots[next_snapshot] = q.T
+                next_snapshot += 1
+
+            next_states = np.where(finished, env.start_state, next_states)
+            returns[finished] = 0.0
+            lengths[finished] = 0
+        states = next_states
+
+    return QLearningResult(q.T.copy(), snapshots, snapshot_episodes, episode_returns, episode_lengths)
@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from gridenv import GridWorldEnv
+from qlearn import train_q_learning
 
 class QLearning(Scene):
     def construct(self):
@@ -32,8 +34,21 @@ class QLearning(Scene):
             action_header.move_to(LEFT * 3.5 + i * 0.8 * RIGHT + UP * 1)
             headers.add(action_header)
         
-        # Q-values (initially random, will update)
-        q_values = np.random.uniform(-0.5, 0.5, (3, 4))
+        # Q-values (initially random, then learned by a real agent on a
+        # corridor S1 -> S2 -> S3 -> goal, with reward 1 for reaching the goal)
+        env = GridWorldEnv(1, 4, rewards={(0, 3): 1}, terminals=[(0, 3)], start=(0, 0))
+        training = train_q_learning(
+            env,
+            n_episodes=300,
+            alpha=0.1,
+            gamma=0.9,
+            epsilon=0.2,
+            n_envs=16,
+            n_snapshots=9,
+            initial_q=np.random.uniform(-0.5, 0.5, (4, 4)),
+            seed=0
+        )
+        q_values = training.snapshots[0]
         q_texts = VGroup()
         
         for i, state in enumerate(states):
@@ -73,25 +88,27 @@ class QLearning(Scene):
         self.play(Create(gamma_box), Write(gamma_label))
         self.wait(1)
         
-        # Animate Q-value update
-        # Highlight one Q-value
+        # Animate Q-value updates from the training snapshots
+        # Highlight one Q-value: moving right from S1
         highlight_rect = Rectangle(width=0.7, height=0.4, color=YELLOW, stroke_width=3)
-        highlight_rect.move_to(LEFT * 3.5 + 2 * 0.8 * RIGHT + 0.5 * UP)
-        
-        self.play(Create(highlight_rect))
+        highlight_rect.move_to(LEFT * 3.5 + 3 * 0.8 * RIGHT + 0.5 * UP)
         
-        # Show update
-        old_val = q_values[0][2]
-        new_val = old_val + 0.1 * (1.0 + 0.9 * 0.5 - old_val)  # Example update
+        episode_text = Text("Episode 0", font_size=16, color=YELLOW)
+        episode_text.next_to(table_title, RIGHT, buff=0.5)
         
-        # Animate the change
-        self.play(
-            q_texts[6].animate.set_color(YELLOW),  # Highlight changing value
-            run_time=1
-        )
+        self.play(Create(highlight_rect), Write(episode_text))
         
-        new_text = Text(f"{new_val:.1f}", font_size=14, color=YELLOW)
-        new_text.move_to(q_texts[6].get_center())
+        for episode, snapshot in zip(training.snapshot_episodes[1:], training.snapshots[1:]):
+            updates = []
+            for i in range(len(states)):
+                for j in range(4):
+                    q_text = q_texts[i * 5 + j + 1]  # Skip the state label at the start of each row
+                    new_text = Text(f"{snapshot[i][j]:.1f}", font_size=14, color=WHITE)
+                    new_text.move_to(q_text.get_center())
+                    updates.append(Transform(q_text, new_text))
+            
+            new_episode_text = Text(f"Episode {episode}", font_size=16, color=YELLOW)
+            new_episode_text.move_to(episode_text, aligned_edge=LEFT)
+            self.play(*updates, Transform(episode_text, new_episode_text), run_time=0.6)
         
-        self.play(Transform(q_texts[6], new_text))
-        self.wait(2)
\ No newline at end of file
+        self.wait(2)
@@ -0,0 +1,102 @@
+import numpy as np
+from collections import namedtuple
+
+ReinforceResult = namedtuple(
+    "ReinforceResult",
+    ["logits", "snapshots", "snapshot_updates", "mean_returns", "episode_lengths"],
+)
+
+
+def softmax(logits):
+    """Softmax over the last axis."""
+    shifted = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return shifted / shifted.sum(axis=-1, keepdims=True)
+
+
+def returns_to_go(rewards, gamma):
+    """Discounted return from every step on, for (n_steps, n_episodes) rewards."""
+    returns = np.empty_like(rewards)
+    running = np.zeros(rewards.shape[1])
+    for t in range(len(rewards) - 1, -1, -1):
+        running = rewards[t] + gamma * running
+        returns[t] = running
+    return returns
+
+
+def train_reinforce(env, n_updates, batch_size=256, learning_rate=0.5, gamma=0.9, max_steps=50,
+                    baseline=True, initial_logits=None, n_snapshots=50, seed=None):
+    """REINFORCE with a tabular softmax policy, pi(a|s) = softmax(logits[s]).
+
+    Each update rolls out `batch_size` episodes side by side on a
+    GridWorldEnv, computes every step's return-to-go at once, subtracts the
+    per-timestep mean return of the episodes still running as a baseline, and
+    takes one gradient ascent step on the batch average of
+    `advantage * grad log pi(a|s)`. For a softmax that gradient is
+    `onehot(a) - pi(s)`, so it is accumulated with two bincounts.
+
+    Returns the final logits, `n_snapshots` float32 copies of the action
+    probabilities (n_snap, n_states, n_actions) at evenly spaced updates, and
+    the mean episode return and length of every update.
+    """
+    rng = np.random.default_rng(seed)
+    n_states, n_actions = env.n_states, env.n_actions
+    if initial_logits is None:
+        logits = np.zeros((n_states, n_actions))
+    else:
+        logits = np.array(np.broadcast_to(initial_logits, (n_states, n_actions)), dtype=float)
+
+    snapshot_updates = np.unique(np.linspace(0, n_updates, n_snapshots).astype(np.int64))
+    snapshots = np.empty((len(snapshot_updates), n_states, n_actions), dtype=np.float32)
+    next_snapshot = 0
+    mean_returns = np.zeros(n_updates)
+    episode_lengths = np.zeros(n_updates)
+
+    states = np.empty((max_steps, batch_size), dtype=np.int64)
+    actions = np.empty((max_steps, batch_size), dtype=np.int64)
+    rewards = np.zeros((max_steps, batch_size))
+    running = np.zeros((max_steps, batch_size), dtype=bool)
+
+    for update in range(n_updates + 1):
+        probs = softmax(logits)
+        if next_snapshot < len(snapshot_updates) and snapshot_updates[next_snapshot] == update:
+            snapshots[next_snapshot] = probs
+            next_snapshot += 1
+        if update == n_updates:
+            break
+
+        # Roll out the whole batch; finished episodes sit in their terminal state
+        current = env.reset(batch_size)
+        alive = ~env.terminal[current]
+        n_steps = max_steps
+        for t in range(max_steps):
+            states[t] = current
+            actions[t] = env.sample_actions(current, probs, rng)
+            current, rewards[t], dones = env.step(current, actions[t], rng)
+            running[t] = alive
+            rewards[t] *= alive
+            alive = alive & ~dones
+            if not alive.any():
+                n_steps = t + 1
+                break
+
+        s, a, mask = states[:n_steps], actions[:n_steps], running[:n_steps]
+        returns = returns_to_go(rewards[:n_steps], gamma)
+        advantages = returns
+        if baseline:
+            counts = mask.sum(axis=1)
+            means = (returns * mask).sum(axis=1) / np.maximum(counts, 1)
+            advantages = returns - means[:, np.newaxis]
+        advantages = advantages * mask
+
+        # Sum of advantage * (onehot(a) - pi(s)) over every visited (s, a)
+        flat_s, flat_adv = s.ravel(), advantages.ravel()
+        per_action = np.bincount(flat_s * n_actions + a.ravel(), weights=flat_adv,
+                                 minlength=n_states * n_actions).reshape(n_states, n_actions)
+        per_state = np.bincount(flat_s, weights=flat_adv, minlength=n_states)
+        gradient = (per_action - per_state[:, np.newaxis] * probs) / batch_size
+        logits += learning_rate * gradient
+
+        mean_returns[update] = returns[0].mean()
+        episode_lengths[update] = mask.sum() / batch_size
+
+    return ReinforceResult(logits, snapshots, snapshot_updates, mean_returns, episode_lengths)
@@ -0,0 +1,34 @@
+from manim import *
+import numpy as np
+
+from gridenv import ACTION_DELTAS
+
+
+def replay_points(env, trajectory, cell_size=1.0, center=ORIGIN, bump=0.5):
+    """Corner points of the path an agent takes through one environment's trajectory.
+
+    Moves into a wall or an obstacle go `bump` of a cell towards it and back.
+    """
+    states = np.asarray(trajectory.states)
+    actions = np.asarray(trajectory.actions)
+    here = env.to_points(states, cell_size, center)
+    there = env.to_points(env.next_state[states, actions], cell_size, center)
+
+    # (row, col) deltas to scene directions: rows grow downwards
+    directions = np.column_stack([ACTION_DELTAS[actions, 1], -ACTION_DELTAS[actions, 0], np.zeros(len(actions))])
+    blocked = env.blocked[states, actions][:, np.newaxis]
+    midway = np.where(blocked, here + bump * cell_size * directions, there)
+    arrive = np.where(blocked, here, there)
+
+    # Each step is two segments, so every step takes the same time
+    points = np.empty((2 * len(states) + 1, 3))
+    points[0] = here[0] if len(states) else center
+    points[1::2] = midway
+    points[2::2] = arrive
+    return points
+
+
+def replay(agent, env, trajectory, cell_size=1.0, center=ORIGIN, step_time=0.5, **kwargs):
+    """One animation moving `agent` through a trajectory cut from a log or a rollout."""
+    path = VMobject().set_points_as_corners(replay_points(env, trajectory, cell_size, center))
+    return MoveAlongPath(agent, path, run_time=step_time * len(trajectory.states), rate_func=linear, **kwargs)
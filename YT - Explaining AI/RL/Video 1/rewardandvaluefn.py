@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from gridenv import GridWorldEnv
+from valueiter import value_iteration, display_values
 
 class RewardsAndValues(Scene):
     def construct(self):
@@ -20,12 +22,10 @@ class RewardsAndValues(Scene):
         grid = VGroup()
         value_texts = VGroup()
         
-        # Value function values (example)
-        values = np.array([
-            [0.1, 0.3, 1.0],   # Top row
-            [0.05, -1.0, 0.7], # Middle row  
-            [0.02, 0.1, 0.5]   # Bottom row
-        ])
+        # Optimal values: goal (+1) top right, a pit (-1) in the center
+        env = GridWorldEnv(grid_size, rewards={(0, 2): 1, (1, 1): -1}, terminals=[(0, 2), (1, 1)])
+        solution = value_iteration(env, gamma=0.6)
+        values = display_values(env, solution.values).reshape(grid_size, grid_size)
         
         for i in range(grid_size):
             for j in range(grid_size):
@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from learningcurve import LearningCurve
 
 class TrainingProgress(Scene):
     def construct(self):
@@ -25,34 +26,30 @@ class TrainingProgress(Scene):
         )
         
         axes_labels = axes.get_axis_labels(
-            x_label="Episode", y_label="Reward"
+            x_label=r"\text{Episode} \ (\times 10^4)", y_label="Reward"
         )
         
         self.play(Create(axes), Write(axes_labels))
         
-        # Generate training curve data (typical RL learning curve)
-        episodes = np.linspace(0, 100, 100)
-        # Noisy improvement curve
-        base_curve = 40 * (1 - np.exp(-episodes / 30)) - 40
-        noise = np.random.normal(0, 8, 100)
-        rewards = base_curve + noise
-        
-        # Create the curve progressively
-        points = [axes.coords_to_point(ep, reward) for ep, reward in zip(episodes, rewards)]
+        # Stream a simulated run of a million episodes into the plot
+        n_episodes = 1_000_000
+        chunk_size = 100_000
+        curve = LearningCurve(
+            axes, window=10_000, max_points=400, x_step=100 / n_episodes,
+            raw_color=GREEN, mean_color=RED, raw_width=2
+        )
+        for start in range(0, n_episodes, chunk_size):
+            episodes = np.arange(start, start + chunk_size) * 100 / n_episodes
+            # Noisy improvement curve (typical RL learning curve)
+            base_curve = 40 * (1 - np.exp(-episodes / 30)) - 40
+            curve.extend(base_curve + np.random.normal(0, 5, chunk_size))
         
         # Draw curve progressively
-        curve = VMobject()
-        curve.set_points_as_corners([points[0], points[0]])
-        curve.set_stroke(GREEN, width=3)
-        
-        self.play(Create(curve))
-        
-        # Animate curve growth
-        for i in range(1, len(points), 2):  # Every other point for speed
-            new_curve = VMobject()
-            new_curve.set_points_as_corners(points[:i+1])
-            new_curve.set_stroke(GREEN, width=3)
-            self.play(Transform(curve, new_curve), run_time=0.1)
+        shown = ValueTracker(2)
+        curve.raw_curve.add_updater(lambda mob: curve.draw_raw(shown.get_value()))
+        self.add(curve.raw_curve)
+        self.play(shown.animate.set_value(curve.count), run_time=5, rate_func=linear)
+        curve.raw_curve.clear_updaters()
         
         # Add phases annotation
         phases = VGroup(
@@ -87,14 +84,8 @@ class TrainingProgress(Scene):
         self.play(Write(phases))
         
         # Add moving average line
-        window = 10
-        moving_avg = np.convolve(rewards, np.ones(window)/window, mode='valid')
-        avg_episodes = episodes[window-1:]
-        avg_points = [axes.coords_to_point(ep, avg) for ep, avg in zip(avg_episodes, moving_avg)]
-        
-        avg_curve = VMobject()
-        avg_curve.set_points_as_corners(avg_points)
-        avg_curve.set_stroke(RED, width=4)
+        curve.draw_mean()
+        avg_curve = curve.mean_curve
         
         avg_label = Text("Moving Average", font_size=16, color=RED)
         avg_label.to_edge(RIGHT).shift(UP * 2)
@@ -0,0 +1,167 @@
+import hashlib
+import os
+import numpy as np
+
+from gridenv import Trajectory
+
+# File layout: one 32-byte header, then one packed 10-byte record per
+# (step, environment), time-major. Appending is a plain write, and reading
+# maps the records straight from disk without loading them.
+MAGIC = b"RLTRAJ01"
+HEADER = np.dtype([
+    ("magic", "S8"),
+    ("n_envs", "<u4"),
+    ("n_rows", "<u4"),
+    ("n_cols", "<u4"),
+    ("reserved", "<u4", (3,)),
+])
+RECORD = np.dtype([("state", "<i4"), ("action", "i1"), ("reward", "<f4"), ("done", "?")])
+
+
+class TrajectoryWriter:
+    """Appends batches of steps to a trajectory log.
+
+    `write` takes a Trajectory (or states, actions, rewards, dones arrays)
+    of shape (n_steps, n_envs) or (n_steps,) for a single environment. The
+    grid size is stored in the header so a log can be replayed on its own.
+    """
+
+    def __init__(self, path, n_envs=1, n_rows=0, n_cols=0):
+        self.path = path
+        self.n_envs = n_envs
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.file = open(path, "wb")
+        header = np.zeros(1, dtype=HEADER)
+        header["magic"] = MAGIC
+        header["n_envs"], header["n_rows"], header["n_cols"] = n_envs, n_rows, n_cols
+        self.file.write(header.tobytes())
+
+    def write(self, states, actions=None, rewards=None, dones=None):
+        if actions is None:
+            states, actions, rewards, dones = states
+        states = np.asarray(states)
+        if states.size % self.n_envs:
+            raise ValueError(f"{states.size} steps do not divide into {self.n_envs} environments")
+        records = np.empty(states.size, dtype=RECORD)
+        records["state"] = states.ravel()
+        records["action"] = np.ravel(actions)
+        records["reward"] = np.ravel(rewards)
+        records["done"] = np.ravel(dones)
+        self.file.write(records.tobytes())
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def record_rollout(env, path, n_steps, n_envs=1, policy=None, chunk_size=4096, rng=None):
+    """Simulate `n_envs` environments for `n_steps` steps each, straight to a log.
+
+    Environments restart from the start state when an episode ends. Steps are
+    written in chunks of `chunk_size`, so memory stays flat however long the
+    run is.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    with TrajectoryWriter(path, n_envs, env.n_rows, env.n_cols) as writer:
+        states = env.reset(n_envs)
+        for start in range(0, n_steps, chunk_size):
+            length = min(chunk_size, n_steps - start)
+            chunk = Trajectory(
+                np.empty((length, n_envs), dtype=np.int64),
+                np.empty((length, n_envs), dtype=np.int64),
+                np.empty((length, n_envs)),
+                np.empty((length, n_envs), dtype=bool),
+            )
+            for t in range(length):
+                actions = env.sample_actions(states, policy, rng)
+                next_states, rewards, dones = env.step(states, actions, rng)
+                chunk.states[t], chunk.actions[t], chunk.rewards[t], chunk.dones[t] = states, actions, rewards, dones
+                states = np.where(dones, env.start_state, next_states)
+            writer.write(chunk)
+    return path
+
+
+def rollout_key(env, n_steps, n_envs=1, seed=0, policy=None):
+    """Short digest of everything that decides a recorded rollout: the env's tables and the run's settings."""
+    digest = hashlib.sha256(repr((n_steps, n_envs, seed, env.n_rows, env.n_cols, env.start_state, env.slip)).encode())
+    tables = [env.next_state, env.reward, env.terminal, env.obstacle]
+    if policy is not None:
+        tables.append(np.asarray(policy))
+    for table in tables:
+        digest.update(np.ascontiguousarray(table).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def cached_rollout(env, directory, name, n_steps, n_envs=1, seed=0, policy=None):
+    """A TrajectoryLog of `record_rollout`, recorded only if no log with the same settings exists.
+
+    The file is `<name>-<rollout_key>.traj`, so changing the env, the step
+    count, `n_envs`, the seed or the policy records a new log instead of
+    replaying an old one. A run is written under a temporary name and only
+    renamed once complete.
+    """
+    path = os.path.join(directory, f"{name}-{rollout_key(env, n_steps, n_envs, seed, policy)}.traj")
+    if not os.path.exists(path):
+        partial = path + ".partial"
+        record_rollout(env, partial, n_steps, n_envs, policy, rng=np.random.default_rng(seed))
+        os.replace(partial, path)
+    return TrajectoryLog(path)
+
+
+class TrajectoryLog:
+    """A trajectory log mapped from disk.
+
+    `states`, `actions`, `rewards` and `dones` are read-only (n_steps, n_envs)
+    views of the file; nothing is read until it is indexed. Slicing a log or
+    cutting out an episode returns an in-memory Trajectory.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        header = np.fromfile(path, dtype=HEADER, count=1)
+        if len(header) == 0 or header["magic"][0] != MAGIC:
+            raise ValueError(f"{path} is not a trajectory log")
+        self.n_envs = int(header["n_envs"][0])
+        self.n_rows = int(header["n_rows"][0])
+        self.n_cols = int(header["n_cols"][0])
+
+        # A partly written last step (from an interrupted run) is ignored
+        n_records = (os.path.getsize(path) - HEADER.itemsize) // RECORD.itemsize
+        self.n_steps = n_records // self.n_envs
+        if self.n_steps:
+            records = np.memmap(path, dtype=RECORD, mode="r", offset=HEADER.itemsize,
+                                shape=(self.n_steps, self.n_envs))
+        else:
+            records = np.zeros((0, self.n_envs), dtype=RECORD)
+        self.records = records
+        self.states = records["state"]
+        self.actions = records["action"]
+        self.rewards = records["reward"]
+        self.dones = records["done"]
+
+    def __len__(self):
+        return self.n_steps
+
+    def __getitem__(self, steps):
+        """Trajectory of the steps in a slice, for every environment."""
+        chunk = np.array(self.records[steps])
+        return Trajectory(
+            chunk["state"].astype(np.int64), chunk["action"].astype(np.int64),
+            chunk["reward"].astype(float), chunk["done"],
+        )
+
+    def episode_bounds(self, env_index=0):
+        """(start, stop) step ranges of the complete episodes of one environment."""
+        ends = np.flatnonzero(self.dones[:, env_index]) + 1
+        starts = np.concatenate([[0], ends[:-1]])
+        return np.column_stack([starts, ends])
+
+    def episode(self, index, env_index=0):
+        """Trajectory of one complete episode of one environment, shape (length,)."""
+        start, stop = self.episode_bounds(env_index)[index]
+        return Trajectory(*(column[:, env_index] for column in self[start:stop]))
@@ -0,0 +1,138 @@
+import numpy as np
+import scipy.sparse as sparse
+from collections import namedtuple
+
+ValueResult = namedtuple("ValueResult", ["values", "policy", "history", "n_sweeps", "converged"])
+
+
+def transition_matrix(env, include_slip=True):
+    """Sparse P for a GridWorldEnv, shape (n_actions * n_states, n_states).
+
+    Row `a * n_states + s` is the distribution over next states after taking
+    action `a` in state `s`. Without slip every row holds a single entry, so
+    the matrix costs O(n_states * n_actions) memory.
+    """
+    n_states, n_actions = env.n_states, env.n_actions
+    rows = np.arange(n_actions * n_states).reshape(n_actions, n_states)
+    targets = env.next_state.T
+
+    slip = env.slip if include_slip else 0.0
+    row_index, col_index, data = [rows.ravel()], [targets.ravel()], [np.full(rows.size, 1.0 - slip)]
+    if slip:
+        # A slipped move is uniform over the actions, whatever was chosen
+        for other in range(n_actions):
+            row_index.append(rows.ravel())
+            col_index.append(np.tile(targets[other], n_actions))
+            data.append(np.full(rows.size, slip / n_actions))
+
+    matrix = sparse.coo_matrix(
+        (np.concatenate(data), (np.concatenate(row_index), np.concatenate(col_index))),
+        shape=(n_actions * n_states, n_states),
+    )
+    return matrix.tocsr()
+
+
+def expected_rewards(env):
+    """Expected immediate reward of every action, shape (n_actions, n_states)."""
+    rewards = env.reward.T
+    if env.slip:
+        rewards = (1.0 - env.slip) * rewards + env.slip * rewards.mean(axis=0)
+    return np.ascontiguousarray(rewards)
+
+
+def policy_matrix(env, policy, transitions=None):
+    """Sparse (n_states, n_states) transition matrix under a stochastic policy."""
+    transitions = transitions if transitions is not None else transition_matrix(env)
+    weights = np.asarray(policy, dtype=float).T.ravel()
+    stacked = sparse.diags(weights) @ transitions
+    # Sum the n_actions blocks of rows: state s collects rows a * n_states + s
+    collapse = sparse.hstack([sparse.identity(env.n_states, format="csr")] * env.n_actions)
+    return (collapse @ stacked).tocsr()
+
+
+def value_iteration(env, gamma=0.9, tol=1e-6, max_sweeps=1000, initial_values=None, record_history=False):
+    """Bellman optimality sweeps, V <- max_a [R(s, a) + gamma * P(s, a) V].
+
+    Every sweep is one sparse matrix-vector product over all states and
+    actions. Slip is applied after the product, as a mix with the mean over
+    actions, so the matrix keeps one entry per row. Stops once no value
+    changes by more than `tol`. With `record_history` the values after every
+    sweep are kept as a float32 (n_sweeps + 1, n_states) array whose first row
+    is the starting values. Returns the values, the greedy policy (an action
+    per state) and the history.
+    """
+    discounted = (gamma * transition_matrix(env, include_slip=False)).tocsr()
+    rewards = expected_rewards(env)
+    n_states, n_actions = env.n_states, env.n_actions
+
+    values = np.zeros(n_states) if initial_values is None else np.array(initial_values, dtype=float)
+    values[env.terminal] = 0.0
+    # Preallocated; only the rows actually written are ever touched
+    history = np.empty((max_sweeps + 1, n_states), dtype=np.float32) if record_history else None
+    if record_history:
+        history[0] = values
+
+    def action_values(values):
+        q = (discounted @ values).reshape(n_actions, n_states)
+        if env.slip:
+            q = (1.0 - env.slip) * q + env.slip * q.mean(axis=0)
+        return q + rewards
+
+    converged = False
+    for sweep in range(1, max_sweeps + 1):
+        new_values = action_values(values).max(axis=0)
+        delta = np.abs(new_values - values).max()
+        values = new_values
+        if record_history:
+            history[sweep] = values
+        if delta < tol:
+            converged = True
+            break
+
+    policy = action_values(values).argmax(axis=0)
+    history = history[: sweep + 1].copy() if record_history else None
+    return ValueResult(values, policy, history, sweep, converged)
+
+
+def policy_evaluation(env, policy=None, gamma=0.9, tol=1e-6, max_sweeps=1000, initial_values=None,
+                      record_history=False):
+    """Iterative evaluation of a fixed policy, V <- R_pi + gamma * P_pi V.
+
+    `policy` is a (n_states, n_actions) array of action probabilities, or an
+    action per state for a deterministic policy; None means uniformly random.
+    Returns the same ValueResult as `value_iteration`, with the policy that
+    was evaluated.
+    """
+    n_states, n_actions = env.n_states, env.n_actions
+    if policy is None:
+        policy = np.full((n_states, n_actions), 1.0 / n_actions)
+    elif np.ndim(policy) == 1:
+        policy = np.eye(n_actions)[policy]
+
+    discounted = (gamma * policy_matrix(env, policy)).tocsr()
+    rewards = (expected_rewards(env) * policy.T).sum(axis=0)
+
+    values = np.zeros(n_states) if initial_values is None else np.array(initial_values, dtype=float)
+    values[env.terminal] = 0.0
+    history = np.empty((max_sweeps + 1, n_states), dtype=np.float32) if record_history else None
+    if record_history:
+        history[0] = values
+
+    converged = False
+    for sweep in range(1, max_sweeps + 1):
+        new_values = rewards + discounted @ values
+        delta = np.abs(new_values - values).max()
+        values = new_values
+        if record_history:
+            history[sweep] = values
+        if delta < tol:
+            converged = True
+            break
+
+    history = history[: sweep + 1].copy() if record_history else None
+    return ValueResult(values, policy, history, sweep, converged)
+
+
+def display_values(env, values):
+    """Values to show on a grid: terminal cells show the reward collected on arrival."""
+    return np.where(env.terminal, env.cell_rewards, values)
@@ -0,0 +1,139 @@
+from manim import *
+import numpy as np
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+
+CACHE_SIZE = 64
+# function -> OrderedDict of sampling arguments -> samples. Functions that
+# cannot be weakly referenced (builtins, numpy ufuncs) are held strongly,
+# for the last CACHE_SIZE such functions used
+_sample_cache = WeakKeyDictionary()
+_strong_sample_cache = OrderedDict()
+
+
+def array_function(function, mode=None):
+    """Wrap `function` to take an array of x and return an array of y.
+
+    With `mode` None the function is first called on the whole array; if
+    that raises or does not return one value per x (a scalar-only function
+    such as `lambda x: 1 if a <= x <= b else 0`), it is called once per x
+    from then on. `mode` True or False skips the probe.
+    """
+    state = {"whole_array": mode}
+
+    def evaluate(x):
+        if state["whole_array"] is not False:
+            try:
+                y = np.asarray(function(x), dtype=float)
+                if y.ndim == 0:
+                    y = np.full(x.shape, float(y))
+                if y.shape == x.shape:
+                    state["whole_array"] = True
+                    return y
+            except (TypeError, ValueError):
+                if state["whole_array"]:
+                    raise
+            state["whole_array"] = False
+        return np.fromiter((function(value) for value in x), dtype=float, count=len(x))
+
+    return evaluate
+
+
+def adaptive_samples(function, x_min, x_max, x_scale=1.0, y_scale=1.0, n_initial=129, tolerance=0.01, max_depth=10, mode=None):
+    """Sample y = function(x) densely where the curve bends and sparsely where it is straight.
+
+    Starting from `n_initial` even samples, every interval whose midpoint
+    lies more than `tolerance` from the chord (measured after scaling x and
+    y by `x_scale` and `y_scale`, i.e. in scene units) is split, up to
+    `max_depth` times. Each round evaluates all new midpoints in one call.
+    Features narrower than the initial spacing can be missed. Returns x, y.
+    """
+    evaluate = array_function(function, mode)
+    x = np.linspace(x_min, x_max, n_initial)
+    y = evaluate(x)
+    active = np.ones(n_initial - 1, dtype=bool)
+
+    for _ in range(max_depth):
+        left = np.flatnonzero(active)
+        if len(left) == 0:
+            break
+        mid_x = (x[left] + x[left + 1]) / 2
+        mid_y = evaluate(mid_x)
+        error = np.abs(mid_y - (y[left] + y[left + 1]) / 2) * y_scale
+        split = ~(error <= tolerance)
+        split &= (x[left + 1] - x[left]) * x_scale > tolerance / 16
+
+        # Both halves of a split interval stay active for the next round
+        left = left[split]
+        x = np.insert(x, left + 1, mid_x[split])
+        y = np.insert(y, left + 1, mid_y[split])
+        active = np.zeros(len(x) - 1, dtype=bool)
+        first_half = left + np.arange(len(left))
+        active[first_half] = active[first_half + 1] = True
+    return x, y
+
+
+def cached_samples(function, x_min, x_max, x_scale=1.0, y_scale=1.0, n_initial=129, tolerance=0.01, max_depth=10, mode=None):
+    """adaptive_samples, memoized per function object and sampling arguments.
+
+    The cache is keyed on the function itself, weakly where possible, so a
+    function's samples go away with it and can never be handed to another
+    function. The last CACHE_SIZE results are kept per function.
+    """
+    try:
+        entries = _sample_cache.setdefault(function, OrderedDict())
+    except TypeError:
+        entries = _strong_sample_cache.setdefault(function, OrderedDict())
+        _strong_sample_cache.move_to_end(function)
+        if len(_strong_sample_cache) > CACHE_SIZE:
+            _strong_sample_cache.popitem(last=False)
+    key = (float(x_min), float(x_max), round(x_scale, 9), round(y_scale, 9), n_initial, tolerance, max_depth)
+    if key in entries:
+        entries.move_to_end(key)
+        return entries[key]
+    samples = adaptive_samples(function, x_min, x_max, x_scale, y_scale, n_initial, tolerance, max_depth, mode)
+    entries[key] = samples
+    if len(entries) > CACHE_SIZE:
+        entries.popitem(last=False)
+    return samples
+
+
+class SampledGraph(ParametricFunction):
+    """A graph of y = function(x) on `axes`, drawn through adaptive samples.
+
+    A drop-in for `axes.plot(function, x_range=..., **kwargs)`: it keeps
+    `underlying_function` for `axes.get_area` and friends. The tolerance is
+    in scene units for the axes as they are when the graph is made.
+    Non-finite values break the curve.
+    """
+
+    def __init__(self, axes, function, x_range=None, tolerance=0.01, n_initial=129, max_depth=10, vectorized=None, **kwargs):
+        x_min, x_max = (axes.x_range if x_range is None else x_range)[:2]
+        origin = axes.c2p(0, 0)
+        x_scale = np.linalg.norm(axes.c2p(1, 0) - origin)
+        y_scale = np.linalg.norm(axes.c2p(0, 1) - origin)
+        self.axes = axes
+        self.samples = cached_samples(function, x_min, x_max, x_scale, y_scale, n_initial, tolerance, max_depth, vectorized)
+        super().__init__(
+            lambda t: axes.c2p(t, function(t)),
+            t_range=(x_min, x_max),
+            use_smoothing=False,
+            **kwargs
+        )
+        self.underlying_function = function
+
+    def generate_points(self):
+        x, y = self.samples
+        points = self.axes.c2p(x, y).T
+        for piece in np.split(points, np.flatnonzero(~np.isfinite(y))):
+            piece = piece[np.isfinite(piece).all(axis=1)]
+            if len(piece) > 1:
+                self.start_new_path(piece[0])
+                self.add_points_as_corners(piece[1:])
+        return self
+
+    init_points = generate_points
+
+
+def plot_adaptive(axes, function, x_range=None, **kwargs):
+    return SampledGraph(axes, function, x_range, **kwargs)
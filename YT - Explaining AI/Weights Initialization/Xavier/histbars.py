@@ -0,0 +1,32 @@
+from manim import *
+import numpy as np
+
+from segments import line_segments
+
+
+class HistogramBars(VMobject):
+    """The bars of a histogram as one filled mobject.
+
+    `histogram` is anything with a `bars()` method returning left edges,
+    right edges and heights (a streamstats.StreamingHistogram), or such a
+    tuple itself. Edges are multiplied by `x_scale` and heights by
+    `y_scale`; bars stand on y = 0 with x = 0 at the mobject's origin.
+    Every bar is a closed subpath of the same VMobject, so a histogram of
+    hundreds of bins costs one mobject to draw and animate.
+    """
+
+    def __init__(self, histogram, x_scale=1.0, y_scale=1.0, color=BLUE, fill_opacity=0.5, stroke_width=1, **kwargs):
+        super().__init__(color=color, fill_opacity=fill_opacity, stroke_width=stroke_width, **kwargs)
+        left, right, height = histogram.bars() if hasattr(histogram, "bars") else histogram
+        left = np.asarray(left, dtype=float) * x_scale
+        right = np.asarray(right, dtype=float) * x_scale
+        height = np.asarray(height, dtype=float) * y_scale
+
+        # Corners of each bar, counter-clockwise from its bottom left, then closed
+        n = len(left)
+        corners = np.zeros((n, 5, 3))
+        corners[:, [0, 3, 4], 0] = left[:, None]
+        corners[:, [1, 2], 0] = right[:, None]
+        corners[:, [2, 3], 1] = height[:, None]
+
+        self.points = line_segments(corners[:, :-1], corners[:, 1:])
@@ -0,0 +1,72 @@
+"""Throughput of the weight initializers, in GB of float32 weights written per second.
+
+Each scheme fills a (fan_in, fan_out) tensor chunk by chunk, once into a
+preallocated array and once into a memory-mapped .npy file, e.g.
+
+    python initbench.py --fan-in 16384 --fan-out 16384 --repeat 3
+"""
+import argparse
+import os
+import tempfile
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from initializers import CHUNK_SIZE, INITIALIZERS, sample_chunked, sample_to_file
+
+BenchResult = namedtuple("BenchResult", ["name", "target", "gigabytes", "seconds", "throughput"])
+
+
+def best_time(run, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark(fan_in=8192, fan_out=8192, names=None, repeat=3, chunk_size=CHUNK_SIZE, memmap=True, seed=0):
+    """Best-of-`repeat` time for each scheme to fill a fan_in x fan_out float32 tensor."""
+    names = list(INITIALIZERS) if names is None else names
+    gigabytes = fan_in * fan_out * 4 / 1e9
+    out = np.empty((fan_in, fan_out), dtype=np.float32)
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "weights.npy")
+        for name in names:
+            targets = [("memory", lambda: sample_chunked(name, fan_in, fan_out, seed, out, chunk_size))]
+            if memmap:
+                targets.append(("memmap", lambda: sample_to_file(name, fan_in, fan_out, path, seed, chunk_size)))
+            for target, run in targets:
+                seconds = best_time(run, repeat)
+                results.append(BenchResult(name, target, gigabytes, seconds, gigabytes / seconds))
+    return results
+
+
+def format_results(results):
+    lines = [f"{'scheme':<16}{'target':<8}{'GB':>8}{'seconds':>10}{'GB/s':>8}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<16}{result.target:<8}{result.gigabytes:>8.2f}"
+            f"{result.seconds:>10.3f}{result.throughput:>8.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fan-in", type=int, default=8192)
+    parser.add_argument("--fan-out", type=int, default=8192)
+    parser.add_argument("--schemes", nargs="+", choices=list(INITIALIZERS), default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--no-memmap", action="store_true", help="only time in-memory fills")
+    args = parser.parse_args(argv)
+    results = benchmark(args.fan_in, args.fan_out, args.schemes, args.repeat, args.chunk_size, not args.no_memmap)
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
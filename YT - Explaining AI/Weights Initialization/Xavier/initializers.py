@@ -0,0 +1,95 @@
+import numpy as np
+
+# Every scheme is a distribution plus a parameter of the layer's fan-in and
+# fan-out: the weight variance it targets for "normal" and "uniform"
+# (uniform on +-sqrt(3 * variance)), or the value itself for "constant"
+INITIALIZERS = {
+    "zeros": ("constant", lambda fan_in, fan_out: 0.0),
+    "ones": ("constant", lambda fan_in, fan_out: 1.0),
+    "random_normal": ("normal", lambda fan_in, fan_out: 0.01),
+    "random_uniform": ("uniform", lambda fan_in, fan_out: 0.01 / 3),
+    "standard": ("normal", lambda fan_in, fan_out: 1.0),
+    "lecun": ("normal", lambda fan_in, fan_out: 1.0 / fan_in),
+    "xavier_uniform": ("uniform", lambda fan_in, fan_out: 2.0 / (fan_in + fan_out)),
+    "xavier_normal": ("normal", lambda fan_in, fan_out: 2.0 / (fan_in + fan_out)),
+    "he": ("normal", lambda fan_in, fan_out: 2.0 / fan_in),
+    "he_uniform": ("uniform", lambda fan_in, fan_out: 2.0 / fan_in),
+}
+
+# Values per chunk when sampling large tensors. The chunk size is part of
+# the seed: the same seed and chunk size always give the same tensor.
+CHUNK_SIZE = 1 << 22
+
+
+def weight_variance(name, fan_in, fan_out):
+    distribution, parameter = INITIALIZERS[name]
+    return 0.0 if distribution == "constant" else parameter(fan_in, fan_out)
+
+
+def fill(name, fan_in, fan_out, out, rng):
+    """Overwrite `out` in place with weights drawn with the named scheme."""
+    distribution, parameter = INITIALIZERS[name]
+    value = parameter(fan_in, fan_out)
+    if distribution == "constant":
+        out.fill(value)
+    elif distribution == "normal":
+        rng.standard_normal(dtype=out.dtype, out=out)
+        out *= np.sqrt(value)
+    else:
+        # Uniform(-limit, limit) has variance limit^2 / 3
+        limit = np.sqrt(3.0 * value)
+        rng.random(dtype=out.dtype, out=out)
+        out *= 2 * limit
+        out -= limit
+    return out
+
+
+def sample_weights(name, fan_in, fan_out, rng=None, dtype=np.float32, out=None):
+    """A (fan_in, fan_out) weight matrix drawn with the named scheme.
+
+    Samples are generated directly in `dtype` and scaled in place; pass `out`
+    to reuse an existing buffer.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    out = np.empty((fan_in, fan_out), dtype=dtype) if out is None else out
+    return fill(name, fan_in, fan_out, out, rng)
+
+
+def chunk_rng(seed, index):
+    """Generator for chunk `index` of a tensor: the index-th child of the seed's SeedSequence."""
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed, spawn_key=(index,))))
+
+
+def sample_chunked(name, fan_in, fan_out, seed, out=None, chunk_size=CHUNK_SIZE, chunks=None):
+    """Fill a (fan_in, fan_out) float32 tensor chunk by chunk.
+
+    `out` may be any C-contiguous array of that many values, such as a
+    np.memmap; by default one is allocated. Chunk k holds values
+    [k * chunk_size, (k + 1) * chunk_size) of the flattened tensor and is
+    drawn from its own generator, `chunk_rng(seed, k)`, so chunks can be
+    filled in any order or by separate processes (pass `chunks`, an
+    iterable of chunk indices, to fill only those) and the result is the
+    same.
+    """
+    out = np.empty((fan_in, fan_out), dtype=np.float32) if out is None else out
+    if out.size != fan_in * fan_out or not out.flags.c_contiguous:
+        raise ValueError("out must be a C-contiguous array of fan_in * fan_out values")
+    flat = out.reshape(-1)
+    n_chunks = -(-flat.size // chunk_size)
+    for index in range(n_chunks) if chunks is None else chunks:
+        piece = flat[index * chunk_size:(index + 1) * chunk_size]
+        fill(name, fan_in, fan_out, piece, chunk_rng(seed, index))
+    return out
+
+
+def sample_to_file(name, fan_in, fan_out, path, seed, chunk_size=CHUNK_SIZE):
+    """Stream a (fan_in, fan_out) float32 tensor into a .npy file and return it memory-mapped.
+
+    Only one chunk's worth of pages needs to be resident at a time, so the
+    tensor can be far larger than memory. Load it later with
+    np.load(path, mmap_mode="r").
+    """
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=(fan_in, fan_out))
+    sample_chunked(name, fan_in, fan_out, seed, out, chunk_size)
+    out.flush()
+    return out
@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from initializers import sample_weights
+
 class Intro(Scene):
     def construct(self):
         
@@ -25,14 +27,19 @@ class Intro(Scene):
         self.wait(1)
 
         
+        # Weights of the 10-unit layer, whose fan-in is the 15 units before it
+        rng = np.random.default_rng()
         init_methods = [
-            ("Random Normal", np.random.normal(0, 0.1, 10)),
-            ("Zeros", np.zeros(10)),
-            ("Ones", np.ones(10)),
-            ("Xavier/Glorot", np.random.normal(0, np.sqrt(2.0/25), 10)),
-            ("He", np.random.normal(0, np.sqrt(2.0/25), 10)),
-            ("Uniform", np.random.uniform(-0.1, 0.1, 10)),
-            ("LeCun", np.random.normal(0, np.sqrt(1.0/25), 10))
+            (name, sample_weights(scheme, 15, 10, rng)[0])
+            for name, scheme in [
+                ("Random Normal", "random_normal"),
+                ("Zeros", "zeros"),
+                ("Ones", "ones"),
+                ("Xavier/Glorot", "xavier_normal"),
+                ("He", "he"),
+                ("Uniform", "random_uniform"),
+                ("LeCun", "lecun"),
+            ]
         ]
 
         
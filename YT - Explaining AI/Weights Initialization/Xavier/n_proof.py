@@ -1,5 +1,11 @@
 from manim import *
 import numpy as np
+from varprop import DeepMLP, layer_widths
+from streamstats import layer_histograms
+from histbars import HistogramBars
+from pdfcurves import pdf_curve
+from netdiagram import NetworkDiagram
+from initializers import sample_weights
 
 class GlorotInitializationProof(Scene):
     def construct(self):
@@ -243,31 +249,10 @@ class GlorotInitializationProof(Scene):
         self.wait(3)
 
     def create_network_diagram(self):
-        layers_sizes = [4, 5, 3]
-        network = VGroup()
-        
-        # Create layers
-        layers = []
-        max_neurons = max(layers_sizes)
-        layer_width = 2.5
-        
-        for i, size in enumerate(layers_sizes):
-            layer = VGroup()
-            for j in range(size):
-                neuron = Circle(radius=0.2, color=WHITE)
-                y_pos = (j - (size-1)/2) * 0.5
-                neuron.move_to([i * layer_width - layer_width, y_pos, 0])
-                layer.add(neuron)
-            layers.append(layer)
-            network.add(layer)
-        
-        # Create connections between layers
-        for i in range(len(layers) - 1):
-            for n1 in layers[i]:
-                for n2 in layers[i+1]:
-                    conn = Line(n1.get_center(), n2.get_center(), stroke_width=1)
-                    network.add(conn)
-                    
+        network = NetworkDiagram([4, 5, 3], layer_spacing=2.5, edge_width=1, edge_opacity=1)
+        layers = network.layers
+        layers_sizes = network.layer_sizes
+        
         # Add labels
         n_in = Text("n_in", font_size=24).next_to(layers[0], DOWN, buff=0.3)
         n_out = Text("n_out", font_size=24).next_to(layers[-1], DOWN, buff=0.3)
@@ -377,36 +362,13 @@ class GlorotInitializationProof(Scene):
     def create_experimental_network(self):
         # Create a visual of a deeper neural network for experimental demonstration
         layers = [3, 5, 7, 5, 3]
-        network = VGroup()
-        
-        # Create neurons
-        x_spacing = 1.0
-        y_spacing = 0.5
-        
-        # Create layers of neurons
-        all_neurons = []
-        for l_idx, layer_size in enumerate(layers):
-            layer_neurons = []
-            for n_idx in range(layer_size):
-                neuron = Circle(radius=0.15, color=WHITE, fill_opacity=0)
-                y_pos = (n_idx - (layer_size-1)/2) * y_spacing
-                x_pos = l_idx * x_spacing * 1.5
-                neuron.move_to([x_pos, y_pos, 0])
-                layer_neurons.append(neuron)
-                network.add(neuron)
-            all_neurons.append(layer_neurons)
-        
-        # Add connections
-        for l_idx in range(len(layers) - 1):
-            for n1 in all_neurons[l_idx]:
-                for n2 in all_neurons[l_idx + 1]:
-                    conn = Line(
-                        n1.get_center(), 
-                        n2.get_center(), 
-                        stroke_width=0.5,
-                        stroke_opacity=0.5
-                    )
-                    network.add(conn)
+        network = NetworkDiagram(layers, layer_spacing=1.5, neuron_radius=0.15, edge_width=0.5)
+        all_neurons = network.layers
+        
+        # Edges drawn from actual Xavier-initialized weights
+        rng = np.random.default_rng(0)
+        for bundle in network.edges:
+            bundle.set_weights(sample_weights("xavier_normal", *bundle.shape, rng), max_width=1.5)
         
         # Add labels
         network.add(Text("Input", font_size=20).next_to(all_neurons[0][1], LEFT))
@@ -438,55 +400,59 @@ class GlorotInitializationProof(Scene):
         histograms = VGroup()
         num_layers = 4
         
-        for i in range(num_layers):
-            if init_type == "standard":
-                # For standard init - variance increases with depth
-                var = 1.0 * (1.5**i)
-                height = 1.0 * (0.8**i)
-            else:  # glorot init
-                # For glorot init - stable variance
-                var = 1.0
-                height = 0.95
+        # Measured: a unit-variance batch through a linear 256-wide network,
+        # the setting of the proof
+        init = "standard" if init_type == "standard" else "xavier_normal"
+        network = DeepMLP(layer_widths(num_layers, 256), init, "linear", seed=0)
+        _, layer_hists = layer_histograms(network, batch_size=4096, bins=40, span=3.0)
+        
+        for index, layer_hist in enumerate(layer_hists):
+            var = layer_hist.variance
+            # The peak of a normal pdf falls as 1/σ
+            height = 0.95 / np.sqrt(max(var, 1.0))
             
-            # Create bell curve
-            hist = self.create_bell_curve(var, height, color)
+            # Create bell curve over the measured histogram
+            hist = self.create_bell_curve(var, height, color, index, layer_hist)
             histograms.add(hist)
             
         histograms.arrange(RIGHT, buff=0.3)
         return histograms
     
-    def create_bell_curve(self, variance, height, color):
+    def create_bell_curve(self, variance, height, color, layer_index, histogram=None):
         # Create a bell curve (normal distribution) visualization
         
-        curve = VMobject(color=color, fill_opacity=0.5, stroke_width=2)
-        
-        std_dev = np.sqrt(variance)
-        x_min, x_max = -3 * std_dev, 3 * std_dev
-        dx = 0.1
-        
-        points = []
-        x_vals = np.arange(x_min, x_max + dx, dx)
-        for x in x_vals:
-            y = height * np.exp(-0.5 * (x / std_dev) ** 2)
-            points.append([x, y, 0])
-            
-        # Add baseline points
-        points.append([x_max, 0, 0])
-        points.append([x_min, 0, 0])
-        
-        curve.set_points_as_corners(points)
+        # Drawn at most 3x as wide as a unit-variance curve
+        std_dev = min(np.sqrt(variance), 3.0)
+        curve = pdf_curve(
+            std=std_dev,
+            height=height,
+            color=color,
+            fill_opacity=0.5 if histogram is None else 0,
+            stroke_width=2,
+        )
         
         # Add variance text
-        var_text = Text(f"σ² = {variance:.1f}", font_size=16, color=color)
+        var_text = Text(f"σ² = {variance:.3g}", font_size=16, color=color)
         var_text.next_to(curve, UP, buff=0.1)
         
         layer_group = VGroup(curve, var_text)
         
-        # Add layer label
-        layer_num = len(self.create_bell_curve.__dict__.get('_layer_count', [])) + 1
-        self.create_bell_curve.__dict__.setdefault('_layer_count', []).append(1)
+        if histogram is not None:
+            # Measured bars on the curve's axes: x in units of the drawn σ,
+            # density scaled so a normal pdf would peak at `height`
+            sigma = np.sqrt(variance)
+            bars = HistogramBars(
+                histogram,
+                x_scale=std_dev / sigma,
+                y_scale=height * sigma * np.sqrt(2 * np.pi),
+                color=color,
+                fill_opacity=0.4,
+                stroke_width=0.5,
+            )
+            layer_group.add_to_back(bars)
         
-        label = Text(f"Layer {layer_num % 4 + 1}", font_size=16)
+        # Add layer label
+        label = Text(f"Layer {layer_index + 1}", font_size=16)
         label.next_to(curve, DOWN, buff=0.1) 
         layer_group.add(label)
         
@@ -0,0 +1,138 @@
+from manim import *
+import numpy as np
+
+from segments import line_segments
+
+
+class EdgeBundle(VGroup):
+    """All edges between two layers, drawn as a few compound paths instead of one Line each.
+
+    Edge `i * n_to + j` joins neuron i of the first layer to neuron j of the
+    second, so per-edge arrays have the layout of a (n_from, n_to) weight
+    matrix. Edges are grouped by style: every group is one VMobject whose
+    subpaths are its edges, so restyling thousands of edges touches only
+    as many mobjects as there are distinct styles. Restyling reads the edges
+    back from the drawn points, so it follows any moves or scaling.
+    """
+
+    def __init__(self, starts, ends, shape, stroke_color=WHITE, stroke_width=1, stroke_opacity=0.5, **kwargs):
+        super().__init__(**kwargs)
+        self.shape = shape
+        self.base_style = dict(color=stroke_color, width=stroke_width, opacity=stroke_opacity)
+        path = VMobject()
+        path.points = line_segments(starts, ends)
+        path.set_stroke(**self.base_style)
+        self.order = np.arange(len(starts))
+        self.add(path)
+
+    def endpoints(self):
+        """(starts, ends) of every edge where it is drawn now, after any moves or scaling."""
+        segments = np.concatenate([path.points for path in self.submobjects]).reshape(-1, 4, 3)
+        starts, ends = np.empty((2, len(self.order), 3))
+        starts[self.order], ends[self.order] = segments[:, 0], segments[:, 3]
+        return starts, ends
+
+    def midpoints(self):
+        starts, ends = self.endpoints()
+        return (starts + ends) / 2
+
+    def restyle(self, levels, styles):
+        """Draw edge k with `styles[levels[k]]`, a dict of set_stroke arguments."""
+        starts, ends = self.endpoints()
+        levels = np.asarray(levels).reshape(-1)
+        order = np.argsort(levels, kind="stable")
+        bounds = np.searchsorted(levels[order], np.arange(len(styles) + 1))
+        paths = []
+        for level, style in enumerate(styles):
+            chosen = order[bounds[level]:bounds[level + 1]]
+            if len(chosen) == 0:
+                continue
+            path = VMobject()
+            path.points = line_segments(starts[chosen], ends[chosen])
+            path.set_stroke(**style)
+            paths.append(path)
+        self.order = order
+        self.submobjects = []
+        self.add(*paths)
+        return self
+
+    def set_weights(self, weights, positive=BLUE, negative=RED, max_width=3.0, n_levels=8, scale=None):
+        """Colour edges by the sign of their weight, width and opacity by its magnitude.
+
+        Magnitudes are divided by `scale` (the largest |w| by default) and
+        quantized into `n_levels` steps per sign.
+        """
+        weights = np.asarray(weights, dtype=float).reshape(-1)
+        scale = scale or (np.abs(weights).max() or 1.0)
+        steps = np.minimum((np.abs(weights) / scale * n_levels).astype(int), n_levels - 1)
+        levels = steps + n_levels * (weights < 0)
+
+        styles = []
+        for color in (positive, negative):
+            for step in range(n_levels):
+                strength = (step + 1) / n_levels
+                styles.append(dict(color=color, width=max_width * strength, opacity=0.2 + 0.8 * strength))
+        return self.restyle(levels, styles)
+
+    def highlight(self, mask, color=YELLOW, width=3, opacity=1.0):
+        """Draw the edges where `mask` is true in one highlighted style, the rest as before styling."""
+        mask = np.asarray(mask, dtype=bool).reshape(-1)
+        highlighted = dict(color=color, width=width, opacity=opacity)
+        return self.restyle(mask.astype(int), [self.base_style, highlighted])
+
+
+class NetworkDiagram(VGroup):
+    """A fully connected network: one VGroup of neurons per layer, then one EdgeBundle per layer pair.
+
+    The diagram is centred on the origin, with layers `layer_spacing` apart
+    from left to right and neurons `neuron_spacing` apart from top to
+    bottom. Indexing the diagram gives its layers first, so `diagram[0]` is
+    the input layer. `edge_offset` moves edge ends sideways off the neuron
+    centres (a neuron radius joins the circles' sides). Extra keyword
+    arguments in `neuron_config` go to each neuron's Circle.
+    """
+
+    def __init__(
+        self,
+        layer_sizes,
+        layer_spacing=2.0,
+        neuron_spacing=0.5,
+        neuron_radius=0.2,
+        neuron_config=None,
+        edge_offset=0.0,
+        edge_color=WHITE,
+        edge_width=1,
+        edge_opacity=0.5,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.layer_sizes = list(layer_sizes)
+        neuron_config = dict(dict(color=WHITE), **(neuron_config or {}))
+
+        centers = []
+        for i, size in enumerate(self.layer_sizes):
+            x = (i - (len(self.layer_sizes) - 1) / 2) * layer_spacing
+            y = ((size - 1) / 2 - np.arange(size)) * neuron_spacing
+            centers.append(np.column_stack([np.full(size, x), y, np.zeros(size)]))
+
+        self.layers = VGroup()
+        for layer_centers in centers:
+            self.layers.add(VGroup(*[
+                Circle(radius=neuron_radius, **neuron_config).move_to(center)
+                for center in layer_centers
+            ]))
+
+        self.edges = VGroup()
+        for left, right in zip(centers[:-1], centers[1:]):
+            starts = np.repeat(left, len(right), axis=0) + edge_offset * RIGHT
+            ends = np.tile(right, (len(left), 1)) + edge_offset * LEFT
+            self.edges.add(EdgeBundle(
+                starts, ends, (len(left), len(right)),
+                stroke_color=edge_color, stroke_width=edge_width, stroke_opacity=edge_opacity,
+            ))
+
+        self.add(*self.layers, *self.edges)
+
+    def edge_midpoints(self, index=0):
+        """Midpoints of the edges between layers `index` and `index + 1`, in weight-matrix order."""
+        return self.edges[index].midpoints()
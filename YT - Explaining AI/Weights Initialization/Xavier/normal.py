@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 from scipy.stats import norm
+from adaptiveplot import plot_adaptive
+from sweeparea import SweepArea, GlyphNumber
 
 class NormalDistribution(Scene):
     def construct(self):
@@ -31,7 +33,8 @@ class NormalDistribution(Scene):
         y_label = axes.get_y_axis_label("f(x)").scale(0.6)  
 
         
-        normal_graph = axes.plot(
+        normal_graph = plot_adaptive(
+            axes,
             lambda x: norm.pdf(x, 0, 1),
             color=RED,
             x_range=[-4, 4],
@@ -70,34 +73,34 @@ class NormalDistribution(Scene):
 
         
         probability_tracker = ValueTracker(-4)
-        prob_area = always_redraw(
-            lambda: axes.get_area(
-                normal_graph,
-                x_range=[-4, probability_tracker.get_value()],
-                color=GREEN_C,
-                opacity=0.5
-            )
-        )
-
         
-        prob_label = always_redraw(
-            lambda: MathTex(
-                f"P(X \\leq {probability_tracker.get_value():.2f}) = {norm.cdf(probability_tracker.get_value()):.3f}"
-            ).scale(0.6).to_corner(UL).shift(DOWN * 0.2)  
-        )
+        # pdf outline and CDF table computed once; each frame only slices them
+        sweep = SweepArea(axes, lambda x: norm.pdf(x, 0, 1), x_range=[-4, 4], cdf=norm.cdf)
+        sweep.track(probability_tracker)
 
         
-        v_line = always_redraw(
-            lambda: axes.get_vertical_line(
-                axes.c2p(probability_tracker.get_value(), 0),
-                line_config={"color": YELLOW}
-            )
-        )
+        # Typeset once; the two numbers are redrawn from cached digit glyphs
+        font_size = DEFAULT_FONT_SIZE * 0.6
+        template = MathTex(r"P(X \leq", "-0.00", ") =", "0.000", font_size=font_size)
+        template.to_corner(UL).shift(DOWN * 0.2)
+        x_number = GlyphNumber(num_decimal_places=2, font_size=font_size)
+        cdf_number = GlyphNumber(num_decimal_places=3, font_size=font_size)
+        closing = template[2]
+        closing_bottom = closing.get_bottom()
+
+        def update_label(label):
+            x = probability_tracker.get_value()
+            x_number.set_value(x).align_to(template[1], LEFT).align_to(template[1], DOWN)
+            closing.next_to(x_number, RIGHT, buff=0.1).align_to(closing_bottom, DOWN)
+            cdf_number.set_value(sweep.cdf(x)).next_to(closing, RIGHT, buff=0.1).align_to(template[3], DOWN)
+
+        prob_label = VGroup(template[0], x_number, closing, cdf_number)
+        prob_label.add_updater(update_label)
+        update_label(prob_label)
 
         
         self.play(
-            FadeIn(prob_area),
-            FadeIn(v_line),
+            FadeIn(sweep),
             FadeIn(prob_label)
         )
 
@@ -0,0 +1,43 @@
+from manim import *
+import numpy as np
+from functools import lru_cache
+
+from segments import polyline_segments
+
+# Standardized densities (mean 0, variance 1), up to a constant factor
+DENSITIES = {
+    "normal": lambda x, params: np.exp(-0.5 * x * x),
+    "uniform": lambda x, params: (np.abs(x) <= np.sqrt(3.0)).astype(float),
+    # params = (degrees of freedom,), more than 2
+    "student_t": lambda x, params: (1 + x * x / (params[0] - 2)) ** (-(params[0] + 1) / 2),
+}
+
+
+@lru_cache(maxsize=128)
+def pdf_outline(distribution="normal", params=(), resolution=121, span=3.0):
+    """Closed outline of a standardized pdf as cubic Bezier points, shape (4 * (resolution + 2), 3).
+
+    The curve runs over [-span, span] standard deviations with its peak at
+    height 1 and is closed along the baseline. Results are memoized by
+    (distribution, params, resolution, span) with LRU eviction; the array is
+    read-only, so callers copy it before transforming.
+    """
+    x = np.linspace(-span, span, resolution)
+    y = DENSITIES[distribution](x, params)
+    y = y / y.max()
+
+    corners = np.zeros((resolution + 3, 3))
+    corners[:resolution, 0], corners[:resolution, 1] = x, y
+    corners[resolution:, 0] = [span, -span, -span]
+    corners[-1, 1] = y[0]
+
+    points = polyline_segments(corners)
+    points.flags.writeable = False
+    return points
+
+
+def pdf_curve(mean=0.0, std=1.0, height=1.0, distribution="normal", params=(), resolution=121, span=3.0, **kwargs):
+    """A new VMobject outlining a pdf, `height` tall at its peak, built from the cached outline."""
+    curve = VMobject(**kwargs)
+    curve.points = pdf_outline(distribution, tuple(params), resolution, span) * [std, height, 1.0] + [mean, 0.0, 0.0]
+    return curve
@@ -0,0 +1,52 @@
+from manim import *
+import numpy as np
+
+
+class SampleCloud(PMobject):
+    """2D samples drawn on a pair of axes as one point-cloud mobject.
+
+    The data live in `samples`, an (N, 2) array in axis coordinates; the
+    scene points are mapped from it in one vectorized call, point i from
+    sample i, so transforms between clouds of the same samples move each
+    sample. With `clip` set, samples outside the axes' ranges are clamped to
+    the border and made transparent rather than dropped. `stroke_width` is the
+    size of each point in pixels, so a cloud of 100k samples renders as a
+    single pixel-array write rather than 100k Dots.
+    """
+
+    def __init__(self, samples, axes, color=BLUE, stroke_width=2, clip=True, **kwargs):
+        self.axes = axes
+        self.clip = clip
+        super().__init__(stroke_width=stroke_width, color=color, **kwargs)
+        self.set_samples(samples, color)
+
+    def set_samples(self, samples, color=None):
+        self.samples = np.asarray(samples, dtype=float).reshape(-1, 2)
+        color = self.color if color is None else color
+        x, y = self.samples[:, 0], self.samples[:, 1]
+        rgbas = np.repeat([color_to_rgba(color)], len(self.samples), axis=0)
+        if self.clip:
+            # Point i stays sample i: out-of-range samples sit on the border, transparent
+            x_min, x_max = self.axes.x_range[:2]
+            y_min, y_max = self.axes.y_range[:2]
+            clamped_x, clamped_y = np.clip(x, x_min, x_max), np.clip(y, y_min, y_max)
+            rgbas[:, 3] = (clamped_x == x) & (clamped_y == y)
+            x, y = clamped_x, clamped_y
+
+        self.reset_points()
+        if len(self.samples):
+            self.add_points(self.axes.c2p(x, y).T, rgbas=rgbas)
+        self.color = color
+        return self
+
+    def transformed(self, matrix, axes=None, color=None, **kwargs):
+        """A new cloud of the samples mapped through `matrix` (y = W x for every sample at once)."""
+        matrix = np.asarray(matrix, dtype=float)
+        return SampleCloud(
+            self.samples @ matrix.T,
+            self.axes if axes is None else axes,
+            color=self.color if color is None else color,
+            stroke_width=self.stroke_width,
+            clip=self.clip,
+            **kwargs
+        )
@@ -0,0 +1,173 @@
+from manim import *
+import numpy as np
+from functools import lru_cache
+
+from segments import line_segments
+
+
+@lru_cache(maxsize=256)
+def typeset(tex, font_size=DEFAULT_FONT_SIZE):
+    """A MathTex typeset once per string, to `become` or `copy` rather than add directly."""
+    return MathTex(tex, font_size=font_size)
+
+
+def tick_values(value_range):
+    low, high, step = value_range
+    count = int(np.floor((high - low) / step + 1e-9)) + 1
+    return np.round(low + step * np.arange(count), 10)
+
+
+def decimal_places(step):
+    places = 0
+    while places < 6 and abs(round(step, places) - step) > 1e-9:
+        places += 1
+    return places
+
+
+class RescalableAxes(VGroup):
+    """x and y axes whose y range can change without being rebuilt.
+
+    Coordinates map linearly onto an `x_length` by `y_length` box centred on
+    the origin; `c2p` works on scalars or arrays and follows the axes when
+    they are moved or scaled. Tick values are computed once per (range,
+    step) and each number label is typeset once per value, so changing the
+    y range only repositions ticks and labels. `rescale_y` animates a
+    change by interpolating the top of the range: labels in both ranges
+    slide along, the others fade out or in.
+    """
+
+    def __init__(
+        self,
+        x_range,
+        y_range,
+        x_length=12,
+        y_length=6,
+        color=BLUE,
+        include_tip=True,
+        include_numbers=True,
+        font_size=36,
+        tick_size=0.1,
+        tip_length=0.25,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.x_range = np.array(x_range, dtype=float)
+        self.y_range = np.array(y_range, dtype=float)
+        self.include_numbers = include_numbers
+        self.font_size = font_size
+        self.tick_size = tick_size
+        self.tick_sets = {}
+        self.labels = {"x": {}, "y": {}}
+
+        # Invisible corners of the coordinate box; the mapping is read from them
+        corner = np.array([-x_length / 2, -y_length / 2, 0.0])
+        self.box = VMobject(stroke_opacity=0, fill_opacity=0)
+        self.box.points = np.array([corner] * 2 + [corner + x_length * RIGHT] * 2 + [corner] * 2 + [corner + y_length * UP] * 2)
+
+        extend = tip_length if include_tip else 0
+        self.x_line = Line(self.c2p(self.x_range[0], self.x_axis_y()), self.c2p(self.x_range[1], self.x_axis_y()) + extend * RIGHT, color=color)
+        self.y_line = Line(self.c2p(self.y_axis_x(), self.y_range[0]), self.c2p(self.y_axis_x(), self.y_range[1]) + extend * UP, color=color)
+        if include_tip:
+            self.x_line.add_tip(tip_length=tip_length, tip_width=tip_length)
+            self.y_line.add_tip(tip_length=tip_length, tip_width=tip_length)
+
+        self.x_ticks = VMobject(stroke_color=color, stroke_width=2)
+        self.y_ticks = VMobject(stroke_color=color, stroke_width=2)
+        self.x_numbers = VGroup()
+        self.y_numbers = VGroup()
+        self.add(self.box, self.x_line, self.y_line, self.x_ticks, self.y_ticks, self.x_numbers, self.y_numbers)
+        self.place_ticks()
+
+    def x_axis_y(self):
+        return 0.0 if self.y_range[0] <= 0 <= self.y_range[1] else self.y_range[0]
+
+    def y_axis_x(self):
+        return 0.0 if self.x_range[0] <= 0 <= self.x_range[1] else self.x_range[0]
+
+    def c2p(self, x, y):
+        """Scene point(s) of x, y: shape (3,) for scalars, (3, N) for arrays, like Axes.c2p."""
+        origin, x_end, y_end = self.box.points[[0, 3, 7]]
+        u = (np.asarray(x, dtype=float) - self.x_range[0]) / (self.x_range[1] - self.x_range[0])
+        v = (np.asarray(y, dtype=float) - self.y_range[0]) / (self.y_range[1] - self.y_range[0])
+        u, v = np.broadcast_arrays(u, v)
+        return np.multiply.outer(x_end - origin, u) + np.multiply.outer(y_end - origin, v) + origin.reshape((3,) + (1,) * u.ndim)
+
+    coords_to_point = c2p
+
+    def get_axis_labels(self, x_label="x", y_label="y"):
+        x_tex = typeset(x_label).copy().next_to(self.x_line.get_corner(UR), UR, buff=SMALL_BUFF)
+        y_tex = typeset(y_label).copy().next_to(self.y_line.get_corner(UR), UR, buff=SMALL_BUFF)
+        return VGroup(x_tex, y_tex)
+
+    def ticks(self, value_range):
+        key = tuple(np.round(value_range, 10))
+        if key not in self.tick_sets:
+            self.tick_sets[key] = tick_values(value_range)
+        return self.tick_sets[key]
+
+    def number_label(self, axis, value, places):
+        """The label for `value` on axis "x" or "y"; each axis keeps its own, as a mobject has one position."""
+        labels = self.labels[axis]
+        key = (value, places)
+        if key not in labels:
+            labels[key] = DecimalNumber(value, num_decimal_places=places, font_size=self.font_size)
+        return labels[key]
+
+    def place_ticks(self, y_ticks=None):
+        """Lay out ticks and labels for the current ranges.
+
+        `y_ticks` is a list of (value, decimal places, opacity) for the y
+        axis; by default the ticks of the current y range, fully opaque.
+        """
+        if y_ticks is None:
+            places = decimal_places(self.y_range[2])
+            y_ticks = [(value, places, 1.0) for value in self.ticks(self.y_range)]
+        x_places = decimal_places(self.x_range[2])
+        x_ticks = [(value, x_places, 1.0) for value in self.ticks(self.x_range)]
+
+        along_y = self.c2p(0, 1) - self.c2p(0, 0)
+        along_x = self.c2p(1, 0) - self.c2p(0, 0)
+        x_normal = along_y / np.linalg.norm(along_y) * self.tick_size
+        y_normal = along_x / np.linalg.norm(along_x) * self.tick_size
+
+        for axis, ticks, tick_marks, numbers, axis_at, normal, side, other_axis in (
+            ("x", x_ticks, self.x_ticks, self.x_numbers, lambda v: self.c2p(v, self.x_axis_y()), x_normal, DOWN, self.y_axis_x()),
+            ("y", y_ticks, self.y_ticks, self.y_numbers, lambda v: self.c2p(self.y_axis_x(), v), y_normal, LEFT, self.x_axis_y()),
+        ):
+            shown = [(v, p, o) for v, p, o in ticks if o > 0 and v != other_axis]
+            centers = np.array([axis_at(v) for v, _, _ in shown]).reshape(-1, 3)
+            tick_marks.points = line_segments(centers - normal, centers + normal)
+
+            labels = []
+            if self.include_numbers:
+                for (value, places, opacity), center in zip(shown, centers):
+                    label = self.number_label(axis, value, places)
+                    label.next_to(center, side, buff=MED_SMALL_BUFF).set_opacity(opacity)
+                    labels.append(label)
+            numbers.submobjects = []
+            numbers.add(*labels)
+        return self
+
+    def set_y_range(self, y_range):
+        self.y_range = np.array(y_range, dtype=float)
+        return self.place_ticks()
+
+    def rescale_y(self, y_range, **kwargs):
+        """Animation to a new y range: the mapping slides, shared labels move, the rest fade."""
+        start, end = self.y_range.copy(), np.array(y_range, dtype=float)
+        start_places, end_places = decimal_places(start[2]), decimal_places(end[2])
+        old_values, new_values = self.ticks(start), self.ticks(end)
+
+        def update(axes, alpha):
+            axes.y_range = start + alpha * (end - start)
+            ticks = []
+            for value in np.union1d(old_values, new_values):
+                in_old, in_new = value in old_values, value in new_values
+                opacity = 1.0 if in_old and in_new else (1 - alpha if in_old else alpha)
+                if value <= axes.y_range[1] + 1e-9:
+                    ticks.append((value, start_places if in_old and not in_new else end_places, opacity))
+            axes.place_ticks(ticks)
+            if alpha == 1:
+                axes.set_y_range(end)
+
+        return UpdateFromAlphaFunc(self, update, **kwargs)
@@ -0,0 +1,79 @@
+import numpy as np
+from collections import namedtuple
+
+from varprop import DeepMLP, derivative_from_output, layer_widths
+
+# Per layer: the fraction of unit activations that are saturated, the mean
+# derivative f'(z) over all units and samples, and the mean pre-activation
+# variance, from `n_samples` unit-variance inputs
+SaturationResult = namedtuple("SaturationResult", ["widths", "saturated", "mean_derivative", "pre_activation", "n_samples"])
+
+# f'(0), the largest slope of each activation
+PEAK_DERIVATIVE = {"linear": 1.0, "tanh": 1.0, "sigmoid": 0.25, "relu": 1.0}
+
+
+def saturation_bound(activation, threshold=0.1):
+    """The |z| beyond which a unit counts as saturated: f'(z) < threshold * f'(0).
+
+    For tanh and sigmoid this is where the curve goes flat; ReLU units only
+    saturate (die) for z < 0 and linear units never do, so both return None.
+    """
+    if activation == "tanh":
+        return float(np.arctanh(np.sqrt(1 - threshold)))
+    if activation == "sigmoid":
+        s = (1 + np.sqrt(1 - threshold)) / 2
+        return float(np.log(s / (1 - s)))
+    return None
+
+
+def measure_saturation(network, n_samples=100_000, batch_size=10_000, threshold=0.1):
+    """Forward `n_samples` unit-variance inputs through a varprop.DeepMLP in batches.
+
+    A unit is saturated when f'(z) < threshold * f'(0). Only the current
+    batch is ever held, in three (batch_size, max width) buffers, so memory
+    does not grow with depth or with n_samples. Returns a SaturationResult.
+    """
+    depth = len(network.weights)
+    max_width = max(network.widths)
+    limit = threshold * PEAK_DERIVATIVE[network.activation]
+    flat = [np.empty(batch_size * max_width, dtype=network.dtype) for _ in range(3)]
+
+    saturated = np.zeros(depth)
+    derivative_sum = np.zeros(depth)
+    pre_activation = np.zeros(depth)
+    done = 0
+    # exp overflows to inf for very negative z; the sigmoid is still exactly 0 there
+    with np.errstate(over="ignore"):
+        while done < n_samples:
+            batch = min(batch_size, n_samples - done)
+            h = flat[2][: batch * network.widths[0]].reshape(batch, network.widths[0])
+            network.rng.standard_normal(h.shape, dtype=network.dtype, out=h)
+            for index in range(depth):
+                width = network.widths[index + 1]
+                h, pre_variance = network.layer(index, h, flat[index % 2][: batch * width].reshape(batch, width))
+                pre_activation[index] += pre_variance * batch
+
+                slope = flat[2][: batch * width].reshape(batch, width)
+                np.copyto(slope, h)
+                derivative_from_output(network.activation, slope)
+                derivative_sum[index] += slope.sum(dtype=np.float64)
+                saturated[index] += np.count_nonzero(slope < limit)
+            done += batch
+
+    units = n_samples * np.array(network.widths[1:], dtype=float)
+    return SaturationResult(
+        np.array(network.widths), saturated / units, derivative_sum / units, pre_activation / n_samples, n_samples
+    )
+
+
+def compare_saturation(inits, activations, depth, width, n_samples=100_000, batch_size=10_000, threshold=0.1, seed=0):
+    """measure_saturation for every (init, activation) pair on same-shaped networks.
+
+    Returns {(init, activation): SaturationResult}.
+    """
+    results = {}
+    for activation in activations:
+        for init in inits:
+            network = DeepMLP(layer_widths(depth, width), init, activation, seed=seed)
+            results[init, activation] = measure_saturation(network, n_samples, batch_size, threshold)
+    return results
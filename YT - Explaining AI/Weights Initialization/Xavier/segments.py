@@ -0,0 +1,17 @@
+import numpy as np
+
+
+def line_segments(starts, ends):
+    """Straight cubic Bezier segments from starts to ends, as points of shape (4 * N, 3).
+
+    Each segment is its two anchors with handles at the thirds. Arrays of
+    any leading shape work; segments come out in C order.
+    """
+    starts, ends = np.asarray(starts, dtype=float), np.asarray(ends, dtype=float)
+    return np.stack([starts, (2 * starts + ends) / 3, (starts + 2 * ends) / 3, ends], axis=-2).reshape(-1, 3)
+
+
+def polyline_segments(corners):
+    """Straight cubic Bezier segments joining consecutive corners, shape (4 * (N - 1), 3)."""
+    corners = np.asarray(corners, dtype=float)
+    return line_segments(corners[:-1], corners[1:])
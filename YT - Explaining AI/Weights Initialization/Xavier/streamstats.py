@@ -0,0 +1,120 @@
+import numpy as np
+
+
+class StreamingHistogram:
+    """Running moments and fixed-bin counts of a stream of values.
+
+    Values arrive in chunks of any shape through `update`; each chunk's mean
+    and squared deviations are computed exactly in float64 and folded into
+    the running totals with Chan et al.'s pairwise update (the parallel form
+    of Welford's algorithm), so memory stays constant however many values
+    are seen. Two accumulators with the same bins combine with `merge`,
+    which is how partial results from worker processes are added up.
+
+    `range` fixes the bin edges. If it is None, the edges are set from the
+    first chunk, to `span` standard deviations either side of its mean.
+    Values outside the edges are counted in `underflow` and `overflow`.
+    """
+
+    def __init__(self, bins=64, range=None, span=4.0, chunk_size=1 << 22):
+        self.n_bins = bins
+        self.span = span
+        self.chunk_size = chunk_size
+        self.edges = None if range is None else np.linspace(range[0], range[1], bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def variance(self):
+        return self.m2 / self.count if self.count else np.nan
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    def update(self, values):
+        """Add a chunk of values. Large or memory-mapped arrays are read in pieces."""
+        values = np.asarray(values)
+        if values.ndim == 0:
+            values = values.reshape(1)
+        if values.flags.c_contiguous:
+            flat = values.reshape(-1)
+            for start in range(0, flat.size, self.chunk_size):
+                self.add_chunk(flat[start:start + self.chunk_size])
+        else:
+            rows = max(1, self.chunk_size // max(1, values[0].size))
+            for start in range(0, len(values), rows):
+                self.add_chunk(values[start:start + rows].reshape(-1))
+        return self
+
+    def add_chunk(self, chunk):
+        n = chunk.size
+        if n == 0:
+            return
+        chunk_mean = chunk.sum(dtype=np.float64) / n
+        deviations = chunk.astype(np.float64) - chunk_mean
+        chunk_m2 = float(np.dot(deviations, deviations))
+        self.combine(n, chunk_mean, chunk_m2)
+        self.min = min(self.min, float(chunk.min()))
+        self.max = max(self.max, float(chunk.max()))
+
+        if self.edges is None:
+            half = self.span * np.sqrt(chunk_m2 / n) or 1.0
+            self.edges = np.linspace(chunk_mean - half, chunk_mean + half, self.n_bins + 1)
+
+        # Bin index by arithmetic on uniform edges: -1 and n_bins catch the tails
+        low, high = self.edges[0], self.edges[-1]
+        scaled = (deviations + (chunk_mean - low)) * (self.n_bins / (high - low))
+        index = np.clip(np.floor(scaled, out=scaled), -1, self.n_bins).astype(np.int64) + 1
+        totals = np.bincount(index, minlength=self.n_bins + 2)
+        self.underflow += int(totals[0])
+        self.overflow += int(totals[-1])
+        self.counts += totals[1:-1]
+
+    def combine(self, n, mean, m2):
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    def merge(self, other):
+        """Fold another accumulator with the same bins into this one."""
+        if other.count == 0:
+            return self
+        if self.edges is None:
+            self.edges = other.edges
+        elif other.edges is not None and not np.allclose(self.edges, other.edges):
+            raise ValueError("cannot merge histograms with different bins")
+        self.combine(other.count, other.mean, other.m2)
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def density(self):
+        """Counts normalized so the bars' total area is the in-range fraction of values."""
+        widths = np.diff(self.edges)
+        return self.counts / (max(self.count, 1) * widths)
+
+    def bars(self):
+        """(left, right, height) arrays of every bin, heights as a density."""
+        return self.edges[:-1], self.edges[1:], self.density()
+
+
+def layer_histograms(network, batch_size, bins=64, span=4.0, **kwargs):
+    """Measure a varprop.DeepMLP and histogram every layer's activations on the way.
+
+    Returns the VarianceResult and one StreamingHistogram per layer.
+    """
+    histograms = [StreamingHistogram(bins, span=span) for _ in network.weights]
+    result = network.measure(batch_size, on_activation=lambda layer, h: histograms[layer].update(h), **kwargs)
+    return result, histograms
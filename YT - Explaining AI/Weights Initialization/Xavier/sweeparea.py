@@ -0,0 +1,111 @@
+from manim import *
+import numpy as np
+
+from segments import polyline_segments
+
+
+class SweepArea(VGroup):
+    """The area under a pdf from the left of its range up to a moving x, with an edge line at x.
+
+    The pdf is sampled once on `resolution` points of `x_range` and its
+    outline is kept as ready-made Bezier segments in scene coordinates, so
+    `set_x` only slices the cached outline and adds the few segments that
+    close the polygon. The CDF at every sample is tabulated at the same
+    time: from `cdf` if given, otherwise by integrating the pdf from the
+    left of the range. Both are for the axes as they are when the area is
+    made.
+    """
+
+    def __init__(self, axes, pdf, x_range, cdf=None, resolution=1025, color=GREEN_C, opacity=0.5, edge_color=YELLOW, **kwargs):
+        super().__init__(**kwargs)
+        self.xs = np.linspace(x_range[0], x_range[1], resolution)
+        self.ys = np.asarray(pdf(self.xs), dtype=float)
+        if cdf is not None:
+            self.cdf_table = np.asarray(cdf(self.xs), dtype=float)
+        else:
+            steps = np.diff(self.xs) * (self.ys[1:] + self.ys[:-1]) / 2
+            self.cdf_table = np.concatenate([[0.0], np.cumsum(steps)])
+
+        self.axes = axes
+        self.outline = axes.c2p(self.xs, self.ys).T
+        self.baseline = axes.c2p(self.xs, np.zeros_like(self.xs)).T
+        self.outline_segments = polyline_segments(self.outline)
+
+        self.area = VMobject(fill_color=color, fill_opacity=opacity, stroke_width=0)
+        self.edge = VMobject(stroke_color=edge_color, stroke_width=DEFAULT_STROKE_WIDTH)
+        self.add(self.area, self.edge)
+        self.set_x(self.xs[0])
+
+    def cdf(self, x):
+        return np.interp(x, self.xs, self.cdf_table)
+
+    def edge_points(self, x):
+        """Scene points of the curve and of the baseline at x."""
+        top = np.array([np.interp(x, self.xs, self.outline[:, i]) for i in range(3)])
+        bottom = np.array([np.interp(x, self.xs, self.baseline[:, i]) for i in range(3)])
+        return top, bottom
+
+    def set_x(self, x):
+        self.x = x = float(np.clip(x, self.xs[0], self.xs[-1]))
+        top, bottom = self.edge_points(x)
+        self.edge.points = polyline_segments(np.array([bottom, top]))
+
+        # Samples strictly left of x, then the interpolated edge
+        k = int(np.searchsorted(self.xs, x, side="left"))
+        if k == 0:
+            self.area.points = np.zeros((0, 3))
+            return self
+        self.area.points = np.concatenate([
+            polyline_segments(np.array([self.baseline[0], self.outline[0]])),
+            self.outline_segments[: 4 * (k - 1)],
+            polyline_segments(np.array([self.outline[k - 1], top, bottom, self.baseline[0]])),
+        ])
+        return self
+
+    def track(self, tracker):
+        """Follow a ValueTracker: the area reaches x = tracker value on every frame."""
+        return self.add_updater(lambda area: area.set_x(tracker.get_value()))
+
+
+class GlyphNumber(VMobject):
+    """A decimal number drawn from digit glyphs typeset once per font size.
+
+    The characters 0-9, '.' and '-' are typeset together in one MathTex the
+    first time a font size is used; `set_value` just lays copies of their
+    outlines side by side, with the left end of the number at the origin
+    and its baseline at y = 0. Changing the value never runs LaTeX, however
+    many different values are shown.
+    """
+
+    CHARS = "0123456789.-"
+    _glyph_sets = {}
+
+    def __init__(self, value=0.0, num_decimal_places=2, font_size=DEFAULT_FONT_SIZE, color=WHITE, **kwargs):
+        super().__init__(fill_color=color, fill_opacity=1, stroke_width=0, **kwargs)
+        self.num_decimal_places = num_decimal_places
+        self.glyphs, self.spacing = self.glyph_set(font_size)
+        self.set_value(value)
+
+    @classmethod
+    def glyph_set(cls, font_size):
+        if font_size not in cls._glyph_sets:
+            tex = MathTex(*cls.CHARS, font_size=font_size)
+            baseline = tex[0].get_bottom()[1]
+            glyphs = {}
+            for char, part in zip(cls.CHARS, tex):
+                points = np.concatenate([mob.points for mob in part.family_members_with_points()])
+                glyphs[char] = (points - [part.get_left()[0], baseline, 0], part.width)
+            gaps = [b.get_left()[0] - a.get_right()[0] for a, b in zip(tex[:-1], tex[1:])]
+            cls._glyph_sets[font_size] = (glyphs, float(np.median(gaps)))
+        return cls._glyph_sets[font_size]
+
+    def set_value(self, value):
+        self.value = value
+        pieces = []
+        cursor = 0.0
+        for char in f"{value:.{self.num_decimal_places}f}":
+            points, width = self.glyphs[char]
+            pieces.append(points + [cursor, 0, 0])
+            cursor += width + self.spacing
+        self.points = np.concatenate(pieces)
+        return self
@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from adaptiveplot import plot_adaptive
 
 class UniformDistributionEnhanced(Scene):
     def construct(self):
@@ -183,11 +184,10 @@ class UniformDistributionEnhanced(Scene):
         
         
         def uniform_dist(x):
-            if point_a[0] <= x <= point_b[0]:
-                return height
-            return 0
+            return np.where((x >= point_a[0]) & (x <= point_b[0]), height, 0.0)
         
-        graph = axes.plot(
+        graph = plot_adaptive(
+            axes,
             uniform_dist,
             x_range=[axes.x_range[0], axes.x_range[1]],
             color=YELLOW,
@@ -195,7 +195,9 @@ class UniformDistributionEnhanced(Scene):
         )
         
         
-        graph_glow = axes.plot(
+        # Same function and range as the graph, so its samples are reused
+        graph_glow = plot_adaptive(
+            axes,
             uniform_dist,
             x_range=[axes.x_range[0], axes.x_range[1]],
             color=YELLOW,
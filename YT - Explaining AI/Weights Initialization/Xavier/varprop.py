@@ -0,0 +1,167 @@
+import numpy as np
+from collections import namedtuple
+
+from initializers import sample_weights
+
+ACTIVATIONS = ["linear", "tanh", "sigmoid", "relu"]
+
+# Per-layer variances: of the pre-activations, of the activations, and of
+# the gradient with respect to each layer's input on the way back
+VarianceResult = namedtuple("VarianceResult", ["widths", "pre_activation", "activation", "gradient"])
+
+
+def activate(name, z):
+    """Apply an activation in place."""
+    if name == "tanh":
+        np.tanh(z, out=z)
+    elif name == "sigmoid":
+        np.negative(z, out=z)
+        np.exp(z, out=z)
+        z += 1
+        np.reciprocal(z, out=z)
+    elif name == "relu":
+        np.maximum(z, 0, out=z)
+    elif name != "linear":
+        raise ValueError(f"unknown activation {name!r}, expected one of {ACTIVATIONS}")
+    return z
+
+
+def derivative_from_output(name, h):
+    """Overwrite activations h = f(z) with f'(z)."""
+    if name == "tanh":
+        np.square(h, out=h)
+        np.subtract(1, h, out=h)
+    elif name == "sigmoid":
+        h *= 1 - h
+    elif name == "relu":
+        np.greater(h, 0, out=h)
+    else:
+        h.fill(1)
+    return h
+
+
+def variance(a):
+    """Variance of all entries, accumulated in float64 without a temporary copy."""
+    flat = a.reshape(-1)
+    mean = flat.sum(dtype=np.float64) / flat.size
+    return float(np.dot(flat, flat)) / flat.size - mean * mean
+
+
+def layer_widths(depth, width, n_in=None, n_out=None):
+    """Widths of a `depth`-layer MLP with `width` units per hidden layer."""
+    widths = [width] * (depth + 1)
+    widths[0] = n_in if n_in is not None else width
+    widths[-1] = n_out if n_out is not None else width
+    return widths
+
+
+class DeepMLP:
+    """A bias-free MLP at initialization, for measuring how variance propagates.
+
+    `widths` lists the layer sizes from input to output. All weights are
+    drawn once with the named initializer in `dtype` (float32 by default).
+    """
+
+    def __init__(self, widths, init="xavier_normal", activation="tanh", dtype=np.float32, seed=None):
+        self.widths = list(widths)
+        self.init = init
+        self.activation = activation
+        self.dtype = np.dtype(dtype)
+        self.rng = np.random.default_rng(seed)
+        self.weights = [
+            sample_weights(init, fan_in, fan_out, self.rng, self.dtype)
+            for fan_in, fan_out in zip(self.widths[:-1], self.widths[1:])
+        ]
+        self._activation_buffers = None
+
+    def layer(self, index, h, out):
+        """One layer: out = f(h @ W). Returns out and the pre-activation variance."""
+        np.matmul(h, self.weights[index], out=out)
+        pre_variance = variance(out)
+        return activate(self.activation, out), pre_variance
+
+    def activation_buffers(self, batch_size):
+        """One (batch_size, width) output buffer per layer, allocated once per batch size and reused."""
+        if self._activation_buffers is None or self._activation_buffers[0] != batch_size:
+            self._activation_buffers = (batch_size, [
+                np.empty((batch_size, width), dtype=self.dtype) for width in self.widths[1:]
+            ])
+        return self._activation_buffers[1]
+
+    def measure(self, batch_size=10_000, checkpoint_every=None, on_activation=None):
+        """Forward a unit-variance batch, then backpropagate a unit-variance gradient.
+
+        By default every layer's activations are kept, in buffers reused
+        across calls, so the run is one forward and one backward pass of
+        GEMMs; memory is depth * batch_size * width values. With
+        `checkpoint_every` = k only every k-th activation is kept and the
+        backward pass recomputes each segment from its checkpoint, trading a
+        third GEMM pass for memory that grows with depth / k + k (k =
+        sqrt(depth) is the minimum). `on_activation(layer, h)` is called
+        with every layer's activations during the forward pass, for streaming
+        statistics. Returns a VarianceResult.
+        """
+        depth = len(self.weights)
+        max_width = max(self.widths)
+
+        def buffers(n):
+            flat = [np.empty(batch_size * max_width, dtype=self.dtype) for _ in range(n)]
+            return lambda i, width: flat[i][: batch_size * width].reshape(batch_size, width)
+
+        pre_activation = np.empty(depth)
+        activation = np.empty(depth)
+        gradient = np.empty(depth)
+
+        # Forward pass, into the stored buffers or through two alternating
+        # ones, copying out checkpoints
+        stored = self.activation_buffers(batch_size) if checkpoint_every is None else None
+        every = depth if stored is not None else checkpoint_every
+        x = self.rng.standard_normal((batch_size, self.widths[0]), dtype=self.dtype)
+        checkpoints = {0: x}
+        forward = buffers(2) if stored is None else None
+        h = x
+        for index in range(depth):
+            out = stored[index] if stored is not None else forward(index % 2, self.widths[index + 1])
+            h, pre_activation[index] = self.layer(index, h, out)
+            activation[index] = variance(h)
+            if on_activation is not None:
+                on_activation(index, h)
+            if stored is None and (index + 1) % every == 0 and index + 1 < depth:
+                checkpoints[index + 1] = h.copy()
+        del forward
+
+        # Backward pass, one segment at a time from the last (a single
+        # segment when every activation is stored)
+        segment = buffers(every) if stored is None else None
+        backward = buffers(2)
+        g = self.rng.standard_normal((batch_size, self.widths[-1]), dtype=self.dtype)
+        for start in reversed(range(0, depth, every)):
+            stop = min(start + every, depth)
+            if stored is not None:
+                outputs = stored[start:stop]
+            else:
+                outputs = []
+                h = checkpoints[start]
+                for index in range(start, stop):
+                    h, _ = self.layer(index, h, segment(index - start, self.widths[index + 1]))
+                    outputs.append(h)
+
+            for index in reversed(range(start, stop)):
+                g *= derivative_from_output(self.activation, outputs[index - start])
+                g = np.matmul(g, self.weights[index].T, out=backward(index % 2, self.widths[index]))
+                gradient[index] = variance(g)
+
+        return VarianceResult(np.array(self.widths), pre_activation, activation, gradient)
+
+
+def compare(inits, activations, depth, width, batch_size=10_000, seed=0, **kwargs):
+    """Measure every (init, activation) pair on same-shaped networks.
+
+    Returns {(init, activation): VarianceResult}.
+    """
+    results = {}
+    for activation in activations:
+        for init in inits:
+            network = DeepMLP(layer_widths(depth, width), init, activation, seed=seed)
+            results[init, activation] = network.measure(batch_size, **kwargs)
+    return results
@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from adaptiveplot import plot_adaptive
 
 class XavierInitializationScene(Scene):
     def construct(self):
@@ -365,10 +366,11 @@ class XavierInitializationScene(Scene):
             return (1 / (large_std * np.sqrt(2 * np.pi))) * np.exp(-(x**2) / (2 * large_std**2))
         
         # Plot distributions
-        xavier_norm_plot = axes.plot(lambda x: xavier_normal(x), color=GREEN)
-        xavier_uniform_plot = axes.plot(lambda x: xavier_uniform(x), color=BLUE)
-        small_plot = axes.plot(lambda x: small_init(x), color=RED)
-        large_plot = axes.plot(lambda x: large_init(x), color=ORANGE)
+        # Each pdf is evaluated on whole arrays, sampled densely around its peak
+        xavier_norm_plot = plot_adaptive(axes, xavier_normal, color=GREEN)
+        xavier_uniform_plot = plot_adaptive(axes, xavier_uniform, color=BLUE)
+        small_plot = plot_adaptive(axes, small_init, color=RED)
+        large_plot = plot_adaptive(axes, large_init, color=ORANGE)
         
         # Legend
         legend = VGroup(
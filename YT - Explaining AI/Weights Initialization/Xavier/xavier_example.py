@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from rescaleaxes import RescalableAxes, typeset
 
 class VarianceUniformDistributionExample(Scene):
     def construct(self):
@@ -11,37 +12,69 @@ class VarianceUniformDistributionExample(Scene):
         self.play(FadeOut(title))
 
         # Initial Axes Setup
-        axes = Axes(
+        axes = RescalableAxes(
             x_range=[-6, 6, 1],
             y_range=[0, 0.5, 0.1],  # Default y-axis range
-            axis_config={"color": BLUE, "include_tip": True, "include_numbers": True}
+            color=BLUE,
         )
 
         labels = axes.get_axis_labels(x_label="x", y_label="y")
         self.play(Create(axes), Write(labels))
 
-        # Function to generate graph based on 'a'
-        def get_graph(a_val):
-            return axes.plot(lambda x: 1/(2*a_val) if (-a_val <= x <= a_val) else 0, 
-                             color=YELLOW, 
-                             discontinuities=[-a_val, a_val], 
-                             use_smoothing=False)
-
-        # Function to generate area under the curve
-        def get_area(a_val):
-            return axes.get_area(get_graph(a_val), x_range=[-a_val, a_val], color=BLUE, opacity=0.3)
-
-        # Display dynamic text labels
-        a_value_text = MathTex(f"a = {a}").to_corner(UR)
-        left_coord_text = MathTex(f"(-{a}, 0)").next_to(axes.c2p(-a, 0), DOWN)
-        right_coord_text = MathTex(f"({a}, 0)").next_to(axes.c2p(a, 0), DOWN)
-        top_coord_text = MathTex(f"\\left(0, \\frac{{1}}{{2({a})}}\\right)").next_to(axes.c2p(0, 0.5/a), UP+RIGHT)
+        # Everything below follows this tracker and the current axes mapping
+        a_tracker = ValueTracker(a)
+
+        # Graph of the density: zero outside [-a, a], 1/(2a) inside
+        def draw_graph(graph):
+            a_val = a_tracker.get_value()
+            xs = [-6, -a_val, -a_val, a_val, a_val, 6]
+            ys = [0, 0, 1 / (2 * a_val), 1 / (2 * a_val), 0, 0]
+            points = axes.c2p(xs, ys).T
+            graph.clear_points()
+            for start, end in zip(points[0::2], points[1::2]):
+                graph.start_new_path(start)
+                graph.add_line_to(end)
+
+        # Area under the curve
+        def draw_area(area):
+            a_val = a_tracker.get_value()
+            area.set_points_as_corners(axes.c2p([-a_val, a_val, a_val, -a_val, -a_val], [0, 0, 0.5 / a_val, 0.5 / a_val, 0]).T)
+
+        # Dynamic text labels: retypeset (from cache) only when the shown value changes
+        def tracked_label(text, anchor=None, direction=DOWN):
+            label = VMobject()
+            label.text = None
+
+            def update(label):
+                shown = text(int(round(a_tracker.get_value())))
+                if shown != label.text:
+                    label.become(typeset(shown))
+                    label.text = shown
+                if anchor is not None:
+                    label.next_to(anchor(a_tracker.get_value()), direction)
+                else:
+                    label.to_corner(UR)
+
+            update(label)
+            label.add_updater(update)
+            return label
+
+        a_value_text = tracked_label(lambda n: f"a = {n}")
+        left_coord_text = tracked_label(lambda n: f"(-{n}, 0)", lambda a_val: axes.c2p(-a_val, 0), DOWN)
+        right_coord_text = tracked_label(lambda n: f"({n}, 0)", lambda a_val: axes.c2p(a_val, 0), DOWN)
+        top_coord_text = tracked_label(
+            lambda n: f"\\left(0, \\frac{{1}}{{2({n})}}\\right)", lambda a_val: axes.c2p(0, 0.5 / a_val), UP + RIGHT
+        )
 
         self.play(Write(a_value_text), Write(left_coord_text), Write(right_coord_text), Write(top_coord_text))
 
         # Initial graph and area
-        graph = get_graph(a)
-        area = get_area(a)
+        graph = VMobject(color=YELLOW)
+        area = VMobject(fill_color=BLUE, fill_opacity=0.3, stroke_width=0)
+        draw_graph(graph)
+        draw_area(area)
+        graph.add_updater(draw_graph)
+        area.add_updater(draw_area)
 
         self.play(Create(graph), FadeIn(area))
 
@@ -50,35 +83,13 @@ class VarianceUniformDistributionExample(Scene):
             nonlocal a
             a = new_a
 
-            # Adjust Y-axis dynamically when a = 1
-            new_y_range = [0, 1.2, 0.2] if a == 1 else [0, 0.5, 0.1]  
-            new_axes = Axes(
-                x_range=[-6, 6, 1],
-                y_range=new_y_range,
-                axis_config={"color": BLUE, "include_tip": True, "include_numbers": True}
-            )
-            new_labels = new_axes.get_axis_labels(x_label="x", y_label="y")
-            new_graph = get_graph(a)
-            new_area = get_area(a)
-
-            # Update text labels
-            new_a_value_text = MathTex(f"a = {a}").to_corner(UR)
-            new_left_coord_text = MathTex(f"(-{a}, 0)").next_to(axes.c2p(-a, 0), DOWN)
-            new_right_coord_text = MathTex(f"({a}, 0)").next_to(axes.c2p(a, 0), DOWN)
-            new_top_coord_text = MathTex(f"\\left(0, \\frac{{1}}{{2({a})}}\\right)").next_to(axes.c2p(0, 0.5/a), UP+RIGHT)
-
-            # Animate transformations
-            self.play(
-                Transform(axes, new_axes),
-                Transform(labels, new_labels),
-                Transform(graph, new_graph),
-                Transform(area, new_area),
-                Transform(a_value_text, new_a_value_text),
-                Transform(left_coord_text, new_left_coord_text),
-                Transform(right_coord_text, new_right_coord_text),
-                Transform(top_coord_text, new_top_coord_text),
-                run_time=3  # Increased duration to 3 seconds
-            )
+            # Adjust Y-axis dynamically when a = 1, by sliding the axes mapping
+            new_y_range = [0, 1.2, 0.2] if a == 1 else [0, 0.5, 0.1]
+            animations = [a_tracker.animate.set_value(a)]
+            if not np.allclose(new_y_range, axes.y_range):
+                animations.append(axes.rescale_y(new_y_range))
+
+            self.play(*animations, run_time=3)  # Increased duration to 3 seconds
 
         # Change 'a' values: 3 → 5 → 1 (y-axis scales) → 3 (y-axis back)
         update_a(5)
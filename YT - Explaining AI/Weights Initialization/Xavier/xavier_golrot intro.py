@@ -1,7 +1,28 @@
 from manim import *
 import numpy as np
 
+from saturation import compare_saturation, saturation_bound
+
 class XavierInitialization(Scene):
+    def saturation_zones(self, axes, activation, color):
+        # Where the activation is flat: f'(x) < 0.1 f'(0)
+        bound = saturation_bound(activation)
+        (x_min, x_max), (y_min, y_max) = axes.x_range[:2], axes.y_range[:2]
+        return VGroup(*[
+            Polygon(*[axes.c2p(x, y) for x, y in [(a, y_min), (b, y_min), (b, y_max), (a, y_max)]],
+                    stroke_width=0, fill_color=color, fill_opacity=0.2)
+            for a, b in [(x_min, -bound), (bound, x_max)]
+        ])
+
+    def saturation_caption(self, results, activation, color):
+        # Fraction of saturated units over all layers of a deep net
+        standard = results["standard", activation].saturated.mean()
+        xavier = results["xavier_normal", activation].saturated.mean()
+        return Text(
+            f"Saturated units, 10-layer {activation} net:   N(0, 1) {standard:.0%}   Xavier {xavier:.0%}",
+            font="CMU Serif", color=color
+        ).scale(0.4)
+
     def construct(self):
         
         self.camera.background_color = BLACK
@@ -79,6 +100,12 @@ class XavierInitialization(Scene):
         )
 
         
+        saturation = compare_saturation(["standard", "xavier_normal"], ["tanh", "sigmoid"], depth=10, width=256, n_samples=20_000)
+        zones = self.saturation_zones(axes, "tanh", BLUE)
+        caption = self.saturation_caption(saturation, "tanh", BLUE).next_to(axes, DOWN)
+        graph_group.add(zones, caption)
+        self.play(FadeIn(zones), Write(caption))
+        
         self.wait(2)
 
         
@@ -94,7 +121,9 @@ class XavierInitialization(Scene):
         
         self.play(
             Transform(tanh_graph, sigmoid_graph),
-            Transform(tanh_label, sigmoid_label)
+            Transform(tanh_label, sigmoid_label),
+            Transform(zones, self.saturation_zones(axes, "sigmoid", GREEN)),
+            Transform(caption, self.saturation_caption(saturation, "sigmoid", GREEN).move_to(caption))
         )
 
         
@@ -1,5 +1,8 @@
 from manim import *
 import numpy as np
+from pointcloud import SampleCloud
+from netdiagram import NetworkDiagram
+from saturation import compare_saturation
 
 class XavierInitialization(Scene):
     def construct(self):
@@ -64,26 +67,12 @@ class XavierInitialization(Scene):
     
     def create_network_layers(self):
         # Create a neural network with 3 layers
-        layers_group = VGroup()
-        n_layers = 3
-        n_neurons = [4, 5, 3]  # Number of neurons in each layer
-        
-        for i in range(n_layers):
-            layer = VGroup()
-            for j in range(n_neurons[i]):
-                neuron = Circle(radius=0.2, color=BLUE, fill_opacity=0.5)
-                neuron.move_to([3 * i - 3, j - (n_neurons[i] - 1)/2, 0])
-                layer.add(neuron)
-            layers_group.add(layer)
-        
-        # Add connections between layers
-        for i in range(n_layers - 1):
-            for n1 in layers_group[i]:
-                for n2 in layers_group[i+1]:
-                    conn = Line(n1.get_center(), n2.get_center(), stroke_opacity=0.5, stroke_width=1)
-                    layers_group.add(conn)
-        
-        return layers_group
+        return NetworkDiagram(
+            [4, 5, 3],
+            layer_spacing=3,
+            neuron_spacing=1,
+            neuron_config=dict(color=BLUE, fill_opacity=0.5),
+        )
 
     def explain_linear_transformation(self):
         # Create the section title
@@ -170,15 +159,11 @@ class XavierInitialization(Scene):
         
         # Draw random points in the input space (unit variance)
         np.random.seed(42)  # For reproducibility
-        n_points = 30
-        points_x = np.random.normal(0, 1, n_points)  # Mean 0, variance 1
-        points_y = np.random.normal(0, 1, n_points)  # Mean 0, variance 1
+        n_points = 100_000
+        samples = np.random.normal(0, 1, (n_points, n_in))  # Mean 0, variance 1
         
-        # Create dots for input space
-        input_dots = VGroup()
-        for i in range(n_points):
-            dot = Dot(input_axes.c2p(points_x[i], points_y[i]), color=BLUE, radius=0.05)
-            input_dots.add(dot)
+        # One point cloud for all samples in the input space
+        input_dots = SampleCloud(samples, input_axes, color=BLUE, stroke_width=1)
         
         self.play(Create(input_dots))
         
@@ -197,14 +182,8 @@ class XavierInitialization(Scene):
         
         # Case 1: Weights too large (variance increases)
         w_large = [[2.0, 0.0], [0.0, 2.0]]  # Scaling matrix
-        transformed_points_large = [np.dot(w_large, [points_x[i], points_y[i]]) for i in range(n_points)]
-        
-        # Create dots for output space
-        output_dots_large = VGroup()
-        for i in range(n_points):
-            dot = Dot(output_axes.c2p(transformed_points_large[i][0], transformed_points_large[i][1]), 
-                     color=RED, radius=0.05)
-            output_dots_large.add(dot)
+        # All samples go through W in one matmul
+        output_dots_large = input_dots.transformed(w_large, output_axes, color=RED)
         
         # Show transformation with large weights
         w_large_eq = MathTex(r"W \text{ with large values}", font_size=28)
@@ -212,7 +191,7 @@ class XavierInitialization(Scene):
         w_large_eq.next_to(output_axes, UP)
         
         self.play(
-            Create(output_dots_large),
+            ReplacementTransform(input_dots.copy(), output_dots_large),
             Write(w_large_eq)
         )
         self.wait(1)
@@ -223,29 +202,22 @@ class XavierInitialization(Scene):
         self.play(Write(var_large_text))
         self.wait(1.5)
         self.play(
-            FadeOut(output_dots_large),
             FadeOut(w_large_eq),
             FadeOut(var_large_text)
         )
         
         # Case 2: Weights too small (variance decreases)
         w_small = [[0.2, 0.0], [0.0, 0.2]]  # Scaling matrix
-        transformed_points_small = [np.dot(w_small, [points_x[i], points_y[i]]) for i in range(n_points)]
-        
-        # Create dots for output space
-        output_dots_small = VGroup()
-        for i in range(n_points):
-            dot = Dot(output_axes.c2p(transformed_points_small[i][0], transformed_points_small[i][1]), 
-                     color=GREEN, radius=0.05)
-            output_dots_small.add(dot)
+        output_dots_small = input_dots.transformed(w_small, output_axes, color=GREEN)
         
         # Show transformation with small weights
         w_small_eq = MathTex(r"W \text{ with small values}", font_size=28)
         w_small_eq.set_color(GREEN)
         w_small_eq.next_to(output_axes, UP)
         
+        # Morph straight from the previous output
         self.play(
-            Create(output_dots_small),
+            ReplacementTransform(output_dots_large, output_dots_small),
             Write(w_small_eq)
         )
         self.wait(1)
@@ -256,7 +228,6 @@ class XavierInitialization(Scene):
         self.play(Write(var_small_text))
         self.wait(1.5)
         self.play(
-            FadeOut(output_dots_small),
             FadeOut(w_small_eq),
             FadeOut(var_small_text)
         )
@@ -264,14 +235,7 @@ class XavierInitialization(Scene):
         # Case 3: Xavier initialization (variance preserved)
         scale = np.sqrt(2/n_in)
         w_xavier = [[scale, 0], [0, scale]]  # Xavier scaling
-        transformed_points_xavier = [np.dot(w_xavier, [points_x[i], points_y[i]]) for i in range(n_points)]
-        
-        # Create dots for output space
-        output_dots_xavier = VGroup()
-        for i in range(n_points):
-            dot = Dot(output_axes.c2p(transformed_points_xavier[i][0], transformed_points_xavier[i][1]), 
-                     color=YELLOW, radius=0.05)
-            output_dots_xavier.add(dot)
+        output_dots_xavier = input_dots.transformed(w_xavier, output_axes, color=YELLOW)
         
         # Show transformation with Xavier initialization
         w_xavier_eq = MathTex(r"W \text{ with Xavier initialization: } \sigma_w^2 = \frac{2}{n_{\text{in}}}", font_size=28)
@@ -279,7 +243,7 @@ class XavierInitialization(Scene):
         w_xavier_eq.next_to(output_axes, UP)
         
         self.play(
-            Create(output_dots_xavier),
+            ReplacementTransform(output_dots_small, output_dots_xavier),
             Write(w_xavier_eq)
         )
         self.wait(1)
@@ -401,6 +365,39 @@ class XavierInitialization(Scene):
         self.play(Write(compensation_text))
         self.wait(2)
         
+        # Measure the slope every layer actually sees: mean tanh'(z) in a deep tanh network
+        depth = 10
+        saturation = compare_saturation(["standard", "xavier_normal"], ["tanh"], depth=depth, width=256, n_samples=20_000)
+        chart = Axes(
+            x_range=[0, depth, 1],
+            y_range=[0, 1, 0.25],
+            x_length=8,
+            y_length=4,
+            axis_config={"include_tip": True}
+        )
+        chart.move_to(axes)
+        
+        curves = VGroup()
+        legend = VGroup()
+        for init, name, color in [("standard", "N(0, 1)", RED), ("xavier_normal", "Xavier", GREEN)]:
+            curves.add(chart.plot_line_graph(
+                np.arange(1, depth + 1),
+                saturation[init, "tanh"].mean_derivative,
+                line_color=color,
+                vertex_dot_style=dict(fill_color=color)
+            ))
+            legend.add(Text(f"{name}: mean tanh'(z) per layer", font_size=24, color=color))
+        legend.arrange(DOWN, aligned_edge=LEFT)
+        legend.next_to(chart.c2p(0.5, 0.5), RIGHT, buff=0)
+        
+        self.play(
+            ReplacementTransform(axes, chart),
+            FadeOut(tanh_function), FadeOut(tanh_label),
+            FadeOut(dot), FadeOut(tangent_line)
+        )
+        self.play(Create(curves), FadeIn(legend))
+        self.wait(2)
+        
         # Xavier variance formula with the factor 2
         xavier_eq = MathTex(
             r"\sigma_W^2 = \frac{2}{n_{\text{in}}} \Rightarrow \text{Var}(y) \approx \text{Var}(x)",
@@ -409,9 +406,8 @@ class XavierInitialization(Scene):
         xavier_eq.next_to(explanation, DOWN, buff=1.0)
         
         self.play(
-            FadeOut(axes), FadeOut(tanh_function), FadeOut(tanh_label),
-            FadeOut(dot), FadeOut(tangent_line), FadeOut(gradient_text),
-            FadeOut(compensation_text), FadeOut(explanation)
+            FadeOut(chart), FadeOut(curves), FadeOut(legend),
+            FadeOut(gradient_text), FadeOut(compensation_text), FadeOut(explanation)
         )
         
         self.play(Write(xavier_eq))
@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from adaptiveplot import plot_adaptive
+from netdiagram import NetworkDiagram
 
 class XavierInitialization(Scene):
     def construct(self):
@@ -32,33 +34,9 @@ class XavierInitialization(Scene):
     
     def show_problem(self):
         # Simple diagram of a neural network
-        nn_layers = 4
         neurons_per_layer = [4, 5, 5, 3]
         
-        network = VGroup()
-        neuron_groups = []
-        
-        # Create neurons
-        for i, n_neurons in enumerate(neurons_per_layer):
-            layer = VGroup()
-            for j in range(n_neurons):
-                neuron = Circle(radius=0.2, color=WHITE, fill_opacity=0)
-                neuron.move_to([i*2, (n_neurons-1)*0.5 - j*1.0, 0])
-                layer.add(neuron)
-            network.add(layer)
-            neuron_groups.append(layer)
-        
-        # Add connections between layers
-        for i in range(nn_layers - 1):
-            for neuron1 in neuron_groups[i]:
-                for neuron2 in neuron_groups[i+1]:
-                    line = Line(
-                        neuron1.get_center(), 
-                        neuron2.get_center(),
-                        stroke_width=1,
-                        stroke_opacity=0.5
-                    )
-                    network.add(line)
+        network = NetworkDiagram(neurons_per_layer, neuron_spacing=1.0)
         
         # Center the network
         network.move_to(ORIGIN)
@@ -345,21 +323,24 @@ class XavierInitialization(Scene):
             return np.exp(-((x - mu) ** 2) / (2 * sigma ** 2)) / (sigma * np.sqrt(2 * np.pi))
         
         # Xavier normal
-        xavier_curve = axes.plot(
+        xavier_curve = plot_adaptive(
+            axes,
             lambda x: normal_pdf(x, 0, xavier_std),
             color=GREEN
         )
         
         # Too small
         small_std = xavier_std * 0.3
-        small_curve = axes.plot(
+        small_curve = plot_adaptive(
+            axes,
             lambda x: normal_pdf(x, 0, small_std),
             color=RED
         )
         
         # Too large
         large_std = xavier_std * 3
-        large_curve = axes.plot(
+        large_curve = plot_adaptive(
+            axes,
             lambda x: normal_pdf(x, 0, large_std),
             color=ORANGE
         )
@@ -1,4 +1,5 @@
 from manim import *
+from netdiagram import NetworkDiagram
 
 class ZeroInitialization(Scene):
     def construct(self):
@@ -13,30 +14,21 @@ class ZeroInitialization(Scene):
             title_group.animate.scale(0.8).to_edge(UP)
         )
         
-        layer1 = VGroup(*[Circle(radius=0.3) for _ in range(3)]).arrange(DOWN, buff=0.5)
-        layer2 = VGroup(*[Circle(radius=0.3) for _ in range(4)]).arrange(DOWN, buff=0.5)
-        layer3 = VGroup(*[Circle(radius=0.3) for _ in range(2)]).arrange(DOWN, buff=0.5)
-        
-        layers = VGroup(layer1, layer2, layer3).arrange(RIGHT, buff=2)
-        
-        connections = VGroup()
-        
-        for n1 in layer1:
-            for n2 in layer2:
-                conn = Line(n1.get_right(), n2.get_left(), stroke_opacity=0.5)
-                connections.add(conn)
-        
-        for n2 in layer2:
-            for n3 in layer3:
-                conn = Line(n2.get_right(), n3.get_left(), stroke_opacity=0.5)
-                connections.add(conn)
-
-        network = VGroup(layers, connections)
+        network = NetworkDiagram(
+            [3, 4, 2],
+            layer_spacing=2.6,
+            neuron_spacing=1.1,
+            neuron_radius=0.3,
+            neuron_config=dict(color=RED),
+            edge_offset=0.3,
+            edge_width=DEFAULT_STROKE_WIDTH,
+        )
+        midpoints = network.edge_midpoints(0)
         
         self.play(Create(network))
         self.wait()
         
-        weight_label = MathTex("W = 0").next_to(connections[0].get_center(), UP)
+        weight_label = MathTex("W = 0").next_to(midpoints[0], UP)
         self.play(Write(weight_label))
         
         problem_text = Text(
@@ -55,10 +47,10 @@ class ZeroInitialization(Scene):
         ).next_to(problem_text, UP)
         
         arrows = VGroup()
-        for conn in connections[:6]:  
+        for midpoint in midpoints[:6]:
             arrow = Arrow(
-                start=conn.get_center(),
-                end=conn.get_center() + UP * 0.2,
+                start=midpoint,
+                end=midpoint + UP * 0.2,
                 color=YELLOW,
                 buff=0
             )
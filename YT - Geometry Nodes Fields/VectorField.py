@@ -1,4 +1,5 @@
 from manim import *
+from glyphlabels import GlyphLabels
 
 class VectorField3D(ThreeDScene):
     def construct(self):
@@ -8,14 +9,21 @@ class VectorField3D(ThreeDScene):
 
         axes = ThreeDAxes()
 
+        points = []
+        field_value_texts = []
         for x in range(-5, 6):
             for y in range(-5, 6):
                 for z in range(-5, 6):
                     point = np.array([x, y, z])
                     field_value = vector_field_func(point)
-                    field_value_text = Text(f"{field_value}", font_size=24).scale(0.2)
-                    field_value_text.move_to(point)
-                    self.add(field_value_text)
+                    points.append(point)
+                    field_value_texts.append(f"{field_value}")
+
+        # Each glyph is typeset once and shared; labels too small or behind the camera are skipped
+        field_values = GlyphLabels(
+            field_value_texts, points, camera=self.camera, font_size=24, scale_factor=0.2
+        )
+        self.add(field_values)
 
         self.add(axes)
 
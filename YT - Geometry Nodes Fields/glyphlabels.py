@@ -0,0 +1,142 @@
+from manim import *
+import numpy as np
+import weakref
+
+
+def box_outline(left, right, bottom, top, z):
+    """Closed rectangles as cubic Bezier points, shape (N, 16, 3)."""
+    corners = np.stack([
+        np.column_stack([left, bottom, z]),
+        np.column_stack([right, bottom, z]),
+        np.column_stack([right, top, z]),
+        np.column_stack([left, top, z]),
+    ], axis=1)
+    starts, ends = corners, np.roll(corners, -1, axis=1)
+    alphas = np.linspace(0, 1, 4)[:, np.newaxis]
+    sides = starts[:, :, np.newaxis, :] + (ends - starts)[:, :, np.newaxis, :] * alphas
+    return sides.reshape(len(left), 16, 3)
+
+
+class GlyphLabels(VMobject):
+    """Thousands of short text labels that share one typeset outline per glyph.
+
+    Every distinct character is typeset once in a monospaced font; a label is
+    just a list of (glyph, offset) instances, and all visible instances are
+    written into this one VMobject. When a ThreeDCamera is given, labels are
+    re-chosen every frame:
+      * behind the camera or off screen: skipped,
+      * smaller than `min_pixel_height`: skipped,
+      * smaller than `detail_pixel_height`: drawn as a single bar (greeked),
+    so the per-frame cost follows the glyphs actually on screen.
+    """
+
+    def __init__(
+        self,
+        texts,
+        positions,
+        camera=None,
+        font="Monospace",
+        font_size=24,
+        scale_factor=1.0,
+        min_pixel_height=1.0,
+        detail_pixel_height=4.0,
+        color=WHITE,
+        **kwargs
+    ):
+        super().__init__(fill_color=color, fill_opacity=1, stroke_width=0, **kwargs)
+        # A weak reference, so copies made by animations don't deep-copy the camera
+        self.camera_ref = weakref.ref(camera) if camera is not None else None
+        self.positions = np.array(positions, dtype=float).reshape(-1, 3)
+        self.min_pixel_height = min_pixel_height
+        self.detail_pixel_height = detail_pixel_height
+
+        texts = [str(text) for text in texts]
+        charset = sorted(set("".join(texts)) - set(" \t\n"))
+
+        # Typeset each glyph once, plus a pair of them to measure the advance
+        reference = Text("".join(charset), font=font, font_size=font_size).scale(scale_factor)
+        pair = Text(charset[0] * 2, font=font, font_size=font_size).scale(scale_factor)
+        self.advance = pair[1].get_center()[0] - pair[0].get_center()[0]
+
+        # Glyph outlines relative to their own cell, shared by every label
+        self.glyphs = {}
+        for i, (char, glyph) in enumerate(zip(charset, reference)):
+            self.glyphs[char] = glyph.get_points() - np.array([i * self.advance, 0, 0])
+        cell_center = np.mean(
+            [glyph.get_center()[0] - i * self.advance for i, glyph in enumerate(reference)]
+        )
+        self.glyph_height = reference.height
+        baseline_center = reference.get_center()[1]
+
+        # Offset of every glyph instance from its label's anchor, grouped by glyph
+        lengths = np.array([len(text) for text in texts])
+        self.half_widths = 0.5 * lengths * self.advance
+        instances = {char: ([], []) for char in charset}
+        for label, text in enumerate(texts):
+            left = -(len(text) - 1) * self.advance / 2 - cell_center
+            for column, char in enumerate(text):
+                if char in instances:
+                    instances[char][0].append(label)
+                    instances[char][1].append(left + column * self.advance)
+        self.instances = {
+            char: (np.array(labels, dtype=int), np.array(offsets))
+            for char, (labels, offsets) in instances.items()
+            if labels
+        }
+        self.baseline_offset = -baseline_center
+
+        self.update_visible()
+        if camera is not None:
+            self.add_updater(lambda mob: mob.update_visible())
+
+    def pixel_heights(self):
+        """Apparent glyph height in pixels for every label, 0 where it can't be seen."""
+        camera = self.camera_ref() if self.camera_ref is not None else None
+        if camera is None or not hasattr(camera, "get_rotation_matrix"):
+            return np.full(len(self.positions), np.inf)
+
+        focal_distance = camera.get_focal_distance()
+        zoom = camera.get_zoom()
+        points = (self.positions - camera.frame_center) @ camera.get_rotation_matrix().T
+
+        depth = focal_distance - points[:, 2]
+        in_front = depth > 1e-3
+        factor = np.where(in_front, focal_distance / np.where(in_front, depth, 1.0), 0.0) * zoom
+
+        x, y = points[:, 0] * factor, points[:, 1] * factor
+        margin = self.half_widths * factor
+        on_screen = (
+            (np.abs(x) <= camera.frame_width / 2 + margin)
+            & (np.abs(y) <= camera.frame_height / 2 + margin)
+        )
+        heights = self.glyph_height * factor * camera.pixel_height / camera.frame_height
+        return np.where(in_front & on_screen, heights, 0.0)
+
+    def update_visible(self):
+        heights = self.pixel_heights()
+        detailed = heights >= self.detail_pixel_height
+        greeked = (heights >= self.min_pixel_height) & ~detailed
+
+        pieces = []
+        for char, (labels, offsets) in self.instances.items():
+            keep = detailed[labels]
+            if not keep.any():
+                continue
+            anchors = self.positions[labels[keep]] + np.column_stack([
+                offsets[keep], np.full(keep.sum(), self.baseline_offset), np.zeros(keep.sum())
+            ])
+            outline = self.glyphs[char]
+            pieces.append((anchors[:, np.newaxis, :] + outline[np.newaxis, :, :]).reshape(-1, 3))
+
+        if greeked.any():
+            centers = self.positions[greeked]
+            half_widths = self.half_widths[greeked]
+            half_height = 0.25 * self.glyph_height
+            pieces.append(box_outline(
+                centers[:, 0] - half_widths, centers[:, 0] + half_widths,
+                centers[:, 1] - half_height, centers[:, 1] + half_height,
+                centers[:, 2],
+            ).reshape(-1, 3))
+
+        self.points = np.concatenate(pieces) if pieces else np.zeros((0, 3))
+        return self
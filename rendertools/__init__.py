@@ -0,0 +1 @@
+"""Command-line tooling for rendering the scenes in this repository."""
@@ -0,0 +1,91 @@
+"""Render every scene in the given files or folders.
+
+    python -m rendertools "YT - Explaining AI/RL/Video 1" -q h
+    python -m rendertools "YT - Explaining AI/RL/Video 1/bigvideo.py" -s OpeningHook -j 4
+    python -m rendertools "YT - Explaining AI/RL/Video 1/bigvideo4.py" --dry-run
+    python -m rendertools "YT - Explaining AI/RL/Video 1/bigvideo4.py" --profile
+"""
+import argparse
+import sys
+import time
+
+from .cache import RenderCache
+from .discover import discover
+from .dryrun import dry_run_scene, failed_dry_run, format_timelines, longest_first
+from .driver import QUALITIES, default_jobs, failed_render, format_report, render_all, render_scene
+from .profiler import failed_profile, format_profiles, profile_scene
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m rendertools", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="scene files or folders to search")
+    parser.add_argument("-s", "--scene", action="append", dest="scenes",
+                        help="only render this scene class (repeatable)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h",
+                        help="manim render quality (default: h)")
+    parser.add_argument("-j", "--jobs", type=int, default=default_jobs(),
+                        help="worker processes (default: number of cores)")
+    parser.add_argument("--force", action="store_true",
+                        help="re-render scenes even if their source hasn't changed")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="run construct() without drawing frames and report each scene's timeline")
+    parser.add_argument("--profile", action="store_true",
+                        help="render with per-call timing of interpolation, rasterization and encoding")
+    parser.add_argument("--list", action="store_true", help="list scenes without rendering")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    scenes = discover(args.paths, args.scenes)
+
+    if not scenes:
+        print("No scenes found.")
+        return 1
+
+    if args.list:
+        for scene in scenes:
+            print(f"{scene.path}:{scene.lineno}  {scene.name}")
+        return 0
+
+    options = {"quality": QUALITIES[args.quality]}
+
+    if args.dry_run:
+        print(f"Dry-running {len(scenes)} scenes on {min(args.jobs, len(scenes))} workers")
+        results = render_all(scenes, options, args.jobs, worker=dry_run_scene, failed=failed_dry_run)
+        print()
+        print(format_timelines(results))
+        return 1 if any(result.error for result in results) else 0
+
+    cache = RenderCache(options)
+
+    # A profile needs a real render, so it never reuses cached movies
+    fresh = args.force or args.profile
+    stale = scenes if fresh else [scene for scene in scenes if not cache.lookup(scene)]
+    stale = longest_first(stale)
+    if len(stale) < len(scenes):
+        print(f"Skipping {len(scenes) - len(stale)} unchanged scenes (use --force to re-render)")
+    if not stale:
+        return 0
+
+    print(f"Rendering {len(stale)} scenes on {min(args.jobs, len(stale))} workers")
+
+    start = time.perf_counter()
+    worker, failed = (profile_scene, failed_profile) if args.profile else (render_scene, failed_render)
+    results = render_all(stale, options, args.jobs, worker=worker, failed=failed)
+    for result in results:
+        cache.record(result)
+    cache.save()
+
+    print()
+    print(format_report(results, time.perf_counter() - start))
+    if args.profile:
+        print()
+        print(format_profiles(results))
+
+    return 1 if any(result.error for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
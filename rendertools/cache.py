@@ -0,0 +1,184 @@
+"""Skip scenes whose source and render config haven't changed since the last render.
+
+A scene's key is a hash of
+  * the AST of its class (formatting, comments and line numbers don't count),
+  * every module-level function, class, constant or import the class uses,
+    followed transitively, including Scene base classes in the same file,
+  * the full AST of sibling modules it imports from its own folder,
+  * the render options and the installed manim version.
+
+Keys live in media/render_cache.json next to each scene file, alongside the
+movie manim wrote for that key.
+"""
+import ast
+import hashlib
+import json
+from importlib import metadata
+from pathlib import Path
+
+from .discover import parse_file
+
+INDEX_NAME = "render_cache.json"
+
+
+def _bound_names(stmt):
+    if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [stmt.name]
+    if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+        return [(alias.asname or alias.name).split(".")[0] for alias in stmt.names]
+    targets = []
+    if isinstance(stmt, ast.Assign):
+        targets = stmt.targets
+    elif isinstance(stmt, (ast.AnnAssign, ast.AugAssign)):
+        targets = [stmt.target]
+    return [node.id for target in targets for node in ast.walk(target) if isinstance(node, ast.Name)]
+
+
+def _used_names(node):
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+
+
+def _local_imports(stmt, folder):
+    """Sibling .py files an import statement pulls in."""
+    if isinstance(stmt, ast.Import):
+        modules = [alias.name for alias in stmt.names]
+    elif isinstance(stmt, ast.ImportFrom) and not stmt.level and stmt.module:
+        modules = [stmt.module]
+    else:
+        return []
+    files = [folder / f"{module.split('.')[0]}.py" for module in modules]
+    return [file for file in files if file.is_file()]
+
+
+def _is_star_import(stmt):
+    return isinstance(stmt, ast.ImportFrom) and any(alias.name == "*" for alias in stmt.names)
+
+
+class SourceHasher:
+    """Hash Scene classes together with everything they depend on in the repo."""
+
+    def __init__(self):
+        self._trees = {}
+        self._module_digests = {}
+
+    def _tree(self, path):
+        path = Path(path).resolve()
+        if path not in self._trees:
+            self._trees[path] = parse_file(path)
+        return self._trees[path]
+
+    def module_digest(self, path, _seen=None):
+        """Hash of a whole module plus the sibling modules it imports."""
+        path = Path(path).resolve()
+        if path in self._module_digests:
+            return self._module_digests[path]
+
+        seen = _seen or set()
+        seen.add(path)
+        tree = self._tree(path)
+        digest = hashlib.sha256(ast.dump(tree).encode() if tree else path.read_bytes())
+        for stmt in tree.body if tree else []:
+            for file in _local_imports(stmt, path.parent):
+                if file.resolve() not in seen:
+                    digest.update(self.module_digest(file, seen).encode())
+
+        self._module_digests[path] = digest.hexdigest()
+        return self._module_digests[path]
+
+    def scene_digest(self, path, name):
+        path = Path(path).resolve()
+        tree = self._tree(path)
+
+        definitions = {}
+        for stmt in tree.body:
+            for bound in _bound_names(stmt):
+                definitions.setdefault(bound, []).append(stmt)
+
+        scene_node = next(node for node in definitions[name] if isinstance(node, ast.ClassDef))
+        needed = {id(scene_node): scene_node}
+        # Star imports from sibling modules can provide any name, so they always count
+        for stmt in tree.body:
+            if _is_star_import(stmt) and _local_imports(stmt, path.parent):
+                needed[id(stmt)] = stmt
+
+        pending = [scene_node]
+        while pending:
+            for used in _used_names(pending.pop()):
+                for stmt in definitions.get(used, []):
+                    if id(stmt) not in needed:
+                        needed[id(stmt)] = stmt
+                        pending.append(stmt)
+
+        digest = hashlib.sha256()
+        for stmt in sorted(needed.values(), key=lambda node: node.lineno):
+            digest.update(ast.dump(stmt).encode())
+            for file in _local_imports(stmt, path.parent):
+                digest.update(self.module_digest(file).encode())
+        return digest.hexdigest()
+
+
+def manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class RenderCache:
+    def __init__(self, options):
+        self.hasher = SourceHasher()
+        self.config_digest = json.dumps(
+            {"options": options, "manim": manim_version()}, sort_keys=True
+        )
+        self._indexes = {}
+        self._keys = {}
+
+    def _index_path(self, scene_path):
+        return Path(scene_path).resolve().parent / "media" / INDEX_NAME
+
+    def _index(self, scene_path):
+        index_path = self._index_path(scene_path)
+        if index_path not in self._indexes:
+            try:
+                self._indexes[index_path] = json.loads(index_path.read_text())
+            except (OSError, ValueError):
+                self._indexes[index_path] = {}
+        return self._indexes[index_path]
+
+    @staticmethod
+    def _entry_name(scene_path, name):
+        return f"{Path(scene_path).name}::{name}"
+
+    def key(self, scene_path, name):
+        """Computed once per run, so edits made while rendering go to the next run."""
+        cache_key = (Path(scene_path).resolve(), name)
+        if cache_key not in self._keys:
+            digest = hashlib.sha256(self.config_digest.encode())
+            digest.update(self.hasher.scene_digest(scene_path, name).encode())
+            self._keys[cache_key] = digest.hexdigest()
+        return self._keys[cache_key]
+
+    def lookup(self, scene):
+        """The cached movie for an unchanged scene, or None if it must be rendered."""
+        entry = self._index(scene.path).get(self._entry_name(scene.path, scene.name))
+        if not entry or entry["key"] != self.key(scene.path, scene.name):
+            return None
+        if not entry["movie"] or not Path(entry["movie"]).is_file():
+            return None
+        return entry["movie"]
+
+    def record(self, result):
+        if result.error:
+            return
+        index = self._index(result.path)
+        index[self._entry_name(result.path, result.name)] = {
+            "key": self.key(result.path, result.name),
+            "movie": result.movie,
+        }
+
+    def save(self):
+        for index_path, index in self._indexes.items():
+            if not index:
+                continue
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            index_path.write_text(json.dumps(index, indent=2, sort_keys=True))
@@ -0,0 +1,88 @@
+"""Find manim Scene subclasses in scene files without importing them."""
+import ast
+from collections import namedtuple
+from pathlib import Path
+
+# Base classes from manim that mark a class as renderable
+SCENE_BASES = {
+    "Scene",
+    "ThreeDScene",
+    "SpecialThreeDScene",
+    "MovingCameraScene",
+    "ZoomedScene",
+    "VectorScene",
+    "LinearTransformationScene",
+}
+
+# Folders that never contain scene sources
+SKIP_DIRS = {"media", "__pycache__", ".git", "rendertools"}
+
+SceneRef = namedtuple("SceneRef", ["path", "name", "lineno"])
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def parse_file(path):
+    """Return the parsed module, or None if the file is not valid Python."""
+    try:
+        return ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    except (SyntaxError, UnicodeDecodeError):
+        return None
+
+
+def scene_classes(tree):
+    """Top-level ClassDef nodes that derive (directly or via each other) from a Scene."""
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    scene_names = set(SCENE_BASES)
+
+    # Repeat until stable so `class B(A)` is found when A is a scene defined above or below
+    changed = True
+    while changed:
+        changed = False
+        for node in classes:
+            if node.name in scene_names:
+                continue
+            if any(_base_name(base) in scene_names for base in node.bases):
+                scene_names.add(node.name)
+                changed = True
+
+    return [node for node in classes if node.name in scene_names]
+
+
+def find_scenes(path):
+    path = Path(path)
+    tree = parse_file(path)
+    if tree is None:
+        return []
+    return [SceneRef(path, node.name, node.lineno) for node in scene_classes(tree)]
+
+
+def scene_files(path):
+    path = Path(path)
+    if path.is_file():
+        return [path]
+
+    files = []
+    for file in sorted(path.rglob("*.py")):
+        if SKIP_DIRS.intersection(file.relative_to(path).parts[:-1]):
+            continue
+        files.append(file)
+    return files
+
+
+def discover(paths, names=None):
+    """All scenes under the given files/folders, optionally filtered by class name."""
+    scenes = []
+    for path in paths:
+        for file in scene_files(path):
+            for scene in find_scenes(file):
+                if names and scene.name not in names:
+                    continue
+                scenes.append(scene)
+    return scenes
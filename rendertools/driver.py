@@ -0,0 +1,142 @@
+"""Render many scenes concurrently, one fresh process per scene."""
+import importlib.util
+import multiprocessing
+import os
+import re
+import sys
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+RenderResult = namedtuple("RenderResult", ["path", "name", "wall_time", "movie", "error"])
+
+
+def failed_render(path, name, error):
+    return RenderResult(path, name, 0.0, None, error)
+
+
+def load_scene_module(path):
+    """Import a scene file the way `manim` does, with its folder on sys.path."""
+    path = Path(path).resolve()
+    module_name = "scene_" + re.sub(r"\W", "_", path.stem)
+    sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def configure(path, options):
+    """Point manim's global config at the scene file, like running manim from its folder."""
+    from manim import config
+
+    path = Path(path).resolve()
+    config.input_file = str(path)
+    config.media_dir = str(path.parent / "media")
+    for key, value in options.items():
+        setattr(config, key, value)
+
+
+def prepare_scene(path, name, options):
+    """Set up a worker process for one scene and return its class."""
+    path = Path(path).resolve()
+    os.chdir(path.parent)
+    configure(path, options)
+    return getattr(load_scene_module(path), name)
+
+
+def render_scene(path, name, options):
+    """Worker entry point: render one scene and time it. Never raises."""
+    path = Path(path).resolve()
+    try:
+        scene_class = prepare_scene(path, name, options)
+
+        start = time.perf_counter()
+        scene = scene_class()
+        scene.render()
+        wall_time = time.perf_counter() - start
+
+        movie = scene.renderer.file_writer.movie_file_path
+        return RenderResult(path, name, wall_time, str(movie) if movie else None, None)
+    except Exception:
+        return failed_render(path, name, traceback.format_exc())
+
+
+def default_jobs():
+    return os.cpu_count() or 1
+
+
+def render_all(scenes, options, jobs=None, worker=render_scene, failed=failed_render):
+    """Render every SceneRef in a process pool and return their RenderResults.
+
+    Each worker handles a single scene and then exits, so manim's global
+    config and caches never leak from one scene into the next. If a worker
+    process dies instead of returning, `failed(path, name, error)` stands in
+    for its result, so it must build the same kind of result as `worker`.
+    """
+    if not scenes:
+        return []
+
+    jobs = min(jobs or default_jobs(), len(scenes))
+    context = multiprocessing.get_context("spawn")
+    results = []
+
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, max_tasks_per_child=1) as pool:
+        futures = {
+            pool.submit(worker, scene.path, scene.name, options): scene
+            for scene in scenes
+        }
+        for future in as_completed(futures):
+            scene = futures[future]
+            try:
+                result = future.result()
+            except Exception:
+                result = failed(scene.path, scene.name, traceback.format_exc())
+
+            status = "failed" if result.error else f"{result.wall_time:7.1f}s"
+            print(f"[{len(results) + 1}/{len(scenes)}] {result.name}: {status}", flush=True)
+            results.append(result)
+
+    return results
+
+
+def format_report(results, elapsed):
+    """Per-scene wall times, slowest first, plus how much the pool saved."""
+    rows = sorted(results, key=lambda result: result.wall_time, reverse=True)
+    width = max([len(result.name) for result in rows] + [5])
+
+    lines = [f"{'Scene':<{width}}  {'Wall':>8}  File"]
+    for result in rows:
+        wall = "FAILED" if result.error else f"{result.wall_time:7.1f}s"
+        lines.append(f"{result.name:<{width}}  {wall:>8}  {result.path.name}")
+
+    serial = sum(result.wall_time for result in results)
+    longest = rows[0].wall_time if rows else 0.0
+    lines.append("")
+    lines.append(f"Sum of scenes: {serial:.1f}s  Longest: {longest:.1f}s  Elapsed: {elapsed:.1f}s")
+    if elapsed > 0:
+        lines.append(f"Speedup over serial: {serial / elapsed:.1f}x")
+
+    lines.extend(format_errors(results))
+    return "\n".join(lines)
+
+
+def format_errors(results):
+    lines = []
+    for result in results:
+        if result.error:
+            lines.append("")
+            lines.append(f"{result.name} ({result.path}) failed:")
+            lines.append(result.error.rstrip())
+    return lines
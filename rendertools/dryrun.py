@@ -0,0 +1,153 @@
+"""Run construct() without drawing frames and record every play/wait as a timeline.
+
+Animations are skipped straight to their end state (manim's own
+skip_animations path), so mobjects end up exactly where a real render leaves
+them and later code that reads positions behaves the same. Nothing is
+rasterized or encoded.
+"""
+import json
+import sys
+import time
+import traceback
+from collections import Counter, namedtuple
+from pathlib import Path
+
+from .driver import format_errors, prepare_scene
+
+TimelineResult = namedtuple("TimelineResult", ["path", "name", "wall_time", "timeline", "error"])
+
+
+def failed_dry_run(path, name, error):
+    return TimelineResult(path, name, 0.0, None, error)
+
+
+def timeline_path(scene_path, name):
+    scene_path = Path(scene_path).resolve()
+    return scene_path.parent / "media" / "timelines" / scene_path.stem / f"{name}.json"
+
+
+def load_timeline(scene_path, name):
+    try:
+        return json.loads(timeline_path(scene_path, name).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def call_site(scene_file):
+    """file:line of the innermost frame in the scene file, i.e. where play/wait was called."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_filename == scene_file:
+            return f"{Path(scene_file).name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "<unknown>"
+
+
+def count_family(mobjects):
+    return sum(len(mobject.get_family()) for mobject in mobjects)
+
+
+class TimelineRecorder:
+    """Wraps a scene's play() and logs each call. wait() goes through play() too."""
+
+    def __init__(self, scene, scene_file):
+        self.scene = scene
+        self.scene_file = str(Path(scene_file).resolve())
+        self.events = []
+        self.time = 0.0
+        self._play = scene.play
+        scene.play = self.play
+
+    def play(self, *args, **kwargs):
+        from manim import Wait
+
+        site = call_site(self.scene_file)
+        self._play(*args, **kwargs)
+
+        animations = self.scene.animations or []
+        run_time = float(self.scene.get_run_time(animations)) if animations else 0.0
+        is_wait = bool(animations) and all(isinstance(animation, Wait) for animation in animations)
+
+        self.events.append({
+            "index": len(self.events),
+            "kind": "wait" if is_wait else "play",
+            "site": site,
+            "start": round(self.time, 6),
+            "run_time": run_time,
+            "animations": dict(Counter(type(animation).__name__ for animation in animations)),
+            "mobjects": len(self.scene.mobjects),
+            "family": count_family(self.scene.mobjects),
+        })
+        self.time += run_time
+
+    def summary(self, frame_rate):
+        waits = [event for event in self.events if event["kind"] == "wait"]
+        return {
+            "duration": self.time,
+            "frames": int(round(self.time * frame_rate)),
+            "frame_rate": frame_rate,
+            "plays": len(self.events) - len(waits),
+            "waits": len(waits),
+            "animations": sum(sum(event["animations"].values()) for event in self.events),
+            "peak_family": max([event["family"] for event in self.events] + [0]),
+        }
+
+
+def dry_run_scene(path, name, options):
+    """Worker entry point: run one scene's construct() and save its timeline. Never raises."""
+    path = Path(path).resolve()
+    try:
+        scene_class = prepare_scene(path, name, dict(options, dry_run=True))
+
+        from manim import config
+
+        start = time.perf_counter()
+        scene = scene_class(skip_animations=True)
+        recorder = TimelineRecorder(scene, path)
+        scene.render()
+        wall_time = time.perf_counter() - start
+
+        timeline = dict(scene=name, file=path.name, construct_seconds=wall_time,
+                        **recorder.summary(config.frame_rate))
+        output = timeline_path(path, name)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(dict(timeline, events=recorder.events), indent=2))
+
+        return TimelineResult(path, name, wall_time, timeline, None)
+    except Exception:
+        return failed_dry_run(path, name, traceback.format_exc())
+
+
+def format_timelines(results):
+    """Summary table, longest timeline first."""
+    rows = sorted(results, key=lambda result: result.timeline["duration"] if result.timeline else -1,
+                  reverse=True)
+    width = max([len(result.name) for result in rows] + [5])
+
+    lines = [f"{'Scene':<{width}}  {'Duration':>9}  {'Frames':>7}  {'Plays':>6}  {'Waits':>6}  "
+             f"{'Anims':>7}  {'Peak mobs':>9}  {'Dry run':>8}"]
+    for result in rows:
+        if result.error:
+            lines.append(f"{result.name:<{width}}  FAILED")
+            continue
+        timeline = result.timeline
+        lines.append(
+            f"{result.name:<{width}}  {timeline['duration']:8.1f}s  {timeline['frames']:7d}  "
+            f"{timeline['plays']:6d}  {timeline['waits']:6d}  {timeline['animations']:7d}  "
+            f"{timeline['peak_family']:9d}  {result.wall_time:7.1f}s"
+        )
+
+    lines.extend(format_errors(results))
+    return "\n".join(lines)
+
+
+def longest_first(scenes):
+    """Order scenes by their last recorded timeline so the longest start first.
+
+    Scenes without a timeline go to the front: they might be the longest.
+    """
+    def duration(scene):
+        timeline = load_timeline(scene.path, scene.name)
+        return timeline["duration"] if timeline else float("inf")
+
+    return sorted(scenes, key=duration, reverse=True)
@@ -0,0 +1,180 @@
+"""Time every play()/wait() of a real render, split into where the time goes.
+
+Per call site (file:line in the scene file) we accumulate
+  build        construct() code that ran since the previous call (mobject creation, typesetting)
+  interpolate  Scene.update_to_time: animations and updaters
+  rasterize    CairoRenderer.update_frame: drawing mobjects into the frame
+  encode       SceneFileWriter: piping frames to ffmpeg, closing partial movies, combining them
+  other        the rest of play(), e.g. compiling animations
+The wrappers sit on per-frame methods and only call perf_counter, so the
+overhead is a few microseconds per frame.
+"""
+import json
+import time
+import traceback
+from collections import namedtuple
+from pathlib import Path
+
+from .driver import format_errors, prepare_scene
+from .dryrun import call_site
+
+PHASES = ("build", "interpolate", "rasterize", "encode", "other")
+
+ProfileResult = namedtuple("ProfileResult", ["path", "name", "wall_time", "movie", "profile", "error"])
+
+
+def failed_profile(path, name, error):
+    return ProfileResult(path, name, 0.0, None, None, error)
+
+
+def profile_path(scene_path, name):
+    scene_path = Path(scene_path).resolve()
+    return scene_path.parent / "media" / "profiles" / scene_path.stem / f"{name}.json"
+
+
+class PlayProfiler:
+    def __init__(self, scene, scene_file):
+        self.scene = scene
+        self.scene_file = str(Path(scene_file).resolve())
+        self.calls = []
+        self.unattributed = dict.fromkeys(PHASES, 0.0)
+        self._current = None
+        self._depth = 0
+        self._mark = time.perf_counter()
+        self._unattributed_since_mark = 0.0
+
+        self._play = scene.play
+        scene.play = self.play
+        self._wrap(scene, "update_to_time", "interpolate")
+        self._wrap(scene.renderer, "update_frame", "rasterize")
+        for method in ("begin_animation", "write_frame", "end_animation", "finish"):
+            self._wrap(scene.renderer.file_writer, method, "encode")
+
+    def _wrap(self, owner, method, phase):
+        original = getattr(owner, method)
+
+        def timed(*args, **kwargs):
+            # Only the outermost timed call counts, so phases never overlap
+            if self._depth:
+                return original(*args, **kwargs)
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                elapsed = time.perf_counter() - start
+                if self._current is not None:
+                    self._current[phase] += elapsed
+                else:
+                    self.unattributed[phase] += elapsed
+                    self._unattributed_since_mark += elapsed
+
+        setattr(owner, method, timed)
+
+    def play(self, *args, **kwargs):
+        site = call_site(self.scene_file)
+        start = time.perf_counter()
+        record = dict.fromkeys(PHASES, 0.0)
+        record["build"] = start - self._mark - self._unattributed_since_mark
+        self._current = record
+        try:
+            self._play(*args, **kwargs)
+        finally:
+            self._current = None
+            self._mark = end = time.perf_counter()
+            self._unattributed_since_mark = 0.0
+
+        measured = record["interpolate"] + record["rasterize"] + record["encode"]
+        record["other"] = max(end - start - measured, 0.0)
+        animations = self.scene.animations or []
+        record.update(
+            site=site,
+            run_time=float(self.scene.get_run_time(animations)) if animations else 0.0,
+            total=record["build"] + end - start,
+        )
+        self.calls.append(record)
+
+    def finish(self):
+        """Account for construct() code that ran after the last play()."""
+        self.unattributed["build"] += time.perf_counter() - self._mark - self._unattributed_since_mark
+
+    def sites(self):
+        by_site = {}
+        for call in self.calls:
+            site = by_site.setdefault(call["site"], dict(site=call["site"], calls=0, run_time=0.0,
+                                                         total=0.0, **dict.fromkeys(PHASES, 0.0)))
+            site["calls"] += 1
+            for key in PHASES + ("run_time", "total"):
+                site[key] += call[key]
+        return sorted(by_site.values(), key=lambda site: site["total"], reverse=True)
+
+    def report(self, name, file, wall_time):
+        phases = dict(self.unattributed)
+        for call in self.calls:
+            for phase in PHASES:
+                phases[phase] += call[phase]
+        return {
+            "scene": name,
+            "file": file,
+            "wall_time": wall_time,
+            "phases": phases,
+            "sites": self.sites(),
+            "calls": self.calls,
+        }
+
+
+def profile_scene(path, name, options):
+    """Worker entry point: render one scene with profiling and save the report. Never raises."""
+    path = Path(path).resolve()
+    try:
+        scene_class = prepare_scene(path, name, options)
+
+        start = time.perf_counter()
+        scene = scene_class()
+        profiler = PlayProfiler(scene, path)
+        scene.render()
+        profiler.finish()
+        wall_time = time.perf_counter() - start
+
+        profile = profiler.report(name, path.name, wall_time)
+        output = profile_path(path, name)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(profile, indent=2))
+
+        movie = scene.renderer.file_writer.movie_file_path
+        del profile["calls"]
+        return ProfileResult(path, name, wall_time, str(movie) if movie else None, profile, None)
+    except Exception:
+        return failed_profile(path, name, traceback.format_exc())
+
+
+def format_profiles(results, top=15):
+    """Phase breakdown per scene, then the most expensive call sites across all scenes."""
+    rows = sorted(results, key=lambda result: result.wall_time, reverse=True)
+    width = max([len(result.name) for result in rows] + [5])
+
+    header = "".join(f"  {phase.capitalize():>11}" for phase in PHASES)
+    lines = [f"{'Scene':<{width}}  {'Wall':>8}{header}"]
+    for result in rows:
+        if result.error or result.profile is None:
+            lines.append(f"{result.name:<{width}}  {'FAILED':>8}")
+            continue
+        phases = result.profile["phases"]
+        cells = "".join(f"  {phases[phase]:10.2f}s" for phase in PHASES)
+        lines.append(f"{result.name:<{width}}  {result.wall_time:7.1f}s{cells}")
+
+    sites = [(result.name, site) for result in results if result.profile
+             for site in result.profile["sites"]]
+    sites.sort(key=lambda item: item[1]["total"], reverse=True)
+    if sites:
+        site_width = max(len(f"{name} {site['site']}") for name, site in sites[:top])
+        lines.append("")
+        lines.append(f"{'Call site':<{site_width}}  {'Calls':>6}  {'Total':>9}{header}")
+        for name, site in sites[:top]:
+            cells = "".join(f"  {site[phase]:10.2f}s" for phase in PHASES)
+            lines.append(f"{name + ' ' + site['site']:<{site_width}}  {site['calls']:6d}  "
+                         f"{site['total']:8.2f}s{cells}")
+
+    lines.extend(format_errors(results))
+    return "\n".join(lines)